@@ -0,0 +1,69 @@
+# File: backend/app/api/v1/dependencies.py
+# Path: backend/app/api/v1/dependencies.py
+
+"""
+Shared FastAPI dependencies for the API v1 routes.
+"""
+
+from app.services.data_service import DataService
+from app.services.job_service import JobService
+from app.services.logistics_service import LogisticsService
+from app.services.state import AppState
+from fastapi import Depends, FastAPI, Request
+
+from config import get_data_path, settings
+
+# MARK: ━━━ Application State ━━━
+
+
+def init_app_state(app: FastAPI) -> AppState:
+    """Attach the application state to the app if not yet present."""
+    state = getattr(app.state, "services", None)
+    if state is None:
+        state = AppState(
+            data_dir=get_data_path(),
+            debug=settings.debug,
+            csv_chunk_size=settings.csv_chunk_size,
+            parse_cache_dir=settings.parse_cache_dir,
+            ingestion_workers=settings.ingestion_workers,
+            blocking_workers=settings.blocking_workers,
+            validation_workers=settings.validation_workers,
+            trusted_sources=settings.trusted_sources,
+            trust_sample_rate=settings.trust_sample_rate,
+            quarantine_dir=settings.quarantine_dir,
+            csv_engine=settings.csv_engine,
+            file_workers=settings.file_workers,
+            trace_pipeline_memory=settings.trace_pipeline_memory,
+            watch_interval=settings.watch_interval_seconds,
+            watch_debounce=settings.watch_debounce_seconds,
+        )
+        app.state.services = state
+    return state
+
+
+def get_app_state(request: Request) -> AppState:
+    """Get the application-scoped service state."""
+    return init_app_state(request.app)
+
+
+# MARK: ━━━ Service Dependencies ━━━
+
+
+def get_logistics_service(
+    state: AppState = Depends(get_app_state),
+) -> LogisticsService:
+    """Get the shared logistics service instance."""
+    return state.logistics_service
+
+
+def get_data_service(state: AppState = Depends(get_app_state)) -> DataService:
+    """Get the shared data service instance."""
+    return state.data_service
+
+
+def get_job_service(state: AppState = Depends(get_app_state)) -> JobService:
+    """Get the shared background job service instance."""
+    return state.job_service
+
+
+# EOF
@@ -6,46 +6,46 @@ Carts API routes for the logistics management system.
 """
 
 import logging
-from fastapi import APIRouter, HTTPException, status, Request
+from fastapi import APIRouter, Depends, HTTPException, status, Request
 
 from app.models import CartResponse, BaseResponse
 from app.services.logistics_service import LogisticsService
+from ..dependencies import get_logistics_service
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
-def get_logistics_service() -> LogisticsService:
-    """Get logistics service instance."""
-    return LogisticsService()
-
-
 @router.get("/", response_model=BaseResponse)
-async def list_carts(request: Request):
+async def list_carts(
+    request: Request,
+    service: LogisticsService = Depends(get_logistics_service),
+):
     """Get all carts."""
     logger.info("📥 API v1 - GET /carts")
 
     try:
-        service = get_logistics_service()
-        carts = service.carts
-
-        cart_responses = []
-        for cart in carts:
-            cart_responses.append(
-                CartResponse(
-                    cart_id=cart.cart_id,
-                    capacity=cart.capacity,
-                    current_weight=cart.current_weight,
-                    is_available=cart.is_available,
-                    assigned_picker=cart.assigned_picker,
+        # Worker threads commit uploads; read under the service lock
+        with service.lock:
+            carts = service.carts
+
+            cart_responses = []
+            for cart in carts:
+                cart_responses.append(
+                    CartResponse(
+                        cart_id=cart.cart_id,
+                        capacity=cart.capacity,
+                        current_weight=cart.current_weight,
+                        is_available=cart.is_available,
+                        assigned_picker=cart.assigned_picker,
+                    )
                 )
-            )
 
-        return BaseResponse(
-            status="success",
-            message="Carts retrieved successfully",
-            data={"carts": [cart.dict() for cart in cart_responses]},
-        )
+            return BaseResponse(
+                status="success",
+                message="Carts retrieved successfully",
+                data={"carts": [cart.dict() for cart in cart_responses]},
+            )
 
     except Exception as e:
         logger.error("❌ Error getting carts: %s", str(e))
@@ -5,28 +5,490 @@
 Data import API routes for the logistics management system.
 """
 
+import asyncio
 import logging
-import tempfile
 import os
-from fastapi import APIRouter, Request, UploadFile, File
-from fastapi.responses import JSONResponse
+import tempfile
+from itertools import chain, islice
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+from fastapi import APIRouter, Depends, Request, UploadFile, File
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, JSONResponse, Response
 
-from app.models import BaseResponse, ErrorResponse
+from app.models import (
+    BaseResponse,
+    ErrorResponse,
+    IngestionJob,
+    JobResponse,
+    PickingOrder,
+    StatusEnum,
+)
+from app.services.article_delta import ArticleDelta, LineKey
 from app.services.data_service import DataService
+from app.services.ingestion_pipeline import (
+    Batches,
+    IngestionPipeline,
+    SourceStage,
+    Stage,
+)
+from app.services.job_service import JobService
 from app.services.logistics_service import LogisticsService
+from app.services.quarantine import Quarantine
+from app.services.stream_reader import (
+    ChunkQueueReader,
+    HashingReader,
+    ProgressReader,
+)
+from app.services.state import AppState
+from app.services.upload_ledger import copy_with_digest, upload_key
+from ..dependencies import (
+    get_app_state,
+    get_data_service,
+    get_job_service,
+    get_logistics_service,
+)
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# File names accepted by the CSV upload: plain CSV files and archives
+CSV_UPLOAD_SUFFIXES = (".csv", ".csv.gz", ".zip")
+
+# Source name of a streamed CSV upload sent without a file name
+DEFAULT_CSV_SOURCE = "upload.csv"
+
+# Header with the SHA-256 of a streamed body, sent by clients that want
+# a repeated upload answered before its body is parsed
+DIGEST_HEADER = "X-Content-SHA256"
+
+# MARK: ━━━ CSV Upload Helpers ━━━
+
+# Pipeline, picking orders and parse statistics of a full upload
+PipelineUpload = Tuple[IngestionPipeline, List[PickingOrder], Dict[str, int]]
+
+ParsedUpload = Union[ArticleDelta, PipelineUpload]
+
+
+def _parse_csv_upload(
+    data_service: DataService,
+    source: Any,
+    incremental: bool,
+    baseline: Mapping[LineKey, int],
+    delimiter: str,
+    skip_initial_space: bool,
+    quarantine: Quarantine,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> ParsedUpload:
+    """Parse an uploaded CSV stream without touching the logistics state.
+
+    Returns the export delta in incremental mode, otherwise the
+    ingestion pipeline, the picking orders it made and the parse
+    statistics; the pipeline's commit stage is still to run. Rejected
+    rows are collected in ``quarantine`` and written as a report.
+    """
+    if incremental:
+        delta = data_service.diff_csv_export(
+            source,
+            baseline,
+            delimiter=delimiter,
+            skip_initial_space=skip_initial_space,
+            progress=progress,
+            quarantine=quarantine,
+        )
+        data_service.report_quarantine(quarantine)
+        return delta
+
+    # Stream, clean and validate the CSV data chunk by chunk
+    parse_stats: Dict[str, int] = {}
+    pipeline = data_service.csv_pipeline(
+        delimiter,
+        skip_initial_space,
+        stats=parse_stats,
+        progress=progress,
+        quarantine=quarantine,
+    )
+    orders = pipeline.run(source)
+    data_service.report_quarantine(quarantine)
+    return pipeline, orders, parse_stats
+
+
+def _parse_archive_upload(
+    data_service: DataService,
+    path: str,
+    delimiter: str,
+    skip_initial_space: bool,
+    quarantine: Quarantine,
+) -> PipelineUpload:
+    """Parse an uploaded zip or gzip archive of data files.
+
+    The archive members are parsed as separate files and merged into
+    projects by ``projekt_nr`` (see ``DataService.parse_sources``), all
+    in the pipeline's parse stage.
+    """
+    parse_stats: Dict[str, int] = {}
+
+    def parse(archive: str) -> Batches:
+        yield data_service.parse_sources(
+            archive,
+            stats=parse_stats,
+            quarantine=quarantine,
+            delimiter=delimiter,
+            skip_initial_space=skip_initial_space,
+        )
+
+    pipeline = IngestionPipeline(
+        "archive",
+        [
+            SourceStage("parse", parse),
+            Stage("prioritize", data_service.create_picking_orders),
+        ],
+    )
+    orders = pipeline.run(path)
+    data_service.report_quarantine(quarantine)
+    return pipeline, orders, parse_stats
+
+
+def _commit_stage(logistics_service: LogisticsService) -> Stage:
+    """Get the pipeline stage adding orders to the logistics state.
+
+    Orders already loaded are merged; the stage passes on the new ones.
+    """
+    return Stage(
+        "commit",
+        lambda orders: [
+            order for order in orders if logistics_service.add_order(order)
+        ],
+    )
+
+
+def _commit_orders(
+    pipeline: IngestionPipeline,
+    orders: List[PickingOrder],
+    logistics_service: LogisticsService,
+) -> int:
+    """Run the commit stage of a pipeline; returns the new orders.
+
+    The service lock is held for the whole stage, so readers see the
+    upload either not at all or in full.
+    """
+    with logistics_service.lock:
+        created = pipeline.run_stage(_commit_stage(logistics_service), orders)
+    pipeline.log_summary()
+    return len(created)
+
+
+def _apply_csv_upload(
+    filename: Optional[str],
+    parsed: ParsedUpload,
+    quarantine: Dict[str, Any],
+    data_service: DataService,
+    logistics_service: LogisticsService,
+) -> BaseResponse:
+    """Add parsed upload data to the logistics state."""
+    if isinstance(parsed, ArticleDelta):
+        # Apply only the changes against this file's loaded lines
+        with logistics_service.lock:
+            projects = logistics_service.apply_source_delta(
+                filename or DEFAULT_CSV_SOURCE, parsed
+            )
+            orders = data_service.create_picking_orders(projects)
+            for order in orders:
+                logistics_service.add_order(order)
+
+        return BaseResponse(
+            status="success",
+            message="CSV export applied incrementally",
+            data={
+                "filename": filename,
+                **parsed.summary(),
+                "orders_created": len(orders),
+                "quarantine": quarantine,
+            },
+        )
+
+    pipeline, orders, parse_stats = parsed
+
+    # Add orders to logistics service; loaded orders are merged
+    created = _commit_orders(pipeline, orders, logistics_service)
+
+    # Prepare response data
+    response_data = {
+        "filename": filename,
+        "total_records": parse_stats["rows_read"],
+        "articles_parsed": parse_stats["articles_parsed"],
+        "duplicate_rows": parse_stats["duplicate_rows"],
+        "projects_created": len(orders),
+        "orders_created": created,
+        "orders_updated": len(orders) - created,
+        "quarantine": quarantine,
+        "pipeline": pipeline.summary(),
+        "sample_articles": [
+            {
+                "artikel": article.artikel,
+                "artikel_bezeichnung": article.artikel_bezeichnung,
+                "menge": article.menge,
+                "lagerplatz": article.lagerplatz,
+                "status": article.status.value,
+            }
+            # First 5 articles as sample
+            for article in islice(
+                chain.from_iterable(o.project.articles for o in orders), 5
+            )
+        ],
+    }
+
+    return BaseResponse(
+        status="success",
+        message="CSV data uploaded and processed successfully",
+        data=response_data,
+    )
+
+
+def _quarantine_data(
+    request: Request, quarantine: Quarantine
+) -> Dict[str, Any]:
+    """Get the rejected-row counts and report link of an upload."""
+    data = quarantine.summary()
+    data["download_url"] = None
+    if quarantine.report_id:
+        data["download_url"] = request.app.url_path_for(
+            "download_quarantine_report", report_id=quarantine.report_id
+        )
+    return data
+
+
+def _upload_error(e: Exception) -> JSONResponse:
+    """Build the error response for a failed CSV upload."""
+    logger.error("❌ Error uploading CSV data: %s", str(e))
+    return JSONResponse(
+        status_code=500,
+        content=ErrorResponse(
+            status="error",
+            message="Failed to process CSV file",
+            details=str(e),
+            code=500,
+        ).dict(),
+    )
+
+
+def _parse_default_data(
+    data_service: DataService,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> Tuple[int, IngestionPipeline, List[PickingOrder]]:
+    """Parse the default data files without touching the logistics state.
+
+    The projects are read through the parsed-data cache, so the read
+    stage covers parsing and validation unless they are cached.
+    """
+    articles = data_service.parse_csv_articles("orig.csv", progress=progress)
+
+    def read(filename: str) -> Batches:
+        yield data_service.parse_json_projects(filename)
+
+    pipeline = IngestionPipeline(
+        "default",
+        [SourceStage("read", read), *data_service.order_stages()],
+    )
+    orders = pipeline.run("project.json")
+    return len(articles), pipeline, orders
+
+
+def _apply_default_data(
+    parsed: Tuple[int, IngestionPipeline, List[PickingOrder]],
+    logistics_service: LogisticsService,
+) -> Dict[str, Any]:
+    """Add the orders of the parsed default data."""
+    articles_loaded, pipeline, orders = parsed
+
+    # Add orders to logistics service; loaded orders are merged
+    created = _commit_orders(pipeline, orders, logistics_service)
+
+    # Create some sample pickers and carts
+    sample_pickers = [
+        {"picker_id": "P001", "name": "John Doe", "employee_number": "EMP001"},
+        {"picker_id": "P002", "name": "Jane Smith", "employee_number": "EMP002"},
+        {"picker_id": "P003", "name": "Bob Wilson", "employee_number": "EMP003"},
+    ]
+
+    sample_carts = [
+        {"cart_id": "C001", "capacity": 100.0},
+        {"cart_id": "C002", "capacity": 150.0},
+        {"cart_id": "C003", "capacity": 200.0},
+    ]
+
+    # Add sample pickers and carts (this would need to be implemented in LogisticsService)
+
+    return {
+        "articles_loaded": articles_loaded,
+        "projects_loaded": len(orders),
+        "orders_created": created,
+        "orders_updated": len(orders) - created,
+        "pickers_created": len(sample_pickers),
+        "carts_created": len(sample_carts),
+        "pipeline": pipeline.summary(),
+    }
 
-def get_data_service() -> DataService:
-    """Get data service instance."""
-    return DataService()
 
+# MARK: ━━━ JSON Upload Helpers ━━━
 
-def get_logistics_service() -> LogisticsService:
-    """Get logistics service instance."""
-    return LogisticsService()
+
+def _parse_json_upload(
+    data_service: DataService, source: Any, quarantine: Quarantine
+) -> Tuple[IngestionPipeline, List[PickingOrder]]:
+    """Parse an uploaded JSON stream into picking orders.
+
+    Projects are decoded and validated in small batches, so the raw
+    upload is never held in memory as a whole. Returns the pipeline,
+    whose commit stage is still to run, and its orders.
+    """
+    pipeline = data_service.json_pipeline(quarantine=quarantine)
+    orders = pipeline.run(source)
+    data_service.report_quarantine(quarantine)
+    return pipeline, orders
+
+
+def _apply_json_upload(
+    filename: Optional[str],
+    parsed: Tuple[IngestionPipeline, List[PickingOrder]],
+    quarantine: Dict[str, Any],
+    logistics_service: LogisticsService,
+) -> BaseResponse:
+    """Add the orders of a parsed JSON upload to the logistics state."""
+    pipeline, orders = parsed
+    created = _commit_orders(pipeline, orders, logistics_service)
+
+    return BaseResponse(
+        status="success",
+        message="JSON data uploaded and processed successfully",
+        data={
+            "filename": filename,
+            "projects_created": len(orders),
+            "articles_parsed": sum(
+                order.project.total_articles for order in orders
+            ),
+            "orders_created": created,
+            "orders_updated": len(orders) - created,
+            "quarantine": quarantine,
+            "pipeline": pipeline.summary(),
+        },
+    )
+
+
+# MARK: ━━━ Repeated Upload Helpers ━━━
+
+
+def _record_upload(
+    state: AppState, key: Optional[str], response: BaseResponse
+) -> BaseResponse:
+    """Remember the result of an ingested upload under its content key."""
+    if key is not None and response.data is not None:
+        response.data["repeated"] = False
+        state.uploads.record(key, response.data)
+    return response
+
+
+def _repeated_upload(
+    filename: Optional[str], previous: Dict[str, Any]
+) -> BaseResponse:
+    """Build the response for an upload whose content was ingested before.
+
+    The result of the first ingestion is returned; nothing is parsed or
+    added to the logistics state.
+    """
+    logger.info(f"Upload {filename} was already ingested; skipping it")
+    return BaseResponse(
+        status="success",
+        message="Upload already ingested; returning the previous result",
+        data={**previous, "repeated": True},
+    )
+
+
+def _declared_digest(request: Request) -> Optional[str]:
+    """Get the client-supplied SHA-256 of a streamed body, if any."""
+    digest = request.headers.get(DIGEST_HEADER)
+    return digest.strip().lower() if digest else None
+
+
+def _digest_mismatch(declared: str, digest: str) -> JSONResponse:
+    """Build the error response for a body that does not match its digest."""
+    logger.error(f"❌ Upload digest {declared} does not match body {digest}")
+    return JSONResponse(
+        status_code=400,
+        content=ErrorResponse(
+            status="error",
+            message="Upload digest mismatch",
+            details=f"{DIGEST_HEADER} does not match the request body",
+            code=400,
+        ).dict(),
+    )
+
+
+# MARK: ━━━ Background Job Helpers ━━━
+
+
+def _job_progress(job: IngestionJob) -> Callable[[int, int], None]:
+    """Get a parse progress callback that updates a job."""
+
+    def progress(rows_read: int, rows_rejected: int) -> None:
+        job.rows_processed = rows_read
+        job.rows_rejected = rows_rejected
+
+    return progress
+
+
+def _job_data(job: IngestionJob) -> Dict[str, Any]:
+    """Get the JSON-ready response data of a job."""
+    return JobResponse(
+        **job.model_dump(), eta_seconds=job.eta_seconds
+    ).model_dump(mode="json")
+
+
+def _job_accepted(job: IngestionJob, message: str) -> JSONResponse:
+    """Build the 202 response for a started job."""
+    return JSONResponse(
+        status_code=202,
+        content=BaseResponse(
+            status="success", message=message, data=_job_data(job)
+        ).model_dump(),
+    )
+
+
+def _spool_upload(upload: BinaryIO) -> Tuple[BinaryIO, int, str]:
+    """Copy an upload to a temporary file that outlives the request.
+
+    Returns the file, rewound, its size and the SHA-256 of its content.
+    """
+    spool = tempfile.TemporaryFile()
+    digest = copy_with_digest(upload, spool)
+    size = spool.tell()
+    spool.seek(0)
+    return spool, size, digest
+
+
+def _spool_archive(upload: BinaryIO, filename: str) -> Tuple[str, str]:
+    """Copy an uploaded archive to a named temporary file.
+
+    The file keeps the archive suffix, which selects how it is read.
+    Returns its path and the SHA-256 of its content.
+    """
+    suffix = ".zip" if filename.lower().endswith(".zip") else ".csv.gz"
+    fd, path = tempfile.mkstemp(suffix=suffix)
+    with os.fdopen(fd, "wb") as spool:
+        digest = copy_with_digest(upload, spool)
+    return path, digest
+
+
+# MARK: ━━━ Routes ━━━
 
 
 @router.post("/upload/csv", response_model=BaseResponse)
@@ -35,92 +497,355 @@ async def upload_csv_data(
     file: UploadFile = File(..., description="CSV file to upload"),
     delimiter: str = "|",
     skip_initial_space: bool = True,
-):
-    """Upload and process CSV data file."""
+    incremental: bool = False,
+    background: bool = False,
+    data_service: DataService = Depends(get_data_service),
+    logistics_service: LogisticsService = Depends(get_logistics_service),
+    job_service: JobService = Depends(get_job_service),
+    state: AppState = Depends(get_app_state),
+) -> Union[BaseResponse, JSONResponse]:
+    """Upload and process CSV data file.
+
+    Starlette spools the whole multipart form to a temporary file before
+    this handler runs, so parsing starts only once the upload has been
+    received; use ``/upload/csv/stream`` to parse while the body is
+    still arriving. The spooled file is parsed chunk by chunk, so the
+    parse itself keeps memory flat. A zip archive of CSV and JSON files or a gzip-compressed CSV
+    file is decompressed as a stream; the files are parsed in the file
+    worker pool, if configured, and merged by project number. With
+    ``incremental``, the file is treated as a re-export: only the lines
+    that changed since the last incremental upload of the same file
+    name are applied, and picking progress on existing lines is kept;
+    lines loaded from other files are left alone. With ``background``,
+    the request returns a job ID right away and the upload is processed
+    by a worker.
+    """
     logger.info("📥 API v1 - POST /data/upload/csv")
 
     # Validate file type
-    if not file.filename.lower().endswith('.csv'):
+    upload_name = file.filename or DEFAULT_CSV_SOURCE
+    filename = upload_name.lower()
+    if not filename.endswith(CSV_UPLOAD_SUFFIXES):
         return JSONResponse(
             status_code=400,
             content=ErrorResponse(
                 status="error",
                 message="Invalid file type",
-                details="Only CSV files are supported",
+                details="Only CSV files and zip or gzip archives are supported",
                 code=400,
             ).dict(),
         )
 
+    archive = not filename.endswith(".csv")
+    if archive and incremental:
+        return JSONResponse(
+            status_code=400,
+            content=ErrorResponse(
+                status="error",
+                message="Invalid file type",
+                details="Incremental uploads must be plain CSV files",
+                code=400,
+            ).dict(),
+        )
+
+    # Diffs run off the event loop against a copy of the file's lines
+    baseline = (
+        logistics_service.snapshot_source_baseline(upload_name)
+        if incremental
+        else {}
+    )
+
+    # Uploads are hashed while they are copied to a spool file of their
+    # own, which archives and background jobs read from. Synchronous
+    # incremental uploads are parsed from the form file directly.
+    source: Any = file.file
+    if archive:
+        path, digest = await run_in_threadpool(
+            _spool_archive, file.file, upload_name
+        )
+    elif background or not incremental:
+        spool, size, digest = await run_in_threadpool(_spool_upload, file.file)
+        source = spool
+
+    # Re-uploads of an ingested file return the first result. An
+    # incremental upload is diffed instead, as the baseline may differ.
+    key = None
+    if not incremental:
+        key = upload_key(digest, "csv", delimiter, skip_initial_space)
+        previous = state.uploads.get(key)
+        if previous is not None:
+            if archive:
+                os.unlink(path)
+            else:
+                source.close()
+            return _repeated_upload(upload_name, previous)
+
+    quarantine = Quarantine(upload_name)
+
+    if archive:
+
+        def parse_archive() -> PipelineUpload:
+            try:
+                return _parse_archive_upload(
+                    data_service,
+                    path,
+                    delimiter,
+                    skip_initial_space,
+                    quarantine,
+                )
+            finally:
+                os.unlink(path)
+
+    if background:
+        if archive:
+
+            def work(job: IngestionJob) -> Callable[[], Optional[Dict[str, Any]]]:
+                parsed = parse_archive()
+                job.rows_processed = parsed[2]["rows_read"]
+                job.rows_rejected = parsed[2]["rows_rejected"]
+                return lambda: _record_upload(
+                    state,
+                    key,
+                    _apply_csv_upload(
+                        upload_name,
+                        parsed,
+                        _quarantine_data(request, quarantine),
+                        data_service,
+                        logistics_service,
+                    ),
+                ).data
+
+        else:
+
+            def work(job: IngestionJob) -> Callable[[], Optional[Dict[str, Any]]]:
+                job.total_bytes = size
+                source = ProgressReader(
+                    spool, lambda n: setattr(job, "bytes_processed", n)
+                )
+                try:
+                    parsed = _parse_csv_upload(
+                        data_service,
+                        source,
+                        incremental,
+                        baseline,
+                        delimiter,
+                        skip_initial_space,
+                        quarantine,
+                        _job_progress(job),
+                    )
+                finally:
+                    spool.close()
+                return lambda: _record_upload(
+                    state,
+                    key,
+                    _apply_csv_upload(
+                        upload_name,
+                        parsed,
+                        _quarantine_data(request, quarantine),
+                        data_service,
+                        logistics_service,
+                    ),
+                ).data
+
+        job = job_service.submit("upload_csv", work)
+        return _job_accepted(job, "CSV upload accepted for processing")
+
+    parsed: ParsedUpload
+    try:
+        if archive:
+            parsed = await state.run_blocking(parse_archive)
+        else:
+            try:
+                parsed = await state.run_blocking(
+                    _parse_csv_upload,
+                    data_service,
+                    source,
+                    incremental,
+                    baseline,
+                    delimiter,
+                    skip_initial_space,
+                    quarantine,
+                )
+            finally:
+                if source is not file.file:
+                    source.close()
+        # Orders are committed off the loop; the service is lock-guarded
+        response = await state.run_blocking(
+            _apply_csv_upload,
+            upload_name,
+            parsed,
+            _quarantine_data(request, quarantine),
+            data_service,
+            logistics_service,
+        )
+        return _record_upload(state, key, response)
+
+    except Exception as e:
+        return _upload_error(e)
+
+
+@router.post("/upload/csv/stream", response_model=BaseResponse)
+async def upload_csv_stream(
+    request: Request,
+    filename: Optional[str] = None,
+    delimiter: str = "|",
+    skip_initial_space: bool = True,
+    incremental: bool = False,
+    data_service: DataService = Depends(get_data_service),
+    logistics_service: LogisticsService = Depends(get_logistics_service),
+    state: AppState = Depends(get_app_state),
+) -> Union[BaseResponse, JSONResponse]:
+    """Upload CSV data sent as the raw request body.
+
+    Parsing runs in a worker thread while the body is still being
+    received; a bounded chunk queue keeps memory flat for large files.
+    The body is hashed as it is parsed; if the same content was
+    ingested before, the parse result is dropped and the first result
+    returned, so a repeated upload adds no orders. Clients that send
+    the body's SHA-256 in the ``X-Content-SHA256`` header get a repeated
+    upload answered before anything is parsed; a body that does not
+    match its header is refused.
+    """
+    logger.info("📥 API v1 - POST /data/upload/csv/stream")
+
+    declared = _declared_digest(request)
+    if declared is not None and not incremental:
+        previous = state.uploads.get(
+            upload_key(declared, "csv", delimiter, skip_initial_space)
+        )
+        if previous is not None:
+            return _repeated_upload(filename, previous)
+
+    reader = ChunkQueueReader()
+    hashing = HashingReader(reader)
+    quarantine = Quarantine(filename or DEFAULT_CSV_SOURCE)
+    baseline = (
+        logistics_service.snapshot_source_baseline(
+            filename or DEFAULT_CSV_SOURCE
+        )
+        if incremental
+        else {}
+    )
+
+    def parse() -> ParsedUpload:
+        try:
+            parsed = _parse_csv_upload(
+                data_service,
+                hashing,
+                incremental,
+                baseline,
+                delimiter,
+                skip_initial_space,
+                quarantine,
+            )
+            hashing.read()
+            return parsed
+        finally:
+            reader.close()
+
+    parsing = asyncio.get_running_loop().run_in_executor(
+        state.executor, parse
+    )
     try:
-        # Create temporary file to store uploaded content
-        with tempfile.NamedTemporaryFile(
-            mode="wb", delete=False, suffix=".csv"
-        ) as temp_file:
-            content = await file.read()
-            temp_file.write(content)
-            temp_file_path = temp_file.name
-
-        # Process the uploaded file
-        data_service = get_data_service()
-        
-        # Load and parse the CSV data
-        raw_data = data_service._load_csv_from_path(
-            temp_file_path, delimiter, skip_initial_space
-        )
-        articles = data_service._parse_csv_articles_from_data(raw_data)
-        
-        # Create picking orders from the data
-        projects = data_service._create_projects_from_articles(articles)
-        orders = data_service.create_picking_orders(projects)
-        
-        # Add orders to logistics service
-        logistics_service = get_logistics_service()
-        for order in orders:
-            logistics_service.add_order(order)
-        
-        # Clean up temporary file
-        os.unlink(temp_file_path)
-        
-        # Prepare response data
-        response_data = {
-            "filename": file.filename,
-            "total_records": len(raw_data),
-            "articles_parsed": len(articles),
-            "projects_created": len(projects),
-            "orders_created": len(orders),
-            "sample_articles": [
-                {
-                    "artikel": article.artikel,
-                    "artikel_bezeichnung": article.artikel_bezeichnung,
-                    "menge": article.menge,
-                    "lagerplatz": article.lagerplatz,
-                    "status": article.status.value,
-                }
-                for article in articles[:5]  # First 5 articles as sample
-            ],
-        }
+        async for chunk in request.stream():
+            if chunk and not await run_in_threadpool(reader.feed, chunk):
+                break
+        await run_in_threadpool(reader.finish)
+        parsed = await parsing
+        digest = hashing.hexdigest()
+        if declared is not None and declared != digest:
+            return _digest_mismatch(declared, digest)
 
-        return BaseResponse(
-            status="success",
-            message="CSV data uploaded and processed successfully",
-            data=response_data,
+        key = None
+        if not incremental:
+            key = upload_key(digest, "csv", delimiter, skip_initial_space)
+            previous = state.uploads.get(key)
+            if previous is not None:
+                return _repeated_upload(filename, previous)
+        response = await state.run_blocking(
+            _apply_csv_upload,
+            filename,
+            parsed,
+            _quarantine_data(request, quarantine),
+            data_service,
+            logistics_service,
         )
+        return _record_upload(state, key, response)
 
     except Exception as e:
-        logger.error("❌ Error uploading CSV data: %s", str(e))
-        
-        # Clean up temporary file if it exists
-        if 'temp_file_path' in locals():
-            try:
-                os.unlink(temp_file_path)
-            except OSError:
-                pass
-        
+        reader.close()
+        return _upload_error(e)
+
+
+@router.post("/upload/json", response_model=BaseResponse)
+async def upload_json_stream(
+    request: Request,
+    filename: Optional[str] = None,
+    data_service: DataService = Depends(get_data_service),
+    logistics_service: LogisticsService = Depends(get_logistics_service),
+    state: AppState = Depends(get_app_state),
+) -> Union[BaseResponse, JSONResponse]:
+    """Upload project JSON sent as the raw request body.
+
+    The body is parsed in a worker thread while it is still being
+    received, one project of the ``projects`` array at a time. As for
+    CSV, a repeated upload of the same content adds no orders, and one
+    sent with its ``X-Content-SHA256`` header is not parsed at all.
+    """
+    logger.info("📥 API v1 - POST /data/upload/json")
+
+    declared = _declared_digest(request)
+    if declared is not None:
+        previous = state.uploads.get(upload_key(declared, "json"))
+        if previous is not None:
+            return _repeated_upload(filename, previous)
+
+    reader = ChunkQueueReader()
+    hashing = HashingReader(reader)
+    quarantine = Quarantine(filename or "upload.json")
+
+    def parse() -> Tuple[IngestionPipeline, List[PickingOrder]]:
+        try:
+            parsed = _parse_json_upload(data_service, hashing, quarantine)
+            hashing.read()
+            return parsed
+        finally:
+            reader.close()
+
+    parsing = asyncio.get_running_loop().run_in_executor(
+        state.executor, parse
+    )
+    try:
+        async for chunk in request.stream():
+            if chunk and not await run_in_threadpool(reader.feed, chunk):
+                break
+        await run_in_threadpool(reader.finish)
+        parsed = await parsing
+        digest = hashing.hexdigest()
+        if declared is not None and declared != digest:
+            return _digest_mismatch(declared, digest)
+
+        key = upload_key(digest, "json")
+        previous = state.uploads.get(key)
+        if previous is not None:
+            return _repeated_upload(filename, previous)
+        response = await state.run_blocking(
+            _apply_json_upload,
+            filename,
+            parsed,
+            _quarantine_data(request, quarantine),
+            logistics_service,
+        )
+        return _record_upload(state, key, response)
+
+    except Exception as e:
+        reader.close()
+        logger.error("❌ Error uploading JSON data: %s", str(e))
         return JSONResponse(
             status_code=500,
             content=ErrorResponse(
                 status="error",
-                message="Failed to process CSV file",
+                message="Failed to process JSON data",
                 details=str(e),
                 code=500,
             ).dict(),
@@ -128,45 +853,35 @@ async def upload_csv_data(
 
 
 @router.post("/load/default", response_model=BaseResponse)
-async def load_default_data(request: Request):
-    """Load default data from docs/data directory."""
+async def load_default_data(
+    request: Request,
+    background: bool = False,
+    data_service: DataService = Depends(get_data_service),
+    logistics_service: LogisticsService = Depends(get_logistics_service),
+    job_service: JobService = Depends(get_job_service),
+    state: AppState = Depends(get_app_state),
+) -> Union[BaseResponse, JSONResponse]:
+    """Load default data from docs/data directory.
+
+    With ``background``, the load runs as a job whose progress can be
+    polled at ``/data/jobs/{job_id}``.
+    """
     logger.info("📥 API v1 - POST /data/load/default")
 
+    if background:
+
+        def work(job: IngestionJob) -> Callable[[], Dict[str, Any]]:
+            parsed = _parse_default_data(data_service, _job_progress(job))
+            return lambda: _apply_default_data(parsed, logistics_service)
+
+        job = job_service.submit("load_default", work)
+        return _job_accepted(job, "Default data load started")
+
     try:
-        data_service = get_data_service()
-        logistics_service = get_logistics_service()
-        
-        # Load and parse default data
-        articles = data_service.parse_csv_articles("orig.csv")
-        projects = data_service.parse_json_projects("project.json")
-        orders = data_service.create_picking_orders(projects)
-        
-        # Add orders to logistics service
-        for order in orders:
-            logistics_service.add_order(order)
-        
-        # Create some sample pickers and carts
-        sample_pickers = [
-            {"picker_id": "P001", "name": "John Doe", "employee_number": "EMP001"},
-            {"picker_id": "P002", "name": "Jane Smith", "employee_number": "EMP002"},
-            {"picker_id": "P003", "name": "Bob Wilson", "employee_number": "EMP003"},
-        ]
-        
-        sample_carts = [
-            {"cart_id": "C001", "capacity": 100.0},
-            {"cart_id": "C002", "capacity": 150.0},
-            {"cart_id": "C003", "capacity": 200.0},
-        ]
-        
-        # Add sample pickers and carts (this would need to be implemented in LogisticsService)
-        
-        response_data = {
-            "articles_loaded": len(articles),
-            "projects_loaded": len(projects),
-            "orders_created": len(orders),
-            "pickers_created": len(sample_pickers),
-            "carts_created": len(sample_carts),
-        }
+        parsed = await state.run_blocking(_parse_default_data, data_service)
+        response_data = await state.run_blocking(
+            _apply_default_data, parsed, logistics_service
+        )
 
         return BaseResponse(
             status="success",
@@ -187,29 +902,144 @@ async def load_default_data(request: Request):
         )
 
 
-@router.get("/status", response_model=BaseResponse)
-async def get_data_status(request: Request):
-    """Get current data status and statistics."""
-    logger.info("📥 API v1 - GET /data/status")
+@router.get("/jobs/{job_id}", response_model=BaseResponse)
+async def get_job(
+    job_id: str,
+    request: Request,
+    job_service: JobService = Depends(get_job_service),
+) -> Union[BaseResponse, JSONResponse]:
+    """Get the phase and progress of a background ingestion job."""
+    logger.info(f"📥 API v1 - GET /data/jobs/{job_id}")
+
+    job = job_service.get(job_id)
+    if not job:
+        return JSONResponse(
+            status_code=404,
+            content=ErrorResponse(
+                status="error",
+                message="Job not found",
+                details=f"Job with ID {job_id} does not exist",
+                code=404,
+            ).dict(),
+        )
+
+    return BaseResponse(
+        status="success",
+        message="Job retrieved successfully",
+        data=_job_data(job),
+    )
+
+
+@router.delete("/cache", response_model=BaseResponse)
+async def invalidate_parse_cache(
+    request: Request,
+    filename: Optional[str] = None,
+    data_service: DataService = Depends(get_data_service),
+) -> Union[BaseResponse, JSONResponse]:
+    """Invalidate the parsed-data cache for one file or all files."""
+    logger.info("📥 API v1 - DELETE /data/cache")
 
     try:
-        logistics_service = get_logistics_service()
-        
-        response_data = {
-            "orders_count": len(logistics_service.orders),
-            "pickers_count": len(logistics_service.pickers),
-            "carts_count": len(logistics_service.carts),
-            "open_orders": len([o for o in logistics_service.orders if o.status.value == "Offen"]),
-            "in_progress_orders": len([o for o in logistics_service.orders if o.status.value == "In Bearbeitung"]),
-            "completed_orders": len([o for o in logistics_service.orders if o.status.value == "Abgeschlossen"]),
-        }
+        removed = data_service.invalidate_cache(filename)
 
         return BaseResponse(
             status="success",
-            message="Data status retrieved successfully",
-            data=response_data,
+            message="Parse cache invalidated successfully",
+            data={"entries_removed": removed},
+        )
+
+    except Exception as e:
+        logger.error("❌ Error invalidating parse cache: %s", str(e))
+        return JSONResponse(
+            status_code=500,
+            content=ErrorResponse(
+                status="error",
+                message="Failed to invalidate parse cache",
+                details=str(e),
+                code=500,
+            ).dict(),
+        )
+
+
+@router.get("/quarantine/{report_id}", name="download_quarantine_report")
+async def download_quarantine_report(
+    report_id: str,
+    request: Request,
+    data_service: DataService = Depends(get_data_service),
+) -> Response:
+    """Download the rejected rows of an upload as JSON Lines."""
+    logger.info(f"📥 API v1 - GET /data/quarantine/{report_id}")
+
+    try:
+        path = data_service.quarantine_path(report_id)
+    except (FileNotFoundError, ValueError):
+        path = None
+
+    if path is None or not path.is_file():
+        return JSONResponse(
+            status_code=404,
+            content=ErrorResponse(
+                status="error",
+                message="Quarantine report not found",
+                details=f"Report with ID {report_id} does not exist",
+                code=404,
+            ).dict(),
         )
 
+    return FileResponse(
+        path, media_type="application/x-ndjson", filename=path.name
+    )
+
+
+@router.get("/watcher", response_model=BaseResponse)
+async def get_watcher_status(
+    request: Request,
+    state: AppState = Depends(get_app_state),
+) -> BaseResponse:
+    """Get the data directory watcher and its per-file ingest latency."""
+    logger.info("📥 API v1 - GET /data/watcher")
+
+    if state.watcher is None:
+        return BaseResponse(
+            status="success",
+            message="Data directory watcher is disabled",
+            data={"running": False},
+        )
+
+    return BaseResponse(
+        status="success",
+        message="Watcher status retrieved successfully",
+        data=state.watcher.summary(),
+    )
+
+
+@router.get("/status", response_model=BaseResponse)
+async def get_data_status(
+    request: Request,
+    logistics_service: LogisticsService = Depends(get_logistics_service),
+) -> Union[BaseResponse, JSONResponse]:
+    """Get current data status and statistics."""
+    logger.info("📥 API v1 - GET /data/status")
+
+    try:
+        # Worker threads commit uploads; read under the service lock
+        with logistics_service.lock:
+            status_counts = logistics_service.count_orders_by_status()
+            response_data = {
+                "orders_count": len(logistics_service.orders),
+                "pickers_count": len(logistics_service.pickers),
+                "carts_count": len(logistics_service.carts),
+                "open_orders": status_counts[StatusEnum.OFFEN],
+                "in_progress_orders": status_counts[StatusEnum.IN_BEARBEITUNG],
+                "completed_orders": status_counts[StatusEnum.ABGESCHLOSSEN],
+            }
+
+            return BaseResponse(
+                status="success",
+                message="Data status retrieved successfully",
+                data=response_data,
+            )
+
     except Exception as e:
         logger.error("❌ Error getting data status: %s", str(e))
         return JSONResponse(
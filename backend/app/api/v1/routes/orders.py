@@ -13,27 +13,22 @@ Author: Matthias Morath
 
 import logging
 from typing import Optional
-from fastapi import APIRouter, HTTPException, status, Request, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Query
 from fastapi.responses import JSONResponse
 
 from app.models import (
     OrderResponse,
     BaseResponse,
     ErrorResponse,
+    StatusEnum,
 )
 from app.services.logistics_service import LogisticsService
+from app.services.state import AppState
+from ..dependencies import get_app_state, get_logistics_service
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-# MARK: ━━━ Dependencies ━━━
-
-
-def get_logistics_service() -> LogisticsService:
-    """Get logistics service instance."""
-    # In a real app, this would come from dependency injection
-    return LogisticsService()
-
 
 # MARK: ━━━ Order Endpoints ━━━
 
@@ -44,61 +39,63 @@ async def list_orders(
     status_filter: Optional[str] = Query(None, description="Filter by status"),
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(10, ge=1, le=100, description="Page size"),
+    service: LogisticsService = Depends(get_logistics_service),
 ):
     """Get all orders with optional filtering and pagination."""
     logger.info("📥 API v1 - GET /orders")
 
     try:
-        service = get_logistics_service()
-
-        # Filter orders by status if specified
-        if status_filter:
-            orders = [
-                order
-                for order in service.orders
-                if order.status.value == status_filter
-            ]
-        else:
-            orders = service.orders
-
-        # Pagination
-        total = len(orders)
-        start_idx = (page - 1) * size
-        end_idx = start_idx + size
-        paginated_orders = orders[start_idx:end_idx]
-
-        # Convert to response models
-        order_responses = []
-        for order in paginated_orders:
-            order_responses.append(
-                OrderResponse(
-                    order_id=order.order_id,
-                    project_number=order.project.projekt_nr,
-                    status=order.status,
-                    priority=order.priority,
-                    assigned_picker=order.assigned_picker,
-                    created_at=order.created_at,
-                    completion_percentage=order.completion_percentage,
-                    total_articles=len(order.project.articles),
-                    completed_articles=len(order.project.completed_articles),
-                    total_weight=order.project.total_weight,
-                    is_complete=order.is_complete,
+        # Worker threads commit uploads; read under the service lock
+        with service.lock:
+            # Filter orders by status if specified
+            if status_filter:
+                try:
+                    orders = service.get_orders_by_status(
+                        StatusEnum(status_filter)
+                    )
+                except ValueError:
+                    orders = []
+            else:
+                orders = service.orders
+
+            # Pagination
+            total = len(orders)
+            start_idx = (page - 1) * size
+            end_idx = start_idx + size
+            paginated_orders = orders[start_idx:end_idx]
+
+            # Convert to response models
+            order_responses = []
+            for order in paginated_orders:
+                order_responses.append(
+                    OrderResponse(
+                        order_id=order.order_id,
+                        project_number=order.project.projekt_nr,
+                        status=order.status,
+                        priority=order.priority,
+                        assigned_picker=order.assigned_picker,
+                        created_at=order.created_at,
+                        completion_percentage=order.completion_percentage,
+                        total_articles=order.project.total_articles,
+                        completed_articles=order.project.completed_count,
+                        total_weight=order.project.total_weight,
+                        is_complete=order.is_complete,
+                    )
                 )
-            )
 
-        return BaseResponse(
-            status="success",
-            message="Orders retrieved successfully",
-            data={
-                "orders": [order.dict() for order in order_responses],
-                "pagination": {
-                    "page": page,
-                    "size": size,
-                    "total": total,
-                    "pages": (total + size - 1) // size,
+            return BaseResponse(
+                status="success",
+                message="Orders retrieved successfully",
+                data={
+                    "orders": [order.dict() for order in order_responses],
+                    "pagination": {
+                        "page": page,
+                        "size": size,
+                        "total": total,
+                        "pages": (total + size - 1) // size,
+                    },
                 },
-            },
-        )
+            )
 
     except Exception as e:
         logger.error("❌ Error getting orders: %s", str(e))
@@ -109,12 +106,69 @@ async def list_orders(
 
 
 @router.get("/{order_id}", response_model=BaseResponse)
-async def get_order(order_id: str, request: Request):
+async def get_order(
+    order_id: str,
+    request: Request,
+    service: LogisticsService = Depends(get_logistics_service),
+):
     """Get specific order by ID."""
     logger.info("📥 API v1 - GET /orders/%s", order_id)
 
     try:
-        service = get_logistics_service()
+        # Worker threads commit uploads; read under the service lock
+        with service.lock:
+            order = service.get_order_by_id(order_id)
+
+            if not order:
+                return JSONResponse(
+                    status_code=404,
+                    content=ErrorResponse(
+                        status="error",
+                        message="Order not found",
+                        details=f"No order found with id {order_id}",
+                        code=404,
+                    ).dict(),
+                )
+
+            order_response = OrderResponse(
+                order_id=order.order_id,
+                project_number=order.project.projekt_nr,
+                status=order.status,
+                priority=order.priority,
+                assigned_picker=order.assigned_picker,
+                created_at=order.created_at,
+                completion_percentage=order.completion_percentage,
+                total_articles=order.project.total_articles,
+                completed_articles=order.project.completed_count,
+                total_weight=order.project.total_weight,
+                is_complete=order.is_complete,
+            )
+
+            return BaseResponse(
+                status="success",
+                message="Order retrieved successfully",
+                data=order_response.dict(),
+            )
+
+    except Exception as e:
+        logger.error("❌ Error getting order %s: %s", order_id, str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal Server Error",
+        )
+
+
+@router.get("/{order_id}/route", response_model=BaseResponse)
+async def get_order_route(
+    order_id: str,
+    request: Request,
+    service: LogisticsService = Depends(get_logistics_service),
+    state: AppState = Depends(get_app_state),
+):
+    """Get the optimized picking route of an order."""
+    logger.info("📥 API v1 - GET /orders/%s/route", order_id)
+
+    try:
         order = service.get_order_by_id(order_id)
 
         if not order:
@@ -128,28 +182,18 @@ async def get_order(order_id: str, request: Request):
                 ).dict(),
             )
 
-        order_response = OrderResponse(
-            order_id=order.order_id,
-            project_number=order.project.projekt_nr,
-            status=order.status,
-            priority=order.priority,
-            assigned_picker=order.assigned_picker,
-            created_at=order.created_at,
-            completion_percentage=order.completion_percentage,
-            total_articles=len(order.project.articles),
-            completed_articles=len(order.project.completed_articles),
-            total_weight=order.project.total_weight,
-            is_complete=order.is_complete,
+        route = await state.run_blocking(
+            service.calculate_route_optimization, order
         )
 
         return BaseResponse(
             status="success",
-            message="Order retrieved successfully",
-            data=order_response.dict(),
+            message="Route calculated successfully",
+            data={"order_id": order_id, "route": route},
         )
 
     except Exception as e:
-        logger.error("❌ Error getting order %s: %s", order_id, str(e))
+        logger.error("❌ Error calculating route for %s: %s", order_id, str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal Server Error",
@@ -157,12 +201,16 @@ async def get_order(order_id: str, request: Request):
 
 
 @router.post("/{order_id}/assign", response_model=BaseResponse)
-async def assign_order(order_id: str, picker_id: str, request: Request):
+async def assign_order(
+    order_id: str,
+    picker_id: str,
+    request: Request,
+    service: LogisticsService = Depends(get_logistics_service),
+):
     """Assign an order to a picker."""
     logger.info("📥 API v1 - POST /orders/%s/assign", order_id)
 
     try:
-        service = get_logistics_service()
         success = service.assign_order_to_picker(order_id, picker_id)
 
         if not success:
@@ -199,12 +247,12 @@ async def pick_article(
     quantity: int,
     picker_id: str,
     request: Request,
+    service: LogisticsService = Depends(get_logistics_service),
 ):
     """Record picking of an article."""
     logger.info("📥 API v1 - POST /orders/%s/pick", order_id)
 
     try:
-        service = get_logistics_service()
         success = service.pick_article(
             order_id, article_id, quantity, picker_id
         )
@@ -240,12 +288,15 @@ async def pick_article(
 
 
 @router.post("/{order_id}/complete", response_model=BaseResponse)
-async def complete_order(order_id: str, request: Request):
+async def complete_order(
+    order_id: str,
+    request: Request,
+    service: LogisticsService = Depends(get_logistics_service),
+):
     """Mark an order as completed."""
     logger.info("📥 API v1 - POST /orders/%s/complete", order_id)
 
     try:
-        service = get_logistics_service()
         success = service.complete_order(order_id)
 
         if not success:
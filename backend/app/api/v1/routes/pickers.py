@@ -6,50 +6,48 @@ Pickers API routes for the logistics management system.
 """
 
 import logging
-from fastapi import APIRouter, HTTPException, status, Request
+from fastapi import APIRouter, Depends, HTTPException, status, Request
 from app.models import PickerResponse, BaseResponse, ErrorResponse
 from app.services.logistics_service import LogisticsService
+from ..dependencies import get_logistics_service
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-# MARK: ━━━ Dependencies ━━━
-
-
-def get_logistics_service() -> LogisticsService:
-    """Get logistics service instance."""
-    return LogisticsService()
-
 
 # MARK: ━━━ Picker Endpoints ━━━
 
 
 @router.get("/", response_model=BaseResponse)
-async def list_pickers(request: Request):
+async def list_pickers(
+    request: Request,
+    service: LogisticsService = Depends(get_logistics_service),
+):
     """Get all pickers."""
     logger.info("📥 API v1 - GET /pickers")
 
     try:
-        service = get_logistics_service()
-        pickers = service.pickers
-
-        picker_responses = []
-        for picker in pickers:
-            picker_responses.append(
-                PickerResponse(
-                    picker_id=picker.picker_id,
-                    name=picker.name,
-                    employee_number=picker.employee_number,
-                    is_active=picker.is_active,
-                    current_order=picker.current_order,
+        # Worker threads commit uploads; read under the service lock
+        with service.lock:
+            pickers = service.pickers
+
+            picker_responses = []
+            for picker in pickers:
+                picker_responses.append(
+                    PickerResponse(
+                        picker_id=picker.picker_id,
+                        name=picker.name,
+                        employee_number=picker.employee_number,
+                        is_active=picker.is_active,
+                        current_order=picker.current_order,
+                    )
                 )
-            )
 
-        return BaseResponse(
-            status="success",
-            message="Pickers retrieved successfully",
-            data={"pickers": [picker.dict() for picker in picker_responses]},
-        )
+            return BaseResponse(
+                status="success",
+                message="Pickers retrieved successfully",
+                data={"pickers": [picker.dict() for picker in picker_responses]},
+            )
 
     except Exception as e:
         logger.error("❌ Error getting pickers: %s", str(e))
@@ -60,12 +58,14 @@ async def list_pickers(request: Request):
 
 
 @router.post("/", response_model=BaseResponse)
-async def create_picker(request: Request):
+async def create_picker(
+    request: Request,
+    service: LogisticsService = Depends(get_logistics_service),
+):
     """Create a new picker."""
     logger.info("📥 API v1 - POST /pickers")
 
     try:
-        service = get_logistics_service()
         # Implementation would create a new picker
         return BaseResponse(
             status="success",
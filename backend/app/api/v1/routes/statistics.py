@@ -6,28 +6,28 @@ Statistics API routes for the logistics management system.
 """
 
 import logging
-from fastapi import APIRouter, HTTPException, status, Request
+from fastapi import APIRouter, Depends, HTTPException, status, Request
 
 from app.models import BaseResponse
 from app.services.logistics_service import LogisticsService
+from app.services.state import AppState
+from ..dependencies import get_app_state, get_logistics_service
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
-def get_logistics_service() -> LogisticsService:
-    """Get logistics service instance."""
-    return LogisticsService()
-
-
 @router.get("/overview", response_model=BaseResponse)
-async def get_system_overview(request: Request):
+async def get_system_overview(
+    request: Request,
+    service: LogisticsService = Depends(get_logistics_service),
+    state: AppState = Depends(get_app_state),
+):
     """Get system overview statistics."""
     logger.info("📥 API v1 - GET /statistics/overview")
 
     try:
-        service = get_logistics_service()
-        overview = service.get_system_overview()
+        overview = await state.run_blocking(service.get_system_overview)
 
         return BaseResponse(
             status="success",
@@ -43,4 +43,30 @@ async def get_system_overview(request: Request):
         )
 
 
+@router.get("/memory", response_model=BaseResponse)
+async def get_memory_report(
+    request: Request,
+    service: LogisticsService = Depends(get_logistics_service),
+    state: AppState = Depends(get_app_state),
+):
+    """Get the memory held per loaded article line."""
+    logger.info("📥 API v1 - GET /statistics/memory")
+
+    try:
+        report = await state.run_blocking(service.get_memory_report)
+
+        return BaseResponse(
+            status="success",
+            message="Memory report retrieved successfully",
+            data=report,
+        )
+
+    except Exception as e:
+        logger.error("❌ Error getting memory report: %s", str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal Server Error",
+        )
+
+
 # EOF
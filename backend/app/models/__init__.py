@@ -15,6 +15,7 @@ from .project_models import Project, ProjectCreate, ProjectResponse
 from .order_models import PickingOrder, OrderCreate, OrderResponse, OrderList
 from .picker_models import Picker, PickerCreate, PickerResponse
 from .cart_models import MaterialCart, CartCreate, CartResponse
+from .job_models import JobPhaseEnum, IngestionJob, JobResponse
 from .common_models import (
     StatusEnum,
     BaseResponse,
@@ -41,6 +42,9 @@ __all__ = [
     "MaterialCart",
     "CartCreate",
     "CartResponse",
+    "JobPhaseEnum",
+    "IngestionJob",
+    "JobResponse",
     "StatusEnum",
     "BaseResponse",
     "ErrorResponse",
@@ -0,0 +1,88 @@
+# File: backend/app/models/job_models.py
+# Path: backend/app/models/job_models.py
+
+"""
+Background ingestion job models for the logistics management system.
+"""
+
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel, Field
+
+
+class JobPhaseEnum(str, Enum):
+    """Ingestion job phase enumeration."""
+
+    QUEUED = "queued"
+    PARSING = "parsing"
+    CREATING_ORDERS = "creating_orders"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class IngestionJob(BaseModel):
+    """Model for a background ingestion job and its progress."""
+
+    job_id: str = Field(..., description="Unique job ID")
+    kind: str = Field(..., description="Job kind, e.g. upload_csv")
+    phase: JobPhaseEnum = Field(
+        default=JobPhaseEnum.QUEUED, description="Current phase"
+    )
+    created_at: datetime = Field(
+        default_factory=datetime.now, description="Creation time"
+    )
+    started_at: Optional[datetime] = Field(default=None, description="Start time")
+    finished_at: Optional[datetime] = Field(default=None, description="End time")
+    rows_processed: int = Field(default=0, ge=0, description="Rows read")
+    rows_rejected: int = Field(
+        default=0, ge=0, description="Rows rejected by validation"
+    )
+    bytes_processed: int = Field(default=0, ge=0, description="Bytes read")
+    total_bytes: Optional[int] = Field(
+        default=None, ge=0, description="Source size in bytes, if known"
+    )
+    result: Optional[Dict[str, Any]] = Field(
+        default=None, description="Result data once completed"
+    )
+    error: Optional[str] = Field(default=None, description="Error if failed")
+
+    @property
+    def is_finished(self) -> bool:
+        """Check if the job has completed or failed."""
+        return self.phase in (JobPhaseEnum.COMPLETED, JobPhaseEnum.FAILED)
+
+    @property
+    def eta_seconds(self) -> Optional[float]:
+        """Estimate the remaining time from the share of bytes read."""
+        if self.is_finished:
+            return 0.0
+        if self.started_at is None or not self.total_bytes or not self.bytes_processed:
+            return None
+        elapsed = (datetime.now() - self.started_at).total_seconds()
+        remaining = self.total_bytes - self.bytes_processed
+        return max(0.0, elapsed * remaining / self.bytes_processed)
+
+
+class JobResponse(BaseModel):
+    """Ingestion job response model."""
+
+    job_id: str = Field(..., description="Job ID")
+    kind: str = Field(..., description="Job kind")
+    phase: JobPhaseEnum = Field(..., description="Current phase")
+    created_at: datetime = Field(..., description="Creation time")
+    started_at: Optional[datetime] = Field(default=None, description="Start time")
+    finished_at: Optional[datetime] = Field(default=None, description="End time")
+    rows_processed: int = Field(..., description="Rows read")
+    rows_rejected: int = Field(..., description="Rows rejected")
+    bytes_processed: int = Field(..., description="Bytes read")
+    total_bytes: Optional[int] = Field(default=None, description="Source size")
+    eta_seconds: Optional[float] = Field(
+        default=None, description="Estimated seconds remaining"
+    )
+    result: Optional[Dict[str, Any]] = Field(default=None, description="Result data")
+    error: Optional[str] = Field(default=None, description="Error if failed")
+
+
+# EOF
@@ -32,17 +32,14 @@ class PickingOrder(BaseModel):
     @property
     def is_complete(self) -> bool:
         """Check if all articles are completed."""
-        return all(
-            article.status == StatusEnum.ABGESCHLOSSEN
-            for article in self.project.articles
-        )
+        return self.project.is_complete
 
     @property
     def completion_percentage(self) -> float:
         """Calculate completion percentage."""
         if not self.project.articles:
             return 0.0
-        completed = len(self.project.completed_articles)
+        completed = self.project.completed_count
         total = len(self.project.articles)
         return (completed / total) * 100
 
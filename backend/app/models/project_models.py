@@ -5,12 +5,84 @@
 Project models for the logistics management system.
 """
 
-from typing import List
-from pydantic import BaseModel, Field
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    SupportsIndex,
+    Tuple,
+)
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 from .article_models import Article
 from .common_models import StatusEnum
 
 
+class _ArticleList(List[Article]):
+    """Article list that counts its changes, so indexes notice any edit.
+
+    Replacing an article keeps the length, so the length alone cannot
+    tell whether indexes built over the list are still current.
+    """
+
+    version = 0
+
+    def _changed(self) -> None:
+        """Count a change of the list."""
+        self.version += 1
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        self._changed()
+        super().__setitem__(index, value)
+
+    def __delitem__(self, index: Any) -> None:
+        self._changed()
+        super().__delitem__(index)
+
+    def __iadd__(  # type: ignore[misc, override]
+        self, other: Iterable[Article]
+    ) -> "_ArticleList":
+        self._changed()
+        return super().__iadd__(other)
+
+    def __imul__(self, count: SupportsIndex) -> "_ArticleList":
+        self._changed()
+        return super().__imul__(count)
+
+    def append(self, item: Article) -> None:
+        self._changed()
+        super().append(item)
+
+    def extend(self, items: Iterable[Article]) -> None:
+        self._changed()
+        super().extend(items)
+
+    def insert(self, index: SupportsIndex, item: Article) -> None:
+        self._changed()
+        super().insert(index, item)
+
+    def pop(self, index: SupportsIndex = -1) -> Article:
+        self._changed()
+        return super().pop(index)
+
+    def remove(self, item: Article) -> None:
+        self._changed()
+        super().remove(item)
+
+    def clear(self) -> None:
+        self._changed()
+        super().clear()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        self._changed()
+        super().sort(*args, **kwargs)
+
+    def reverse(self) -> None:
+        self._changed()
+        super().reverse()
+
+
 class Project(BaseModel):
     """Model for a project containing multiple articles."""
 
@@ -19,6 +91,142 @@ class Project(BaseModel):
         default_factory=list, description="Articles"
     )
 
+    # The indexes are current while _indexed_state matches the list
+    _articles_by_artikel: Dict[str, List[Article]] = PrivateAttr(
+        default_factory=dict
+    )
+    _article_by_position: Dict[int, Article] = PrivateAttr(
+        default_factory=dict
+    )
+    _row_offsets: Dict[int, int] = PrivateAttr(default_factory=dict)
+    _indexed_state: Optional[Tuple[int, int]] = PrivateAttr(default=None)
+    _completed_count: int = PrivateAttr(default=0)
+    _open_count: int = PrivateAttr(default=0)
+    _total_weight: float = PrivateAttr(default=0.0)
+    _aggregated_state: Optional[Tuple[int, int]] = PrivateAttr(
+        default=None
+    )
+
+    @field_validator("articles")
+    @classmethod
+    def _track_articles(cls, articles: List[Article]) -> List[Article]:
+        """Keep the articles in a list that counts its changes."""
+        return _ArticleList(articles)
+
+    def _article_list(self) -> _ArticleList:
+        """Get the article list, tracking it if it was assigned directly."""
+        articles = self.articles
+        if not isinstance(articles, _ArticleList):
+            articles = _ArticleList(articles)
+            self.articles = articles
+        return articles
+
+    def _list_state(self) -> Tuple[int, int]:
+        """Get a token that changes whenever the article list changes."""
+        articles = self._article_list()
+        return (id(articles), articles.version)
+
+    def add_article(self, article: Article) -> None:
+        """Add an article line and invalidate the lookup indexes."""
+        self._ensure_aggregates()
+        self.articles.append(article)
+        self.invalidate_indexes()
+        self._count_article(article, 1)
+        self._aggregated_state = self._list_state()
+
+    def remove_article(self, article: Article) -> None:
+        """Remove an article line and update the aggregates.
+
+        Articles that are not lines of this project are ignored.
+        """
+        self._ensure_indexes()
+        offset = self._row_offsets.get(id(article))
+        if offset is None:
+            return
+        self._ensure_aggregates()
+        del self.articles[offset]
+        self.invalidate_indexes()
+        self._count_article(article, -1)
+        self._aggregated_state = self._list_state()
+
+    def update_article(self, article: Article, values: Dict[str, Any]) -> None:
+        """Overwrite fields of an article line and update the aggregates."""
+        self._ensure_aggregates()
+        self._count_article(article, -1)
+        for name, value in values.items():
+            setattr(article, name, value)
+        self._count_article(article, 1)
+        self.invalidate_indexes()
+
+    def set_article_status(self, article: Article, status: StatusEnum) -> None:
+        """Change the status of an article and update the aggregates."""
+        self._ensure_aggregates()
+        self._count_article(article, -1)
+        article.status = status
+        self._count_article(article, 1)
+
+    def refresh_aggregates(self) -> None:
+        """Recompute the cached aggregates from the article lines.
+
+        Needed only if article statuses were changed directly instead
+        of through ``set_article_status``.
+        """
+        self._completed_count = 0
+        self._open_count = 0
+        self._total_weight = 0.0
+        for article in self.articles:
+            self._count_article(article, 1)
+        self._aggregated_state = self._list_state()
+
+    def _ensure_aggregates(self) -> None:
+        """Recompute the aggregates if the article list has changed."""
+        if self._aggregated_state != self._list_state():
+            self.refresh_aggregates()
+
+    def _count_article(self, article: Article, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) an article from the aggregates."""
+        if article.status == StatusEnum.ABGESCHLOSSEN:
+            self._completed_count += sign
+        elif article.status == StatusEnum.OFFEN:
+            self._open_count += sign
+        self._total_weight += sign * article.total_weight
+
+    def invalidate_indexes(self) -> None:
+        """Drop the lookup indexes so they are rebuilt on next access."""
+        self._articles_by_artikel = {}
+        self._article_by_position = {}
+        self._row_offsets = {}
+        self._indexed_state = None
+
+    def _ensure_indexes(self) -> None:
+        """Build the lookup indexes if missing or stale."""
+        state = self._list_state()
+        if self._indexed_state == state:
+            return
+
+        by_artikel: Dict[str, List[Article]] = {}
+        by_position: Dict[int, Article] = {}
+        row_offsets: Dict[int, int] = {}
+        for offset, article in enumerate(self.articles):
+            by_artikel.setdefault(article.artikel, []).append(article)
+            by_position.setdefault(article.position, article)
+            row_offsets[id(article)] = offset
+
+        self._articles_by_artikel = by_artikel
+        self._article_by_position = by_position
+        self._row_offsets = row_offsets
+        self._indexed_state = state
+
+    def find_articles(self, artikel: str) -> List[Article]:
+        """Get all article lines with the given article number."""
+        self._ensure_indexes()
+        return self._articles_by_artikel.get(artikel, [])
+
+    def find_article_by_position(self, position: int) -> Optional[Article]:
+        """Get the article line at the given position."""
+        self._ensure_indexes()
+        return self._article_by_position.get(position)
+
     @property
     def total_articles(self) -> int:
         """Get total number of articles in project."""
@@ -26,8 +234,26 @@ class Project(BaseModel):
 
     @property
     def total_weight(self) -> float:
-        """Calculate total weight of all articles."""
-        return sum(article.total_weight for article in self.articles)
+        """Get total weight of all articles."""
+        self._ensure_aggregates()
+        return self._total_weight
+
+    @property
+    def completed_count(self) -> int:
+        """Get number of articles with completed status."""
+        self._ensure_aggregates()
+        return self._completed_count
+
+    @property
+    def open_count(self) -> int:
+        """Get number of articles with open status."""
+        self._ensure_aggregates()
+        return self._open_count
+
+    @property
+    def is_complete(self) -> bool:
+        """Check if all articles are completed."""
+        return self.completed_count == len(self.articles)
 
     @property
     def open_articles(self) -> List[Article]:
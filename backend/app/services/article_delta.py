@@ -0,0 +1,78 @@
+# File: backend/app/services/article_delta.py
+# Path: backend/app/services/article_delta.py
+
+"""
+Line-level changes between two article exports.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
+
+from ..models import Article
+
+# (projekt_nr, position, vorgang_id) identifies a line across exports.
+LineKey = Tuple[str, int, int]
+
+# Fields owned by picking; kept from the loaded line on update and
+# ignored when deciding whether a line has changed.
+PROGRESS_FIELDS = [
+    "status",
+    "anzahl_aktion",
+    "kommisionierer",
+    "materialwagen",
+    "anzahl_auf_wagen",
+    "anzahl_fehlt",
+    "anzahl_beschaedigt",
+]
+
+KEY_FIELDS = ["projekt_nr", "position", "vorgang_id"]
+
+
+def line_key(article: Article) -> LineKey:
+    """Get the export key of an article line."""
+    return (article.projekt_nr, article.position, article.vorgang_id)
+
+
+def export_values(article: Article) -> Dict[str, Any]:
+    """Get the export-owned field values of an article line."""
+    return {
+        name: getattr(article, name)
+        for name in Article.model_fields
+        if name not in PROGRESS_FIELDS
+    }
+
+
+@dataclass
+class ArticleDelta:
+    """Inserted, updated and removed lines of a new export.
+
+    ``hashes`` holds the content hash of every line of the new export
+    and becomes the baseline for the next diff.
+    """
+
+    inserts: List[Article] = field(default_factory=list)
+    updates: List[Article] = field(default_factory=list)
+    removals: List[LineKey] = field(default_factory=list)
+    hashes: Dict[LineKey, int] = field(default_factory=dict)
+    rows_read: int = 0
+    rows_rejected: int = 0
+    duplicate_keys: int = 0
+
+    @property
+    def is_empty(self) -> bool:
+        """Check whether the export changed no lines."""
+        return not (self.inserts or self.updates or self.removals)
+
+    def summary(self) -> Dict[str, int]:
+        """Get the number of changes per kind."""
+        return {
+            "rows_read": self.rows_read,
+            "rows_rejected": self.rows_rejected,
+            "duplicate_keys": self.duplicate_keys,
+            "inserted": len(self.inserts),
+            "updated": len(self.updates),
+            "removed": len(self.removals),
+        }
+
+
+# EOF
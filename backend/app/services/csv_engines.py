@@ -0,0 +1,278 @@
+# File: backend/app/services/csv_engines.py
+# Path: backend/app/services/csv_engines.py
+
+"""
+Reader engines that stream CSV files as chunks of raw DataFrames.
+"""
+
+import csv
+import logging
+from contextlib import ExitStack, closing
+from typing import Any, Generator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    from pyarrow import csv as pa_csv
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+logger = logging.getLogger(__name__)
+
+CSV_ENGINES = ("pandas", "pyarrow", "auto")
+
+# Bytes the Arrow reader parses per block; blocks are split across threads.
+DEFAULT_ARROW_BLOCK_SIZE = 1 << 22
+
+# Identifier columns read as text by every engine, so an all-digit value
+# keeps its leading zeros (project number "054536" rather than "54536")
+# and matches the same ID in JSON exports.
+TEXT_COLUMNS = ("projekt_nr",)
+
+# Cell values read as missing, as pandas reads them by default.
+NULL_VALUES = [
+    "",
+    "#N/A",
+    "#N/A N/A",
+    "#NA",
+    "-1.#IND",
+    "-1.#QNAN",
+    "-NaN",
+    "-nan",
+    "1.#IND",
+    "1.#QNAN",
+    "<NA>",
+    "N/A",
+    "NA",
+    "NULL",
+    "NaN",
+    "None",
+    "n/a",
+    "nan",
+    "null",
+]
+
+
+# MARK: ━━━ Header Handling ━━━
+
+
+def header_columns(raw_names: Sequence[str]) -> Tuple[List[str], List[str]]:
+    """Name the columns of a raw header deterministically.
+
+    Names are stripped of their padding. If a stripped name repeats, the
+    last column keeps it and the earlier ones are dropped, as row
+    dictionaries built from the file always kept the last of them
+    (orig.csv repeats ``abteilungsgruppe``). Returns the names to read
+    every column under, with placeholders for the dropped ones, and the
+    names of the kept columns in file order.
+    """
+    stripped = [name.strip() for name in raw_names]
+    last = {name: position for position, name in enumerate(stripped)}
+    names = [
+        name if last[name] == position else f"__dropped_{position}"
+        for position, name in enumerate(stripped)
+    ]
+    kept = [name for name in names if name in last]
+    return names, kept
+
+
+def _read_header(stream: Any, delimiter: str) -> List[str]:
+    """Read the header line of a stream, leaving it at the first row."""
+    line = stream.readline()
+    if isinstance(line, bytes):
+        line = line.decode("utf-8-sig")
+    if not line.strip():
+        raise pd.errors.EmptyDataError("No columns to parse from file")
+    return next(csv.reader([line.rstrip("\r\n")], delimiter=delimiter))
+
+
+# MARK: ━━━ Engines ━━━
+
+
+class CsvEngine:
+    """Reads a CSV source into raw frames with a running row index.
+
+    Every engine names the columns with ``header_columns`` and keeps the
+    raw cell values as the cleaning step expects them: leading spaces
+    are skipped if asked, and empty cells are NaN.
+    """
+
+    name = ""
+
+    def read_chunks(
+        self,
+        source: Any,
+        delimiter: str = "|",
+        skip_initial_space: bool = True,
+        chunk_size: Optional[int] = None,
+    ) -> Generator[pd.DataFrame, None, None]:
+        """Stream a path or binary file object in chunks of rows.
+
+        Without ``chunk_size``, the whole file is one chunk.
+        """
+        with ExitStack() as stack:
+            stream = source
+            if not hasattr(source, "read"):
+                stream = stack.enter_context(open(source, "rb"))
+            names, kept = header_columns(_read_header(stream, delimiter))
+            yield from self._read(
+                stream, names, kept, delimiter, skip_initial_space, chunk_size
+            )
+
+    def read_frame(
+        self,
+        source: Any,
+        delimiter: str = "|",
+        skip_initial_space: bool = True,
+    ) -> pd.DataFrame:
+        """Read a whole CSV source into one frame."""
+        chunks = self.read_chunks(source, delimiter, skip_initial_space)
+        with closing(chunks):
+            return next(chunks)
+
+    def _read(
+        self,
+        stream: Any,
+        names: List[str],
+        kept: List[str],
+        delimiter: str,
+        skip_initial_space: bool,
+        chunk_size: Optional[int],
+    ) -> Generator[pd.DataFrame, None, None]:
+        """Read the rows after the header line."""
+        raise NotImplementedError
+
+
+class PandasCsvEngine(CsvEngine):
+    """The single-threaded pandas C parser.
+
+    Column types are inferred, except for ``TEXT_COLUMNS``.
+    """
+
+    name = "pandas"
+
+    def _read(
+        self,
+        stream: Any,
+        names: List[str],
+        kept: List[str],
+        delimiter: str,
+        skip_initial_space: bool,
+        chunk_size: Optional[int],
+    ) -> Generator[pd.DataFrame, None, None]:
+        """Read the rows with ``pd.read_csv``, skipping dropped columns."""
+        options = {
+            "sep": delimiter,
+            "skipinitialspace": skip_initial_space,
+            "header": None,
+            "names": names,
+            "usecols": kept,
+            "dtype": {name: str for name in TEXT_COLUMNS if name in kept},
+        }
+        if chunk_size is None:
+            yield pd.read_csv(stream, **options)
+            return
+        with pd.read_csv(stream, chunksize=chunk_size, **options) as reader:
+            yield from reader
+
+
+class ArrowCsvEngine(CsvEngine):
+    """The multi-threaded Arrow CSV reader.
+
+    Every column is read as a string with an explicit schema, so no
+    types are inferred from the first block; the cleaning step converts
+    the values as it does for pandas. Dropped columns are not converted.
+    """
+
+    name = "pyarrow"
+
+    def __init__(self, block_size: int = DEFAULT_ARROW_BLOCK_SIZE):
+        """Initialize the engine with the bytes parsed per block."""
+        if pa is None:
+            raise ImportError("The pyarrow CSV engine requires pyarrow")
+        self.block_size = block_size
+        self._nulls = pa.array(NULL_VALUES, pa.string())
+
+    def _read(
+        self,
+        stream: Any,
+        names: List[str],
+        kept: List[str],
+        delimiter: str,
+        skip_initial_space: bool,
+        chunk_size: Optional[int],
+    ) -> Generator[pd.DataFrame, None, None]:
+        """Read record batches and regroup them into chunks of rows."""
+        reader = pa_csv.open_csv(
+            stream,
+            read_options=pa_csv.ReadOptions(
+                column_names=names,
+                block_size=self.block_size,
+                use_threads=True,
+            ),
+            parse_options=pa_csv.ParseOptions(delimiter=delimiter),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={name: pa.string() for name in kept},
+                include_columns=kept,
+                null_values=NULL_VALUES,
+                strings_can_be_null=True,
+            ),
+        )
+
+        batches = []
+        rows = 0
+        start = 0
+        for batch in reader:
+            batches.append(batch)
+            rows += batch.num_rows
+            while chunk_size is not None and rows >= chunk_size:
+                table = pa.Table.from_batches(batches, reader.schema)
+                yield self._to_frame(
+                    table.slice(0, chunk_size), start, skip_initial_space
+                )
+                batches = table.slice(chunk_size).to_batches()
+                rows -= chunk_size
+                start += chunk_size
+
+        if rows or chunk_size is None:
+            table = pa.Table.from_batches(batches, reader.schema)
+            yield self._to_frame(table, start, skip_initial_space)
+
+    def _to_frame(
+        self, table: "pa.Table", start: int, skip_initial_space: bool
+    ) -> pd.DataFrame:
+        """Convert a table of string columns to a raw frame."""
+        if skip_initial_space:
+            columns = []
+            for column in table.columns:
+                column = pc.utf8_ltrim_whitespace(column)
+                missing = pc.is_in(column, value_set=self._nulls)
+                columns.append(
+                    pc.if_else(missing, pa.scalar(None, pa.string()), column)
+                )
+            table = pa.table(columns, names=table.column_names)
+
+        frame = table.to_pandas()
+        frame.index = pd.RangeIndex(start, start + len(frame))
+        return frame.where(frame.notna(), np.nan)
+
+
+def get_csv_engine(name: str = "pandas") -> CsvEngine:
+    """Get a CSV engine by setting name.
+
+    ``pyarrow`` falls back to pandas if pyarrow is not installed;
+    ``auto`` uses pyarrow when it is available.
+    """
+    if name not in CSV_ENGINES:
+        raise ValueError(f"Unknown CSV engine {name!r}; use one of {CSV_ENGINES}")
+    if name != "pandas" and pa is not None:
+        return ArrowCsvEngine()
+    if name == "pyarrow":
+        logger.warning("pyarrow is not installed; using the pandas CSV engine")
+    return PandasCsvEngine()
+
+
+# EOF
@@ -6,22 +6,206 @@ Data loading and validation service.
 """
 
 import logging
+import multiprocessing
+import re
+import sys
+import tracemalloc
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack, closing
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 import pandas as pd
+from pandas.api.types import (
+    infer_dtype,
+    is_bool_dtype,
+    is_float_dtype,
+    is_integer_dtype,
+)
 
-from ..models import Article, Project, PickingOrder
+from ..models import Article, Project, PickingOrder, StatusEnum
+from .article_delta import (
+    KEY_FIELDS,
+    PROGRESS_FIELDS,
+    ArticleDelta,
+    LineKey,
+    line_key,
+)
+from .csv_engines import get_csv_engine
+from .ingestion_pipeline import (
+    Batches,
+    FrameBatch,
+    GroupStage,
+    IngestionPipeline,
+    SourceStage,
+    Stage,
+)
+from .json_stream import iter_json_array
+from .parse_cache import ParseCache
+from .quarantine import Quarantine, QuarantinedRow, field_errors
+from .row_validation import (
+    ARTICLE_FIELDS,
+    ParallelValidator,
+    RowErrors,
+    article_from_values,
+    article_values,
+    gc_paused,
+)
+from .source_files import SourceFile, SourceSpec, expand_sources
+from .trusted_parsing import TrustedArticleBuilder, values_from_record
 
 logger = logging.getLogger(__name__)
 
+# MARK: ━━━ CSV Field Groups ━━━
+
+NUMERIC_FIELDS = [
+    "menge",
+    "bestand",
+    "position",
+    "vorgang_id",
+    "anzahl_aktion",
+]
+
+OPTIONAL_NUMERIC_FIELDS = [
+    "anzahl_auf_wagen",
+    "anzahl_fehlt",
+    "anzahl_beschaedigt",
+]
+
+STRING_FIELDS = [
+    "projekt_nr",
+    "abteilungsgruppe",
+    "kostenstelle",
+    "baugruppe",
+    "artikel",
+    "artikel_bezeichnung",
+    "einheit",
+    "lagerplatz",
+    "filter",
+    "wohin",
+    "lz",
+    "lager_1_stueckliste",
+    "lager_2_bedarfslager",
+    "lager_3_referenzen",
+    "status",
+    "bearbeitungsart",
+    "kommisionierer",
+    "materialwagen",
+]
+
+# String fields with a handful of distinct values across an export. They
+# are interned, so all articles share one copy of each value, and kept
+# as categorical columns in frames.
+CATEGORICAL_FIELDS = [
+    "projekt_nr",
+    "abteilungsgruppe",
+    "kostenstelle",
+    "baugruppe",
+    "einheit",
+    "filter",
+    "wohin",
+    "lz",
+    "lager_1_stueckliste",
+    "lager_2_bedarfslager",
+    "lager_3_referenzen",
+    "bearbeitungsart",
+]
+
+# Data directory used when none is configured.
+DEFAULT_DATA_DIR = "../docs/data"
+
+# Rows read, cleaned and validated per chunk when streaming CSV files.
+DEFAULT_CSV_CHUNK_SIZE = 50_000
+
+# Projects decoded and validated per batch by the JSON pipeline.
+DEFAULT_JSON_BATCH_SIZE = 100
+
+# Counts kept by a CSV parse; rows_read is the sum of the other three.
+CSV_PARSE_STATS = (
+    "rows_read",
+    "articles_parsed",
+    "rows_rejected",
+    "duplicate_rows",
+)
+
+# Plain decimal integers small enough for int64; anything else is parsed
+# per cell with the Python built-ins to keep their exact semantics.
+_INT_PATTERN = r"[+-]?[0-9]{1,18}"
+
+# Bumped whenever the cached payload layout or the parse rules change;
+# the Article field list is part of the version so model changes
+# invalidate old entries.
+_CACHE_FORMAT = 5
+_CACHE_VERSION = f"{_CACHE_FORMAT}:{','.join(Article.model_fields)}"
+
+# Quarantine report IDs are generated file stems; anything else is refused.
+_REPORT_ID_PATTERN = re.compile(r"[A-Za-z0-9_-]+")
+
 
 class DataService:
     """Service for data loading and validation."""
 
-    def __init__(self, data_dir: str = "../docs/data"):
-        """Initialize data service with data directory."""
+    def __init__(
+        self,
+        data_dir: str = DEFAULT_DATA_DIR,
+        chunk_size: int = DEFAULT_CSV_CHUNK_SIZE,
+        cache_dir: Optional[str] = None,
+        validation_workers: int = 0,
+        trusted_sources: Iterable[str] = (),
+        trust_sample_rate: float = 0.01,
+        quarantine_dir: Optional[str] = None,
+        csv_engine: str = "pandas",
+        file_workers: int = 0,
+        trace_memory: bool = False,
+    ):
+        """Initialize data service with data directory.
+
+        ``cache_dir`` enables the parsed-data cache and ``quarantine_dir``
+        the rejected-row reports; relative paths are resolved against
+        the data directory. ``validation_workers`` sets
+        the processes that validate CSV rows; 0 validates in-process.
+        Files named in ``trusted_sources`` are parsed without full
+        validation, checking ``trust_sample_rate`` of their rows.
+        ``csv_engine`` selects the CSV reader (see ``get_csv_engine``).
+        ``file_workers`` sets the processes that parse the files of a
+        multi-file ingest in parallel; 0 parses them in-process.
+        ``trace_memory`` starts ``tracemalloc``, so that ingestion
+        pipelines report traced peak memory per stage instead of the
+        resident set size; tracing slows allocation-heavy parsing.
+        """
         self.data_dir = Path(data_dir)
+        self.chunk_size = chunk_size
+        self.csv_engine = get_csv_engine(csv_engine)
         self._validate_data_directory()
+        self.cache: Optional[ParseCache] = None
+        if cache_dir:
+            self.cache = ParseCache(self.data_dir / cache_dir)
+        self.validator: Optional[ParallelValidator] = None
+        if validation_workers:
+            self.validator = ParallelValidator(validation_workers)
+        self.trusted_sources = set(trusted_sources)
+        self.trust_sample_rate = trust_sample_rate
+        self.quarantine_dir: Optional[Path] = None
+        if quarantine_dir:
+            self.quarantine_dir = self.data_dir / quarantine_dir
+        self.file_workers = file_workers
+        self._file_executor: Optional[ProcessPoolExecutor] = None
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
 
     def _validate_data_directory(self) -> None:
         """Validate that data directory exists."""
@@ -44,9 +228,8 @@ class DataService:
 
         try:
             logger.info(f"Loading CSV data from {filename}")
-            df = pd.read_csv(file_path, sep="|", skipinitialspace=True)
-            df.columns = df.columns.str.strip()
-            data = df.to_dict("records")
+            df = self._read_csv_frame(file_path)
+            data: List[Dict[str, Any]] = df.to_dict("records")
             logger.info(f"Loaded {len(data)} records from {filename}")
             return data
         except Exception as e:
@@ -64,132 +247,733 @@ class DataService:
             with open(file_path, "r", encoding="utf-8") as f:
                 import json
 
-                data = json.load(f)
+                data: Dict[str, Any] = json.load(f)
             logger.info(f"Loaded JSON data from {filename}")
             return data
         except Exception as e:
             logger.error(f"Error loading JSON file {filename}: {e}")
             raise
 
-    def parse_csv_articles(self, filename: str = "orig.csv") -> List[Article]:
-        """Parse CSV data into Article objects."""
-        raw_data = self.load_csv_data(filename)
-        articles = []
+    def parse_csv_articles(
+        self,
+        filename: str = "orig.csv",
+        progress: Optional[Callable[[int, int], None]] = None,
+        trusted: Optional[bool] = None,
+        quarantine: Optional[Quarantine] = None,
+    ) -> List[Article]:
+        """Parse CSV data into Article objects, using the cache if set.
 
-        for row in raw_data:
-            try:
-                cleaned_row = self._clean_row_data(row)
-                article = Article(**cleaned_row)
-                articles.append(article)
-            except Exception as e:
-                logger.warning(f"Failed to parse row: {e}")
-                continue
+        ``trusted`` defaults to whether the file is a trusted source.
+        Rejected rows are collected in ``quarantine``; without one, they
+        are reported when the parse ends.
+        """
+        if trusted is None:
+            trusted = self.is_trusted(filename)
+        source = self._resolve_source(filename)
+        version = self._cache_version(trusted, self.csv_engine.name)
+        cached = self._load_cached(source, "csv_articles", version)
+        if cached is not None:
+            return _articles_from_columns(cached)
+
+        articles = list(
+            self.iter_csv_articles(
+                filename,
+                progress=progress,
+                trusted=trusted,
+                quarantine=quarantine,
+            )
+        )
+        self._store_cached(
+            source, "csv_articles", version, _articles_to_columns(articles)
+        )
 
         logger.info(f"Successfully parsed {len(articles)} articles from CSV")
         return articles
 
+    def iter_csv_articles(
+        self,
+        path: Any = "orig.csv",
+        chunk_size: Optional[int] = None,
+        delimiter: str = "|",
+        skip_initial_space: bool = True,
+        stats: Optional[Dict[str, int]] = None,
+        progress: Optional[Callable[[int, int], None]] = None,
+        trusted: bool = False,
+        quarantine: Optional[Quarantine] = None,
+    ) -> Iterator[Article]:
+        """Stream validated articles from a CSV file chunk by chunk."""
+        for batch in self.iter_csv_batches(
+            path,
+            chunk_size,
+            delimiter,
+            skip_initial_space,
+            stats,
+            progress,
+            trusted,
+            quarantine,
+        ):
+            yield from batch
+
+    def iter_csv_batches(
+        self,
+        path: Any = "orig.csv",
+        chunk_size: Optional[int] = None,
+        delimiter: str = "|",
+        skip_initial_space: bool = True,
+        stats: Optional[Dict[str, int]] = None,
+        progress: Optional[Callable[[int, int], None]] = None,
+        trusted: bool = False,
+        quarantine: Optional[Quarantine] = None,
+    ) -> Iterator[List[Article]]:
+        """Read, clean and validate a CSV file in bounded-size chunks.
+
+        ``path`` is a file name relative to the data directory, an
+        absolute path or an open file object. Only one chunk of raw rows
+        is held in memory at a time. If a line key (projekt_nr,
+        position, vorgang_id) occurs more than once in the file, its
+        first line wins and the others are dropped as duplicates. If
+        ``stats`` is given, it is updated with ``rows_read``,
+        ``articles_parsed``, ``rows_rejected`` and ``duplicate_rows``;
+        ``progress`` is called with the rows read and rejected so far
+        after each chunk. ``trusted`` builds articles without full
+        validation, checking a sample of rows. Rejected rows go to
+        ``quarantine``; without one, they are reported at the end.
+        """
+        source = self._resolve_source(path)
+        report = quarantine is None
+        if quarantine is None:
+            quarantine = Quarantine(_source_name(path))
+        if stats is None:
+            stats = {}
+        for key in CSV_PARSE_STATS:
+            stats.setdefault(key, 0)
+
+        logger.info(f"Streaming CSV data from {path}")
+        pipeline = self.csv_pipeline(
+            delimiter,
+            skip_initial_space,
+            chunk_size,
+            stats,
+            progress,
+            trusted,
+            quarantine,
+            orders=False,
+        )
+        yield from pipeline.stream(source)
+        pipeline.log_summary()
+
+        if report:
+            self.report_quarantine(quarantine)
+
+    def csv_pipeline(
+        self,
+        delimiter: str = "|",
+        skip_initial_space: bool = True,
+        chunk_size: Optional[int] = None,
+        stats: Optional[Dict[str, int]] = None,
+        progress: Optional[Callable[[int, int], None]] = None,
+        trusted: bool = False,
+        quarantine: Optional[Quarantine] = None,
+        orders: bool = True,
+    ) -> IngestionPipeline:
+        """Build the pipeline that turns a CSV source into picking orders.
+
+        The read, clean and validate stages stream chunks of rows as
+        described for ``iter_csv_batches``, updating ``stats`` and
+        calling ``progress``. The group and prioritize stages (see
+        ``order_stages``) then make one picking order per project;
+        without ``orders``, the pipeline ends with the chunks of
+        validated articles. Run it on a path or binary file.
+        """
+        if stats is None:
+            stats = {}
+        for key in CSV_PARSE_STATS:
+            stats.setdefault(key, 0)
+        builder = self._trusted_builder() if trusted else None
+        seen: Set[LineKey] = set()
+
+        def read(source: Any) -> Batches:
+            return self.csv_engine.read_chunks(
+                source,
+                delimiter,
+                skip_initial_space,
+                chunk_size or self.chunk_size,
+            )
+
+        def clean(raw: pd.DataFrame) -> FrameBatch:
+            return FrameBatch(raw, self._clean_frame(raw))
+
+        def validate(batch: FrameBatch) -> List[Article]:
+            articles = self._validate_frame(
+                batch.cleaned, batch.raw, builder, quarantine
+            )
+            valid = len(articles)
+            articles = _drop_duplicate_lines(articles, seen)
+            stats["rows_read"] += len(batch)
+            stats["articles_parsed"] += len(articles)
+            stats["rows_rejected"] += len(batch) - valid
+            stats["duplicate_rows"] += valid - len(articles)
+            if progress:
+                progress(stats["rows_read"], stats["rows_rejected"])
+            return articles
+
+        def finish_validation() -> None:
+            if stats["duplicate_rows"]:
+                logger.warning(
+                    f"Dropped {stats['duplicate_rows']} duplicate lines"
+                )
+            if builder is not None:
+                logger.info(f"Trusted parse: {builder.report.summary()}")
+
+        stages = [
+            SourceStage("read", read),
+            Stage("clean", clean),
+            Stage("validate", validate, finish_validation),
+        ]
+        if orders:
+            stages.extend(self.order_stages())
+        return IngestionPipeline("csv", stages)
+
+    def json_pipeline(
+        self,
+        trusted: bool = False,
+        quarantine: Optional[Quarantine] = None,
+        batch_size: int = DEFAULT_JSON_BATCH_SIZE,
+    ) -> IngestionPipeline:
+        """Build the pipeline that turns project JSON into picking orders.
+
+        The read stage decodes ``batch_size`` projects of the
+        ``projects`` array at a time from a binary file; validate turns
+        them into Projects, quarantining rejected articles and projects,
+        and ``order_stages`` follow.
+        """
+        builder = self._trusted_builder() if trusted else None
+
+        def read(stream: BinaryIO) -> Batches:
+            items = iter_json_array(stream, "projects")
+            while True:
+                batch = list(islice(items, batch_size))
+                if not batch:
+                    return
+                yield batch
+
+        def validate(batch: List[Dict[str, Any]]) -> List[Project]:
+            projects = (
+                self._project_from_data(data, builder, quarantine)
+                for data in batch
+            )
+            return [project for project in projects if project is not None]
+
+        return IngestionPipeline(
+            "json",
+            [
+                SourceStage("read", read),
+                Stage("validate", validate),
+                *self.order_stages(),
+            ],
+        )
+
+    def order_stages(self) -> List[Stage]:
+        """Get the stages that turn articles or projects into orders.
+
+        ``group`` collects the input into one project per project number
+        and ``prioritize`` makes a picking order of each project.
+        """
+        return [
+            GroupStage("group"),
+            Stage("prioritize", self.create_picking_orders),
+        ]
+
+    def diff_csv_export(
+        self,
+        path: Any,
+        baseline: Mapping[LineKey, int],
+        chunk_size: Optional[int] = None,
+        delimiter: str = "|",
+        skip_initial_space: bool = True,
+        progress: Optional[Callable[[int, int], None]] = None,
+        quarantine: Optional[Quarantine] = None,
+    ) -> ArticleDelta:
+        """Diff a CSV export against the line hashes of the loaded state.
+
+        Lines are keyed on (projekt_nr, position, vorgang_id) and compared
+        by a hash of their cleaned non-progress fields, computed column-wise
+        per chunk. Only inserted and changed lines are validated into
+        Articles; keys missing from the export become removals. If a key
+        occurs more than once, its first line wins. ``progress`` is
+        called with the rows read and rejected so far after each chunk.
+        Rejected lines go to ``quarantine``, or are reported at the end.
+        """
+        source = self._resolve_source(path)
+        report = quarantine is None
+        if quarantine is None:
+            quarantine = Quarantine(_source_name(path))
+        delta = ArticleDelta()
+        hashes = delta.hashes
+
+        logger.info(f"Diffing CSV export {path}")
+        reader = self.csv_engine.read_chunks(
+            source, delimiter, skip_initial_space, chunk_size or self.chunk_size
+        )
+        with closing(reader):
+            for raw in reader:
+                cleaned = self._clean_frame(raw)
+                keys = zip(*(cleaned[name].tolist() for name in KEY_FIELDS))
+                row_hashes = _content_hashes(cleaned).tolist()
+
+                changed = []
+                for row, (key, row_hash) in enumerate(zip(keys, row_hashes)):
+                    if key in hashes:
+                        delta.duplicate_keys += 1
+                        continue
+                    hashes[key] = row_hash
+                    if baseline.get(key) != row_hash:
+                        changed.append(row)
+
+                changed_rows = cleaned.iloc[changed]
+                keys = zip(
+                    *(changed_rows[name].tolist() for name in KEY_FIELDS)
+                )
+                articles = self._validate_rows(
+                    changed_rows, raw.iloc[changed], quarantine
+                )
+                for key, article in zip(keys, articles):
+                    if article is None:
+                        delta.rows_rejected += 1
+                        # Keep a loaded line as it is rather than drop it
+                        if key in baseline:
+                            hashes[key] = baseline[key]
+                        else:
+                            del hashes[key]
+                        continue
+                    if key in baseline:
+                        delta.updates.append(article)
+                    else:
+                        delta.inserts.append(article)
+                delta.rows_read += len(raw)
+                if progress:
+                    progress(delta.rows_read, delta.rows_rejected)
+
+        delta.removals = [key for key in baseline if key not in hashes]
+        logger.info(f"CSV export diff: {delta.summary()}")
+        if report:
+            self.report_quarantine(quarantine)
+        return delta
+
+    def diff_json_export(
+        self,
+        filename: Any,
+        baseline: Mapping[LineKey, int],
+        quarantine: Optional[Quarantine] = None,
+    ) -> ArticleDelta:
+        """Diff a JSON project export against the loaded line hashes.
+
+        Works like ``diff_csv_export``, but JSON articles are validated
+        while their projects are parsed, so the hashes are taken from
+        the validated articles of all projects.
+        """
+        report = quarantine is None
+        if quarantine is None:
+            quarantine = Quarantine(_source_name(filename))
+        rejected_before = len(quarantine)
+        delta = ArticleDelta()
+        hashes = delta.hashes
+
+        logger.info(f"Diffing JSON export {filename}")
+        projects = self.parse_json_projects(filename, quarantine=quarantine)
+        articles = [
+            article for project in projects for article in project.articles
+        ]
+        frame = _articles_to_frame(articles)
+        keys = zip(*(frame[name].tolist() for name in KEY_FIELDS))
+        row_hashes = _content_hashes(frame).tolist()
+
+        for article, key, row_hash in zip(articles, keys, row_hashes):
+            if key in hashes:
+                delta.duplicate_keys += 1
+                continue
+            hashes[key] = row_hash
+            if key not in baseline:
+                delta.inserts.append(article)
+            elif baseline[key] != row_hash:
+                delta.updates.append(article)
+
+        delta.rows_rejected = len(quarantine) - rejected_before
+        delta.rows_read = len(articles) + delta.rows_rejected
+        delta.removals = [key for key in baseline if key not in hashes]
+        logger.info(f"JSON export diff: {delta.summary()}")
+        if report:
+            self.report_quarantine(quarantine)
+        return delta
+
+    def _resolve_source(self, path: Any) -> Any:
+        """Resolve a CSV source to an existing path or pass a file through."""
+        if hasattr(path, "read"):
+            return path
+
+        file_path = Path(path)
+        if not file_path.is_absolute():
+            file_path = self.data_dir / file_path
+        if not file_path.exists():
+            raise FileNotFoundError(f"CSV file not found: {file_path}")
+        return file_path
+
+    def iter_json_projects(
+        self,
+        path: Any = "project.json",
+        trusted: Optional[bool] = None,
+        quarantine: Optional[Quarantine] = None,
+    ) -> Iterator[Project]:
+        """Stream the projects of a JSON file one at a time.
+
+        ``path`` is a file name relative to the data directory, an
+        absolute path or a binary file object. The ``projects`` array is
+        decoded item by item, so only the raw data of the current
+        project is held in memory. ``trusted`` defaults to whether the
+        file is a trusted source. Rejected articles and projects go to
+        ``quarantine``; without one, they are reported at the end.
+        """
+        if trusted is None:
+            trusted = self.is_trusted(path)
+        builder = self._trusted_builder() if trusted else None
+        report = quarantine is None
+        if quarantine is None:
+            quarantine = Quarantine(_source_name(path))
+
+        logger.info(f"Streaming JSON projects from {path}")
+        with ExitStack() as stack:
+            stream = path
+            if not hasattr(path, "read"):
+                file_path = self.data_dir / path
+                if not file_path.exists():
+                    raise FileNotFoundError(
+                        f"JSON file not found: {file_path}"
+                    )
+                stream = stack.enter_context(open(file_path, "rb"))
+
+            for project_data in iter_json_array(stream, "projects"):
+                project = self._project_from_data(
+                    project_data, builder, quarantine
+                )
+                if project is not None:
+                    yield project
+
+        if builder is not None:
+            logger.info(
+                f"Trusted parse of {path}: {builder.report.summary()}"
+            )
+        if report:
+            self.report_quarantine(quarantine)
+
+    def _project_from_data(
+        self,
+        project_data: Dict[str, Any],
+        builder: Optional[TrustedArticleBuilder],
+        quarantine: Optional[Quarantine],
+    ) -> Optional[Project]:
+        """Create a project from JSON data; None if it is quarantined."""
+        try:
+            return self._create_project_from_data(
+                project_data, builder, quarantine
+            )
+        except Exception as e:
+            if quarantine is not None:
+                quarantine.add(
+                    None,
+                    e,
+                    {
+                        name: value
+                        for name, value in project_data.items()
+                        if name != "articles"
+                    },
+                )
+            return None
+
     def parse_json_projects(
-        self, filename: str = "project.json"
+        self,
+        filename: str = "project.json",
+        trusted: Optional[bool] = None,
+        quarantine: Optional[Quarantine] = None,
     ) -> List[Project]:
-        """Parse JSON data into Project objects."""
-        raw_data = self.load_json_data(filename)
-        projects = []
+        """Parse JSON data into Project objects, using the cache if set.
 
-        for project_data in raw_data.get("projects", []):
-            try:
-                project = self._create_project_from_data(project_data)
-                projects.append(project)
-            except Exception as e:
-                logger.warning(f"Failed to parse project: {e}")
-                continue
+        ``trusted`` defaults to whether the file is a trusted source.
+        Rejected articles and projects are collected in ``quarantine``;
+        without one, they are reported when the parse ends.
+        """
+        if trusted is None:
+            trusted = self.is_trusted(filename)
+        source = self.data_dir / filename
+        version = self._cache_version(trusted)
+        cached = (
+            self._load_cached(source, "json_projects", version)
+            if source.exists()
+            else None
+        )
+        if cached is not None:
+            return _projects_from_payload(cached)
+
+        projects = list(
+            self.iter_json_projects(filename, trusted, quarantine)
+        )
+
+        self._store_cached(
+            source, "json_projects", version, _projects_to_payload(projects)
+        )
 
         logger.info(f"Successfully parsed {len(projects)} projects from JSON")
         return projects
 
-    def _clean_row_data(self, row: Dict[str, Any]) -> Dict[str, Any]:
-        """Clean and convert row data for Article creation."""
+    # MARK: ━━━ Multi-File Ingestion ━━━
+
+    def parse_sources(
+        self,
+        sources: Union[SourceSpec, Iterable[SourceSpec]],
+        stats: Optional[Dict[str, int]] = None,
+        quarantine: Optional[Quarantine] = None,
+        delimiter: str = "|",
+        skip_initial_space: bool = True,
+    ) -> List[Project]:
+        """Parse several data files into projects merged by projekt_nr.
+
+        ``sources`` are file names, glob patterns and zip or gzip
+        archives of CSV and JSON files (see ``expand_sources``). Every
+        file is decompressed and parsed as a stream; with
+        ``file_workers``, files are parsed in parallel worker processes.
+        The merge follows the source order, whatever order the workers
+        finish in: a project sits where it first appears and its
+        articles follow the order of the files. ``stats`` is updated
+        with ``files`` and the counts of ``iter_csv_batches``. Rejected
+        rows go to ``quarantine``, marked with their file; without one,
+        they are reported at the end. ``delimiter`` and
+        ``skip_initial_space`` apply to CSV files.
+        """
+        files = expand_sources(sources, self.data_dir)
+        report = quarantine is None
+        if quarantine is None:
+            quarantine = Quarantine(
+                _source_name(sources)
+                if isinstance(sources, (str, Path))
+                else "sources"
+            )
+        if stats is None:
+            stats = {}
+        for key in ("files", *CSV_PARSE_STATS):
+            stats.setdefault(key, 0)
+
+        logger.info(f"Parsing {len(files)} data files")
+        csv_options = [(delimiter, skip_initial_space)] * len(files)
+        if self.file_workers > 1 and len(files) > 1:
+            options = [self._worker_options()] * len(files)
+            parsed = (
+                (_unpack_projects(packed), rows, file_stats)
+                for packed, rows, file_stats in self._file_pool().map(
+                    _parse_source_in_worker, options, files, csv_options
+                )
+            )
+        else:
+            parsed = (
+                (projects, file_quarantine.rows, file_stats)
+                for projects, file_quarantine, file_stats in map(
+                    self._parse_source, files, csv_options
+                )
+            )
+
+        merged: Dict[str, List[Article]] = {}
+        for projects, rows, file_stats in parsed:
+            for project in projects:
+                merged.setdefault(project.projekt_nr, []).extend(
+                    project.articles
+                )
+            quarantine.rows.extend(rows)
+            stats["files"] += 1
+            for key, value in file_stats.items():
+                stats[key] += value
+
+        projects = [
+            Project(projekt_nr=projekt_nr, articles=articles)
+            for projekt_nr, articles in merged.items()
+        ]
+        logger.info(
+            f"Merged {len(projects)} projects from {len(files)} files: "
+            f"{stats}"
+        )
+        if report:
+            self.report_quarantine(quarantine)
+        return projects
+
+    def _parse_source(
+        self, source: SourceFile, csv_options: Tuple[str, bool] = ("|", True)
+    ) -> Tuple[List[Project], Quarantine, Dict[str, int]]:
+        """Parse a single source file with its own quarantine."""
+        quarantine = Quarantine(source.name)
+        trusted = self.is_trusted(source.name)
+        with source.open() as stream:
+            if source.kind == "json":
+                projects = list(
+                    self.iter_json_projects(stream, trusted, quarantine)
+                )
+                articles = sum(len(p.articles) for p in projects)
+                stats = {
+                    "rows_read": articles + len(quarantine),
+                    "articles_parsed": articles,
+                    "rows_rejected": len(quarantine),
+                }
+            else:
+                stats = {}
+                delimiter, skip_initial_space = csv_options
+                projects = self._create_projects_from_articles(
+                    self.iter_csv_articles(
+                        stream,
+                        delimiter=delimiter,
+                        skip_initial_space=skip_initial_space,
+                        stats=stats,
+                        trusted=trusted,
+                        quarantine=quarantine,
+                    )
+                )
+        return projects, quarantine, stats
+
+    def _worker_options(self) -> Dict[str, Any]:
+        """Get the options to rebuild this service in a worker process."""
+        return {
+            "data_dir": str(self.data_dir),
+            "chunk_size": self.chunk_size,
+            "trusted_sources": sorted(self.trusted_sources),
+            "trust_sample_rate": self.trust_sample_rate,
+            "csv_engine": self.csv_engine.name,
+        }
+
+    def _file_pool(self) -> ProcessPoolExecutor:
+        """Get the file worker pool, starting it if needed."""
+        if self._file_executor is None:
+            logger.info(f"Starting {self.file_workers} file workers")
+            self._file_executor = ProcessPoolExecutor(
+                max_workers=self.file_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._file_executor
+
+    # MARK: ━━━ Parsed-Data Cache ━━━
+
+    @staticmethod
+    def _cache_version(trusted: bool, engine: str = "") -> str:
+        """Get the cache version for the settings that change parse output.
+
+        Trusted parsing skips per-row validation, and the CSV engines
+        may differ in edge cases, so their results are never mixed.
+        """
+        mode = "trusted" if trusted else "validated"
+        return f"{_CACHE_VERSION}:{mode}:{engine}"
+
+    def _load_cached(
+        self, source: Path, kind: str, version: str
+    ) -> Optional[Any]:
+        """Get a cached payload for a source file, if caching is enabled."""
+        if self.cache is None:
+            return None
+        return self.cache.load(source, kind, version)
+
+    def _store_cached(
+        self, source: Path, kind: str, version: str, payload: Any
+    ) -> None:
+        """Store a parsed payload for a source file, if caching is enabled."""
+        if self.cache is not None:
+            self.cache.store(source, kind, version, payload)
+
+    def invalidate_cache(self, filename: Optional[str] = None) -> int:
+        """Drop cached parse results for one file, or for all files.
+
+        Returns the number of removed cache entries.
+        """
+        if self.cache is None:
+            return 0
+        source = None if filename is None else self.data_dir / filename
+        return self.cache.invalidate(source)
+
+    def _read_csv_frame(
+        self,
+        file_path: Any,
+        delimiter: str = "|",
+        skip_initial_space: bool = True,
+    ) -> pd.DataFrame:
+        """Read a CSV file into a DataFrame with stripped column names."""
+        return self.csv_engine.read_frame(
+            file_path, delimiter, skip_initial_space
+        )
+
+    def _clean_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Clean and convert raw CSV columns for Article creation.
+
+        Invalid weights become 0.0, invalid required numbers 0, invalid
+        or empty optional numbers None, and string fields are stripped
+        ("" when the column is missing). Categorical fields are interned
+        and dictionary-encoded.
+        """
         cleaned = {}
 
         # Handle weight conversion (comma to dot)
-        if "gewicht" in row:
-            weight_str = str(row["gewicht"]).replace(",", ".")
-            try:
-                cleaned["gewicht"] = float(weight_str)
-            except ValueError:
-                cleaned["gewicht"] = 0.0
+        if "gewicht" in df.columns:
+            cleaned["gewicht"] = _to_float_column(df["gewicht"])
 
         # Handle numeric fields
-        numeric_fields = [
-            "menge",
-            "bestand",
-            "position",
-            "vorgang_id",
-            "anzahl_aktion",
-        ]
-        for field in numeric_fields:
-            if field in row:
-                try:
-                    cleaned[field] = int(str(row[field]).strip())
-                except (ValueError, TypeError):
-                    cleaned[field] = 0
+        for field in NUMERIC_FIELDS:
+            if field in df.columns:
+                cleaned[field] = _to_int_column(df[field], default=0)
 
         # Handle optional fields
-        optional_fields = [
-            "anzahl_auf_wagen",
-            "anzahl_fehlt",
-            "anzahl_beschaedigt",
-        ]
-        for field in optional_fields:
-            if field in row and row[field]:
-                try:
-                    cleaned[field] = int(str(row[field]).strip())
-                except (ValueError, TypeError):
-                    cleaned[field] = None
+        for field in OPTIONAL_NUMERIC_FIELDS:
+            if field in df.columns:
+                column = df[field]
+                values = _to_int_column(column, default=None)
+                values[~column.astype(bool)] = None
+                cleaned[field] = values
             else:
-                cleaned[field] = None
+                cleaned[field] = pd.Series(
+                    [None] * len(df), index=df.index, dtype=object
+                )
 
         # Handle string fields
-        string_fields = [
-            "projekt_nr",
-            "abteilungsgruppe",
-            "kostenstelle",
-            "baugruppe",
-            "artikel",
-            "artikel_bezeichnung",
-            "einheit",
-            "lagerplatz",
-            "filter",
-            "wohin",
-            "lz",
-            "lager_1_stueckliste",
-            "lager_2_bedarfslager",
-            "lager_3_referenzen",
-            "status",
-            "bearbeitungsart",
-            "kommisionierer",
-            "materialwagen",
-        ]
-
-        for field in string_fields:
-            if field in row:
-                cleaned[field] = str(row[field]).strip()
+        for field in STRING_FIELDS:
+            if field in CATEGORICAL_FIELDS and field in df.columns:
+                cleaned[field] = _to_category_column(df[field])
+            elif field in df.columns:
+                cleaned[field] = _map_distinct(df[field], _strip_values)
             else:
-                cleaned[field] = ""
+                cleaned[field] = pd.Series("", index=df.index, dtype=object)
 
-        return cleaned
+        return pd.DataFrame(cleaned, index=df.index)
 
     def _create_project_from_data(
-        self, project_data: Dict[str, Any]
+        self,
+        project_data: Dict[str, Any],
+        builder: Optional[TrustedArticleBuilder] = None,
+        quarantine: Optional[Quarantine] = None,
     ) -> Project:
-        """Create Project object from project data."""
+        """Create Project object from project data.
+
+        Invalid articles are skipped and collected in ``quarantine``.
+        """
+        if builder is not None:
+            articles = self._build_trusted(
+                project_data.get("articles", []), builder, quarantine
+            )
+            if articles is not None:
+                return Project(
+                    projekt_nr=project_data["projekt_nr"], articles=articles
+                )
+
         articles = []
 
-        for article_data in project_data.get("articles", []):
+        for position, article_data in enumerate(
+            project_data.get("articles", []), start=1
+        ):
             try:
-                article = Article(**article_data)
+                article = Article(**_intern_fields(article_data))
                 articles.append(article)
             except Exception as e:
-                logger.warning(f"Failed to parse article in project: {e}")
+                if quarantine is not None:
+                    quarantine.add(position, e, article_data)
                 continue
 
         return Project(
@@ -197,25 +981,31 @@ class DataService:
         )
 
     def create_picking_orders(
-        self, projects: List[Project]
+        self, projects: Iterable[Project]
     ) -> List[PickingOrder]:
         """Create picking orders from projects."""
-        orders = []
+        orders = list(self.iter_picking_orders(projects))
+        logger.info(f"Created {len(orders)} picking orders")
+        return orders
 
-        for i, project in enumerate(projects):
-            order_id = f"ORDER-{project.projekt_nr}-{i+1:03d}"
+    def iter_picking_orders(
+        self, projects: Iterable[Project]
+    ) -> Iterator[PickingOrder]:
+        """Create a picking order for each project as it arrives.
 
-            order = PickingOrder(
-                order_id=order_id,
+        Accepts a stream such as ``iter_json_projects``, so orders are
+        created while the rest of the file is still being parsed. Order
+        IDs are derived from the project number (see
+        ``picking_order_id``), so a project gets the same ID whatever
+        order the data is loaded in.
+        """
+        for project in projects:
+            yield PickingOrder(
+                order_id=picking_order_id(project.projekt_nr),
                 project=project,
                 priority=self._calculate_priority(project),
             )
 
-            orders.append(order)
-
-        logger.info(f"Created {len(orders)} picking orders")
-        return orders
-
     def _calculate_priority(self, project: Project) -> int:
         """Calculate priority based on project characteristics."""
         weight_factor = min(project.total_weight / 100, 5)
@@ -267,9 +1057,8 @@ class DataService:
         """Load data from CSV file at specific path."""
         try:
             logger.info(f"Loading CSV data from {file_path}")
-            df = pd.read_csv(file_path, sep=delimiter, skipinitialspace=skip_initial_space)
-            df.columns = df.columns.str.strip()
-            data = df.to_dict("records")
+            df = self._read_csv_frame(file_path, delimiter, skip_initial_space)
+            data: List[Dict[str, Any]] = df.to_dict("records")
             logger.info(f"Loaded {len(data)} records from {file_path}")
             return data
         except Exception as e:
@@ -278,37 +1067,493 @@ class DataService:
 
     def _parse_csv_articles_from_data(self, raw_data: List[Dict[str, Any]]) -> List[Article]:
         """Parse raw CSV data into Article objects."""
-        articles = []
-
-        for row in raw_data:
-            try:
-                cleaned_row = self._clean_row_data(row)
-                article = Article(**cleaned_row)
-                articles.append(article)
-            except Exception as e:
-                logger.warning(f"Failed to parse row: {e}")
-                continue
+        quarantine = Quarantine("CSV data")
+        articles = self._parse_csv_articles_from_frame(
+            pd.DataFrame(raw_data), quarantine=quarantine
+        )
+        self.report_quarantine(quarantine)
 
         logger.info(f"Successfully parsed {len(articles)} articles from CSV data")
         return articles
 
-    def _create_projects_from_articles(self, articles: List[Article]) -> List[Project]:
-        """Create projects from articles by grouping by project number."""
+    def _parse_csv_articles_from_frame(
+        self,
+        df: pd.DataFrame,
+        builder: Optional[TrustedArticleBuilder] = None,
+        quarantine: Optional[Quarantine] = None,
+    ) -> List[Article]:
+        """Clean a raw CSV frame and validate its rows into Articles.
+
+        With a trusted builder, rows are constructed and only a sample
+        is validated, unless the sample shows drift. Rejected rows are
+        collected in ``quarantine`` with their raw values.
+        """
+        return self._validate_frame(
+            self._clean_frame(df), df, builder, quarantine
+        )
+
+    def _validate_frame(
+        self,
+        cleaned: pd.DataFrame,
+        raw: pd.DataFrame,
+        builder: Optional[TrustedArticleBuilder] = None,
+        quarantine: Optional[Quarantine] = None,
+    ) -> List[Article]:
+        """Validate the rows of a cleaned frame into Articles."""
+        articles = None
+        if builder is not None and set(ARTICLE_FIELDS) <= set(cleaned):
+            values = list(
+                zip(*(cleaned[name].tolist() for name in ARTICLE_FIELDS))
+            )
+            rejected: List[RowErrors] = []
+            articles = builder.build(
+                values,
+                lambda position, e: rejected.append(
+                    (position, field_errors(e))
+                ),
+            )
+            if articles is not None:
+                _quarantine_rows(quarantine, raw, rejected)
+        if articles is None:
+            articles = self._validate_rows(cleaned, raw, quarantine)
+        return [article for article in articles if article is not None]
+
+    def _validate_rows(
+        self,
+        cleaned: pd.DataFrame,
+        raw: pd.DataFrame,
+        quarantine: Optional[Quarantine],
+    ) -> List[Optional[Article]]:
+        """Validate cleaned rows in order, None for each rejected row.
+
+        Rejected rows are quarantined with their values from ``raw``.
+        """
+        if self.validator is not None:
+            columns = list(cleaned.columns)
+            rows = list(zip(*(cleaned[name].tolist() for name in columns)))
+            articles, rejected = self.validator.validate(columns, rows)
+            _quarantine_rows(quarantine, raw, rejected)
+            return articles
+
+        articles = []
+        rejected = []
+        with gc_paused():
+            for position, row in enumerate(_frame_records(cleaned)):
+                try:
+                    articles.append(Article(**row))
+                except Exception as e:
+                    articles.append(None)
+                    rejected.append((position, field_errors(e)))
+        _quarantine_rows(quarantine, raw, rejected)
+        return articles
+
+    # MARK: ━━━ Rejected-Row Quarantine ━━━
+
+    def report_quarantine(self, quarantine: Quarantine) -> Optional[str]:
+        """Write a quarantine report and log a single summary line.
+
+        The report is written as JSON Lines to the quarantine directory,
+        if one is set. Returns its report ID, or None if no row was
+        rejected or no report was written.
+        """
+        if not quarantine:
+            return None
+
+        if self.quarantine_dir is not None:
+            stem = Path(quarantine.source).stem
+            stem = re.sub(r"[^A-Za-z0-9_-]+", "_", stem)
+            quarantine.report_id = f"{stem}-{uuid.uuid4().hex[:12]}"
+            quarantine.write(self.quarantine_path(quarantine.report_id))
+
+        summary = quarantine.summary()
+        logger.warning(
+            f"Quarantined {summary['rows_rejected']} rows from "
+            f"{quarantine.source}: errors by field "
+            f"{summary['errors_by_field']}, report {quarantine.report_id}"
+        )
+        return quarantine.report_id
+
+    def quarantine_path(self, report_id: str) -> Path:
+        """Get the file of a quarantine report."""
+        if self.quarantine_dir is None:
+            raise FileNotFoundError("Quarantine reports are disabled")
+        if not _REPORT_ID_PATTERN.fullmatch(report_id):
+            raise ValueError(f"Invalid report ID: {report_id}")
+        return self.quarantine_dir / f"{report_id}.jsonl"
+
+    def is_trusted(self, filename: Any) -> bool:
+        """Check whether a data file is a trusted source."""
+        return str(filename) in self.trusted_sources
+
+    def _trusted_builder(self) -> TrustedArticleBuilder:
+        """Create a builder for one trusted parse."""
+        return TrustedArticleBuilder(self.trust_sample_rate)
+
+    def _build_trusted(
+        self,
+        records: List[Dict[str, Any]],
+        builder: TrustedArticleBuilder,
+        quarantine: Optional[Quarantine] = None,
+    ) -> Optional[List[Article]]:
+        """Build articles from trusted JSON records, None on drift."""
+        try:
+            values = [
+                values_from_record(_intern_fields(record))
+                for record in records
+            ]
+        except KeyError as e:
+            logger.warning(f"Trusted record is missing field {e}")
+            return None
+
+        def reject(position: int, error: Exception) -> None:
+            if quarantine is not None:
+                quarantine.add(position + 1, error, records[position])
+
+        articles = builder.build(values, reject)
+        if articles is None:
+            return None
+        return [article for article in articles if article is not None]
+
+    def shutdown(self) -> None:
+        """Stop the worker processes, if any; they restart on next use."""
+        if self.validator is not None:
+            self.validator.shutdown()
+        if self._file_executor is not None:
+            self._file_executor.shutdown(wait=False, cancel_futures=True)
+            self._file_executor = None
+
+    def _create_projects_from_articles(self, articles: Iterable[Article]) -> List[Project]:
+        """Create projects from articles by grouping by project number.
+
+        Accepts any iterable, so articles can be streamed straight from
+        ``iter_csv_articles`` without materializing a separate list.
+        """
         from collections import defaultdict
-        
+
         # Group articles by project number
         project_groups = defaultdict(list)
+        article_count = 0
         for article in articles:
             project_groups[article.projekt_nr].append(article)
-        
+            article_count += 1
+
         # Create projects
         projects = []
         for projekt_nr, project_articles in project_groups.items():
             project = Project(projekt_nr=projekt_nr, articles=project_articles)
             projects.append(project)
-        
-        logger.info(f"Created {len(projects)} projects from {len(articles)} articles")
+
+        logger.info(f"Created {len(projects)} projects from {article_count} articles")
         return projects
 
 
+# MARK: ━━━ Order Helpers ━━━
+
+
+def picking_order_id(projekt_nr: str) -> str:
+    """Get the ID of the picking order of a project."""
+    return f"ORDER-{projekt_nr}"
+
+
+# MARK: ━━━ Duplicate Line Helpers ━━━
+
+
+def _drop_duplicate_lines(
+    articles: List[Article], seen: Set[LineKey]
+) -> List[Article]:
+    """Drop articles whose line key was seen before in the same file."""
+    unique = []
+    for article in articles:
+        key = line_key(article)
+        if key not in seen:
+            seen.add(key)
+            unique.append(article)
+    return unique
+
+
+# MARK: ━━━ Multi-File Helpers ━━━
+
+# Projects of one file as (projekt_nr, article values) pairs, the parse
+# result sent back from a file worker process.
+PackedProjects = List[Tuple[str, List[Tuple[Any, ...]]]]
+
+
+def _parse_source_in_worker(
+    options: Dict[str, Any],
+    source: SourceFile,
+    csv_options: Tuple[str, bool],
+) -> Tuple[PackedProjects, List[QuarantinedRow], Dict[str, int]]:
+    """Parse one source file; runs in a file worker process.
+
+    Articles are sent back as plain values, which pickle much faster
+    than the models.
+    """
+    data_service = DataService(**options)
+    projects, quarantine, stats = data_service._parse_source(
+        source, csv_options
+    )
+    packed = [
+        (
+            project.projekt_nr,
+            [article_values(article) for article in project.articles],
+        )
+        for project in projects
+    ]
+    return packed, quarantine.rows, stats
+
+
+def _unpack_projects(packed: PackedProjects) -> List[Project]:
+    """Rebuild the projects parsed by a file worker."""
+    with gc_paused():
+        return [
+            Project(
+                projekt_nr=projekt_nr,
+                articles=[article_from_values(row) for row in values],
+            )
+            for projekt_nr, values in packed
+        ]
+
+
+# MARK: ━━━ Quarantine Helpers ━━━
+
+
+def _source_name(path: Any) -> str:
+    """Get a readable name for a CSV source path or file object."""
+    return str(getattr(path, "name", path))
+
+
+def _quarantine_rows(
+    quarantine: Optional[Quarantine],
+    raw: pd.DataFrame,
+    rejected: List[RowErrors],
+) -> None:
+    """Quarantine rejected rows by position with their raw values.
+
+    The raw frame keeps the reader's running index, so the index label
+    gives the 1-based data row of the file.
+    """
+    if quarantine is None or not rejected:
+        return
+    rows = raw.iloc[[position for position, _ in rejected]]
+    labels = rows.index.tolist()
+    records = _frame_records(rows)
+    for label, values, (_, errors) in zip(labels, records, rejected):
+        quarantine.add(label + 1, errors, values)
+
+
+# MARK: ━━━ Export Diff Helpers ━━━
+
+
+def _content_hashes(cleaned: pd.DataFrame) -> pd.Series:
+    """Hash the non-progress fields of each cleaned row."""
+    content = cleaned.drop(columns=PROGRESS_FIELDS, errors="ignore")
+    return pd.util.hash_pandas_object(content, index=False)
+
+
+# MARK: ━━━ Cache Payload Helpers ━━━
+
+
+def _articles_to_columns(articles: List[Article]) -> Dict[str, List[Any]]:
+    """Get the JSON-ready field values of articles, one list per field."""
+    columns = {
+        name: [getattr(article, name) for article in articles]
+        for name in Article.model_fields
+    }
+    columns["status"] = [article.status.value for article in articles]
+    return columns
+
+
+def _articles_to_frame(articles: List[Article]) -> pd.DataFrame:
+    """Store validated articles column-wise, one column per field."""
+    return _columns_to_frame(_articles_to_columns(articles))
+
+
+def _columns_to_frame(columns: Dict[str, List[Any]]) -> pd.DataFrame:
+    """Build an article frame from field value lists."""
+    columns = dict(columns)
+    # Keep optional integers as objects so None does not turn into NaN.
+    for name in OPTIONAL_NUMERIC_FIELDS:
+        columns[name] = pd.Series(columns[name], dtype=object)
+    for name in CATEGORICAL_FIELDS:
+        columns[name] = pd.Categorical(columns[name])
+    return pd.DataFrame(columns)
+
+
+def _articles_from_columns(columns: Dict[str, List[Any]]) -> List[Article]:
+    """Rebuild already validated articles from field value lists."""
+    return _articles_from_frame(_columns_to_frame(columns))
+
+
+def _articles_from_frame(df: pd.DataFrame) -> List[Article]:
+    """Rebuild already validated articles without re-validation."""
+    df = df.assign(
+        status=_map_distinct(df["status"], _to_status_values),
+        **{
+            name: df[name].cat.rename_categories(sys.intern)
+            for name in CATEGORICAL_FIELDS
+        },
+    )
+    return [Article.model_construct(**row) for row in _frame_records(df)]
+
+
+def _to_status_values(values: pd.Series) -> pd.Series:
+    """Convert status strings to StatusEnum members."""
+    return values.map(StatusEnum)
+
+
+def _projects_to_payload(projects: List[Project]) -> Dict[str, Any]:
+    """Store projects as their numbers plus one article frame."""
+    return {
+        "projects": [
+            (project.projekt_nr, len(project.articles)) for project in projects
+        ],
+        "articles": _articles_to_columns(
+            [article for project in projects for article in project.articles]
+        ),
+    }
+
+
+def _projects_from_payload(payload: Dict[str, Any]) -> List[Project]:
+    """Rebuild projects from a cached payload."""
+    articles = _articles_from_columns(payload["articles"])
+    projects = []
+    start = 0
+    for projekt_nr, count in payload["projects"]:
+        project_articles = articles[start : start + count]
+        projects.append(
+            Project(projekt_nr=projekt_nr, articles=project_articles)
+        )
+        start += count
+    return projects
+
+
+# MARK: ━━━ Column Conversion Helpers ━━━
+
+
+def _map_distinct(
+    column: pd.Series, convert: Callable[[pd.Series], pd.Series]
+) -> pd.Series:
+    """Apply a conversion to each distinct value of a column only once.
+
+    Export columns repeat a handful of values, so converting the
+    factorized uniques and taking them back by code avoids Python-level
+    work per row. Every conversion here starts from ``str(value)``, so
+    missing values are first replaced by their string form; object
+    columns holding anything but strings are converted row by row.
+    """
+    if column.dtype == object:
+        missing = column.isna()
+        if missing.any():
+            column = column.copy()
+            column[missing] = column[missing].map(str)
+        if infer_dtype(column, skipna=False) not in ("string", "empty"):
+            return convert(column)
+
+    codes, uniques = pd.factorize(column, use_na_sentinel=False)
+    converted = convert(pd.Series(uniques))
+    return pd.Series(converted.to_numpy()[codes], index=column.index)
+
+
+def _strip_values(values: pd.Series) -> pd.Series:
+    """Convert values to stripped strings."""
+    return values.astype(str).str.strip()
+
+
+def _to_category_column(column: pd.Series) -> pd.Series:
+    """Strip and intern a low-cardinality column as a categorical.
+
+    Only the distinct values are interned; the categories then refer to
+    the interned strings, so every row that reads them shares a copy.
+    """
+    values = _map_distinct(
+        column, lambda distinct: _strip_values(distinct).map(sys.intern)
+    )
+    return values.astype("category")
+
+
+def _intern_fields(record: Mapping[str, Any]) -> Dict[str, Any]:
+    """Copy a raw record with its categorical string fields interned."""
+    record = dict(record)
+    for name in CATEGORICAL_FIELDS:
+        value = record.get(name)
+        if type(value) is str:
+            record[name] = sys.intern(value)
+    return record
+
+
+def _to_float_column(column: pd.Series) -> pd.Series:
+    """Convert weights with decimal commas to floats, invalid -> 0.0."""
+    if is_float_dtype(column) or is_integer_dtype(column):
+        return column.astype(float)
+    return _map_distinct(column, _parse_float_values).astype(float)
+
+
+def _parse_float_values(values: pd.Series) -> pd.Series:
+    """Parse values as float(str(value).replace(",", "."))."""
+    text = values.astype(str).str.replace(",", ".", regex=False)
+    parsed = pd.to_numeric(text, errors="coerce").astype(float)
+    unparsed = parsed.isna()
+    if unparsed.any():
+        parsed[unparsed] = text[unparsed].map(
+            lambda value: _parse_or_default(float, value, 0.0)
+        )
+    return parsed
+
+
+def _to_int_column(column: pd.Series, default: Optional[int]) -> pd.Series:
+    """Convert a column as int(str(value).strip()) would.
+
+    Cells that do not parse get ``default``.
+    """
+    if is_integer_dtype(column) and not is_bool_dtype(column):
+        values = column.astype("int64")
+        return values if default is not None else values.astype(object)
+
+    values = _map_distinct(
+        column, lambda distinct: _parse_int_values(distinct, default)
+    )
+    if default is None:
+        return values
+    try:
+        return values.astype("int64")
+    except OverflowError:
+        # Numbers beyond int64 stay Python ints, as int() returns them.
+        return values
+
+
+def _parse_int_values(values: pd.Series, default: Optional[int]) -> pd.Series:
+    """Parse values as int(str(value).strip()), invalid -> default."""
+    text = values.astype(str).str.strip()
+    plain = text.str.fullmatch(_INT_PATTERN).astype(bool)
+    parsed = pd.Series([default] * len(text), index=text.index, dtype=object)
+    if plain.any():
+        parsed[plain] = text[plain].astype("int64").astype(object)
+    if not plain.all():
+        # Built as objects, so pandas does not turn the ints into floats
+        rest = text[~plain]
+        parsed[~plain] = pd.Series(
+            [_parse_or_default(int, value, default) for value in rest],
+            index=rest.index,
+            dtype=object,
+        )
+    return parsed
+
+
+def _frame_records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Convert a frame to row dictionaries with native Python values."""
+    columns = list(df.columns)
+    values = zip(*(df[column].tolist() for column in columns))
+    return [dict(zip(columns, row)) for row in values]
+
+
+def _parse_or_default(
+    parse: Callable[[str], Any], value: str, default: Any
+) -> Any:
+    """Parse a single value, returning default on failure."""
+    try:
+        return parse(value)
+    except (ValueError, TypeError):
+        return default
+
+
 # EOF
@@ -0,0 +1,294 @@
+# File: backend/app/services/data_watcher.py
+# Path: backend/app/services/data_watcher.py
+
+"""
+Watcher that ingests new export files from the data directory.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Deque, Dict, Mapping, Optional, Tuple
+
+from .article_delta import ArticleDelta, LineKey
+
+if TYPE_CHECKING:
+    from .state import AppState
+
+logger = logging.getLogger(__name__)
+
+WATCHED_SUFFIXES = (".csv", ".json")
+
+# (size, mtime_ns) of a file; a file is rewritten when it changes.
+Fingerprint = Tuple[int, int]
+
+# Ingestions kept for the metrics endpoint.
+HISTORY_SIZE = 50
+
+
+@dataclass
+class _PendingFile:
+    """A new or changed file waiting for its writes to settle."""
+
+    fingerprint: Fingerprint
+    detected_at: float
+    stable_since: float
+
+
+@dataclass
+class FileIngestion:
+    """Outcome and timing of ingesting one version of a file.
+
+    ``latency_seconds`` runs from the first scan that saw the change to
+    the change being applied, so it includes the debounce wait;
+    ``processing_seconds`` covers the parse and apply only.
+    """
+
+    filename: str
+    ingested_at: datetime
+    latency_seconds: float
+    processing_seconds: float
+    rows_read: int = 0
+    rows_rejected: int = 0
+    inserted: int = 0
+    updated: int = 0
+    removed: int = 0
+    orders_created: int = 0
+    error: Optional[str] = None
+
+
+class DataWatcher:
+    """Polls the data directory and ingests new or changed exports.
+
+    CSV and JSON files directly in the directory are checked every
+    ``interval`` seconds. A file is ingested once its size and mtime
+    have stayed the same for ``debounce`` seconds and across two scans,
+    so a file still being written is not read half-way. Files present
+    when the watcher starts are taken as already loaded.
+
+    Each file goes through the incremental path: it is diffed in the
+    blocking pool against the lines it contributed last time, then the
+    delta is applied there as well. Lines of other files are left
+    alone, and deleting a file does not remove its lines.
+    """
+
+    def __init__(
+        self,
+        state: "AppState",
+        interval: float = 2.0,
+        debounce: float = 2.0,
+    ):
+        """Initialize the watcher for the data directory of the state."""
+        self.state = state
+        self.data_dir = state.data_service.data_dir
+        self.interval = interval
+        self.debounce = debounce
+        self.history: Deque[FileIngestion] = deque(maxlen=HISTORY_SIZE)
+        self.files_ingested = 0
+        self.files_failed = 0
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+        self._seen: Dict[Path, Fingerprint] = {}
+        self._pending: Dict[Path, _PendingFile] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    # MARK: ━━━ Lifecycle ━━━
+
+    @property
+    def running(self) -> bool:
+        """Check whether the polling task is active."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start polling; must be called from the event loop."""
+        if self.running:
+            return
+        self._seen = self.scan()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        logger.info(
+            f"Watching {self.data_dir} for new exports every "
+            f"{self.interval}s ({len(self._seen)} files already present)"
+        )
+
+    def stop(self) -> None:
+        """Stop polling; a running ingestion is cancelled."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+            logger.info(f"Stopped watching {self.data_dir}")
+
+    async def _run(self) -> None:
+        """Poll until cancelled."""
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.poll()
+            except Exception as e:
+                logger.error(f"❌ Data directory scan failed: {e}")
+
+    # MARK: ━━━ Scanning ━━━
+
+    def scan(self) -> Dict[Path, Fingerprint]:
+        """Get the fingerprints of the watched files."""
+        files = {}
+        for path in self.data_dir.iterdir():
+            if path.name.startswith(".") or path.suffix.lower() not in WATCHED_SUFFIXES:
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            if path.is_file():
+                files[path] = (stat.st_size, stat.st_mtime_ns)
+        return files
+
+    async def poll(self) -> int:
+        """Scan once and ingest the files that have settled.
+
+        A file is marked as seen only once it was ingested; a failed
+        file is picked up again by the next scans and retried after the
+        debounce. Returns the number of files ingested.
+        """
+        now = time.monotonic()
+        current = self.scan()
+        for path in set(self._seen) - set(current):
+            del self._seen[path]
+        for path in set(self._pending) - set(current):
+            del self._pending[path]
+
+        ready = []
+        for path, fingerprint in current.items():
+            if self._seen.get(path) == fingerprint:
+                self._pending.pop(path, None)
+                continue
+            pending = self._pending.get(path)
+            if pending is None:
+                self._pending[path] = _PendingFile(fingerprint, now, now)
+            elif pending.fingerprint != fingerprint:
+                pending.fingerprint = fingerprint
+                pending.stable_since = now
+            elif now - pending.stable_since >= self.debounce:
+                ready.append(path)
+
+        ingested = 0
+        for path in sorted(ready):
+            pending = self._pending.pop(path)
+            if await self._ingest(path, pending.detected_at):
+                self._seen[path] = pending.fingerprint
+                ingested += 1
+        return ingested
+
+    # MARK: ━━━ Ingestion ━━━
+
+    async def _ingest(self, path: Path, detected_at: float) -> bool:
+        """Diff a settled file off the loop and apply its changes.
+
+        Returns whether the file was ingested.
+        """
+        start = time.monotonic()
+        baseline = self.state.logistics_service.snapshot_source_baseline(path.name)
+
+        try:
+            delta = await self.state.run_blocking(self._diff_file, path, baseline)
+            orders_created = await self.state.run_blocking(self._apply, path, delta)
+        except Exception as e:
+            logger.error(f"❌ Failed to ingest {path.name}: {e}")
+            self._record(
+                FileIngestion(
+                    filename=path.name,
+                    ingested_at=datetime.now(),
+                    latency_seconds=time.monotonic() - detected_at,
+                    processing_seconds=time.monotonic() - start,
+                    error=str(e),
+                )
+            )
+            return False
+
+        summary = delta.summary()
+        ingestion = FileIngestion(
+            filename=path.name,
+            ingested_at=datetime.now(),
+            latency_seconds=time.monotonic() - detected_at,
+            processing_seconds=time.monotonic() - start,
+            rows_read=summary["rows_read"],
+            rows_rejected=summary["rows_rejected"],
+            inserted=summary["inserted"],
+            updated=summary["updated"],
+            removed=summary["removed"],
+            orders_created=orders_created,
+        )
+        self._record(ingestion)
+        logger.info(
+            f"Ingested {path.name} in {ingestion.latency_seconds:.2f}s: "
+            f"{summary}, {orders_created} orders created"
+        )
+        return True
+
+    def _diff_file(self, path: Path, baseline: Mapping[LineKey, int]) -> ArticleDelta:
+        """Diff a watched file; runs in the blocking pool."""
+        data_service = self.state.data_service
+        if path.suffix.lower() == ".json":
+            return data_service.diff_json_export(path, baseline)
+        return data_service.diff_csv_export(path, baseline)
+
+    def _apply(self, path: Path, delta: ArticleDelta) -> int:
+        """Apply a file's delta in the blocking pool; returns new orders.
+
+        The delta only covers this file's lines; see
+        ``LogisticsService.apply_source_delta``.
+        """
+        logistics_service = self.state.logistics_service
+        with logistics_service.lock:
+            projects = logistics_service.apply_source_delta(path.name, delta)
+            orders = self.state.data_service.create_picking_orders(projects)
+            for order in orders:
+                logistics_service.add_order(order)
+        return len(orders)
+
+    # MARK: ━━━ Metrics ━━━
+
+    def _record(self, ingestion: FileIngestion) -> None:
+        """Add an ingestion to the history and latency figures."""
+        self.history.append(ingestion)
+        if ingestion.error is not None:
+            self.files_failed += 1
+            return
+        self.files_ingested += 1
+        self._latency_total += ingestion.latency_seconds
+        self._latency_max = max(self._latency_max, ingestion.latency_seconds)
+
+    def summary(self) -> Dict[str, Any]:
+        """Get the watcher state and per-file ingestion latency."""
+        last = next(
+            (item for item in reversed(self.history) if item.error is None),
+            None,
+        )
+        return {
+            "running": self.running,
+            "data_dir": str(self.data_dir),
+            "interval_seconds": self.interval,
+            "debounce_seconds": self.debounce,
+            "files_pending": sorted(path.name for path in self._pending),
+            "files_ingested": self.files_ingested,
+            "files_failed": self.files_failed,
+            "latency_seconds": {
+                "last": last.latency_seconds if last else None,
+                "mean": (
+                    self._latency_total / self.files_ingested
+                    if self.files_ingested
+                    else None
+                ),
+                "max": self._latency_max if self.files_ingested else None,
+            },
+            "recent": [
+                {**asdict(item), "ingested_at": item.ingested_at.isoformat()}
+                for item in reversed(self.history)
+            ],
+        }
+
+
+# EOF
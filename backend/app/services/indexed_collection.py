@@ -0,0 +1,140 @@
+# File: backend/app/services/indexed_collection.py
+# Path: backend/app/services/indexed_collection.py
+
+"""
+Insertion-ordered collection with constant-time lookup by id.
+"""
+
+from itertools import islice
+from typing import (
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+    overload,
+)
+
+T = TypeVar("T")
+
+
+class IndexedCollection(Generic[T]):
+    """List-like collection backed by an id-keyed dictionary.
+
+    Items are keyed by the attribute named ``key``. Iteration, ``len``,
+    indexing and slicing behave like a list in insertion order, while
+    ``get`` and ``remove_by_id`` run in constant time. The optional
+    ``on_add`` and ``on_remove`` callbacks let owners keep secondary
+    indexes in sync, whichever way items are inserted or removed.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        items: Iterable[T] = (),
+        on_add: Optional[Callable[[T], None]] = None,
+        on_remove: Optional[Callable[[T], None]] = None,
+    ):
+        """Initialize the collection with the id attribute name."""
+        self._key = key
+        self._items: Dict[str, T] = {}
+        self._on_add = on_add
+        self._on_remove = on_remove
+        self.extend(items)
+
+    def key_of(self, item: T) -> str:
+        """Get the id of an item."""
+        key: str = getattr(item, self._key)
+        return key
+
+    # MARK: ━━━ Mutation ━━━
+
+    def append(self, item: T) -> None:
+        """Add an item, replacing any existing item with the same id."""
+        key = self.key_of(item)
+        previous = self._items.get(key)
+        if previous is not None and self._on_remove:
+            self._on_remove(previous)
+        self._items[key] = item
+        if self._on_add:
+            self._on_add(item)
+
+    def extend(self, items: Iterable[T]) -> None:
+        """Add several items."""
+        for item in items:
+            self.append(item)
+
+    def remove(self, item: T) -> None:
+        """Remove an item, raising ValueError if it is not present."""
+        key = self.key_of(item)
+        if self._items.get(key) is not item:
+            raise ValueError(f"{key} not in collection")
+        self.remove_by_id(key)
+
+    def remove_by_id(self, item_id: str) -> Optional[T]:
+        """Remove and return the item with the given id, if any."""
+        item = self._items.pop(item_id, None)
+        if item is not None and self._on_remove:
+            self._on_remove(item)
+        return item
+
+    def clear(self) -> None:
+        """Remove all items."""
+        for item_id in list(self._items):
+            self.remove_by_id(item_id)
+
+    # MARK: ━━━ Lookup ━━━
+
+    def get(self, item_id: str) -> Optional[T]:
+        """Get an item by id."""
+        return self._items.get(item_id)
+
+    def has_id(self, item_id: str) -> bool:
+        """Check whether an item with the given id exists."""
+        return item_id in self._items
+
+    def ids(self) -> List[str]:
+        """Get all ids in insertion order."""
+        return list(self._items)
+
+    # MARK: ━━━ List Protocol ━━━
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._items.values())
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, item: object) -> bool:
+        key = getattr(item, self._key, None)
+        return key is not None and self._items.get(key) is item
+
+    @overload
+    def __getitem__(self, index: int) -> T:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[T]:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, List[T]]:
+        if isinstance(index, slice):
+            start, stop, step = index.start, index.stop, index.step
+            if all(v is None or v >= 0 for v in (start, stop, step)):
+                return list(islice(self._items.values(), start, stop, step))
+            return list(self._items.values())[index]
+        if index < 0:
+            index += len(self._items)
+        if not 0 <= index < len(self._items):
+            raise IndexError("collection index out of range")
+        return next(islice(self._items.values(), index, None))
+
+    def __repr__(self) -> str:
+        return f"IndexedCollection({list(self._items.values())!r})"
+
+
+# EOF
@@ -0,0 +1,289 @@
+# File: backend/app/services/ingestion_pipeline.py
+# Path: backend/app/services/ingestion_pipeline.py
+
+"""
+Composable ingestion pipeline of named stages with per-stage metrics.
+"""
+
+import logging
+import os
+import time
+import tracemalloc
+from contextlib import closing, contextmanager
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+)
+
+import pandas as pd
+
+from ..models import Project
+
+logger = logging.getLogger(__name__)
+
+# Batches read from a source; closed early if the pipeline stops
+Batches = Generator[Any, None, None]
+
+try:
+    _PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+except (AttributeError, ValueError, OSError):  # pragma: no cover
+    _PAGE_SIZE = 4096
+
+
+# MARK: ━━━ Metrics ━━━
+
+
+@dataclass
+class StageMetrics:
+    """Wall time, row counts and peak memory of one pipeline stage.
+
+    ``peak_memory_bytes`` is the peak traced Python memory while the
+    stage ran if ``tracemalloc`` is tracing, otherwise the highest
+    resident set size seen when the stage returned a batch. Either is
+    process-wide, so it includes what other stages still hold.
+    """
+
+    name: str
+    seconds: float = 0.0
+    rows_in: int = 0
+    rows_out: int = 0
+    batches: int = 0
+    peak_memory_bytes: int = 0
+
+    def summary(self) -> Dict[str, Any]:
+        """Get the JSON-ready metrics."""
+        return {
+            "name": self.name,
+            "seconds": round(self.seconds, 6),
+            "rows_in": self.rows_in,
+            "rows_out": self.rows_out,
+            "batches": self.batches,
+            "peak_memory_bytes": self.peak_memory_bytes,
+        }
+
+
+def _resident_bytes() -> int:
+    """Get the resident set size of the process, 0 if unknown."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+# MARK: ━━━ Stages ━━━
+
+
+@dataclass(frozen=True)
+class FrameBatch:
+    """A chunk of raw CSV rows with its cleaned columns."""
+
+    raw: pd.DataFrame
+    cleaned: pd.DataFrame
+
+    def __len__(self) -> int:
+        return len(self.cleaned)
+
+
+class Stage:
+    """A named step that turns each input batch into an output batch.
+
+    ``process`` may return None to hold its input back, as grouping
+    does; ``flush`` is called once the input has ended and may return
+    a last batch. Batches are sized with ``len``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        process: Callable[[Any], Any],
+        flush: Optional[Callable[[], Any]] = None,
+    ):
+        """Initialize the stage with its batch and end-of-input steps."""
+        self.name = name
+        self._process = process
+        self._flush = flush
+
+    def process(self, batch: Any) -> Any:
+        """Process one batch."""
+        return self._process(batch)
+
+    def flush(self) -> Any:
+        """Finish the stage at the end of the input."""
+        return self._flush() if self._flush is not None else None
+
+
+class SourceStage(Stage):
+    """The first stage, which reads a source as a stream of batches."""
+
+    def __init__(self, name: str, read: Callable[[Any], Batches]):
+        """Initialize the stage with a function opening the batches."""
+        super().__init__(name, read)
+        self._read = read
+
+    def read(self, source: Any) -> Batches:
+        """Open the batch stream of a source."""
+        return self._read(source)
+
+
+class GroupStage(Stage):
+    """Collects articles or projects into one project per projekt_nr.
+
+    Grouping needs the whole input, so the projects are passed on when
+    the input ends, in the order their project numbers first appeared.
+    A project that is not split across the input is passed on as is.
+    """
+
+    def __init__(self, name: str = "group"):
+        """Initialize an empty grouping."""
+        super().__init__(name, self._add)
+        self._groups: Dict[str, List[Any]] = {}
+
+    def _add(self, batch: Sequence[Any]) -> None:
+        """Add articles or projects to the groups of their projects."""
+        for item in batch:
+            self._groups.setdefault(item.projekt_nr, []).append(item)
+
+    def flush(self) -> List[Project]:
+        """Build the projects of all groups."""
+        projects = []
+        for projekt_nr, items in self._groups.items():
+            if len(items) == 1 and isinstance(items[0], Project):
+                projects.append(items[0])
+                continue
+            articles = []
+            for item in items:
+                if isinstance(item, Project):
+                    articles.extend(item.articles)
+                else:
+                    articles.append(item)
+            projects.append(Project(projekt_nr=projekt_nr, articles=articles))
+        self._groups = {}
+        return projects
+
+
+# MARK: ━━━ Pipeline ━━━
+
+
+class IngestionPipeline:
+    """Streams batches from a source through a sequence of stages.
+
+    Each batch read by the first stage is pushed through the following
+    stages before the next one is read, so only a batch per stage is in
+    flight. Time, rows and peak memory are recorded per stage; a stage
+    that runs elsewhere, such as the commit on the event loop, is added
+    with ``run_stage`` and reported along with the others.
+    """
+
+    def __init__(self, name: str, stages: Sequence[Stage]):
+        """Initialize the pipeline; the first stage must be a source."""
+        first = stages[0] if stages else None
+        if not isinstance(first, SourceStage):
+            raise ValueError("A pipeline starts with a source stage")
+        self.name = name
+        self.source_stage = first
+        self.stages = list(stages)
+        self.metrics: Dict[str, StageMetrics] = {
+            stage.name: StageMetrics(stage.name) for stage in self.stages
+        }
+
+    def stream(self, source: Any) -> Iterator[Any]:
+        """Yield the batches that come out of the last stage."""
+        first = self.source_stage
+        metrics = self.metrics[first.name]
+        with self._measure(metrics):
+            batches = first.read(source)
+        with closing(batches):
+            while True:
+                with self._measure(metrics):
+                    batch = next(batches, None)
+                if batch is None:
+                    break
+                metrics.rows_in += len(batch)
+                metrics.rows_out += len(batch)
+                metrics.batches += 1
+                yield from self._push(batch, 1)
+
+        for index, stage in enumerate(self.stages[1:], 2):
+            metrics = self.metrics[stage.name]
+            with self._measure(metrics):
+                batch = stage.flush()
+            if batch is not None:
+                metrics.rows_out += len(batch)
+                yield from self._push(batch, index)
+
+    def run(self, source: Any) -> List[Any]:
+        """Run the pipeline to the end and get the output rows."""
+        return [row for batch in self.stream(source) for row in batch]
+
+    def run_stage(self, stage: Stage, batch: Any) -> Any:
+        """Run a further stage on an output batch and record it."""
+        metrics = self.metrics.setdefault(stage.name, StageMetrics(stage.name))
+        if stage not in self.stages:
+            self.stages.append(stage)
+        metrics.rows_in += len(batch)
+        metrics.batches += 1
+        with self._measure(metrics):
+            result = stage.process(batch)
+        if result is not None:
+            metrics.rows_out += len(result)
+        return result
+
+    def _push(self, batch: Any, start: int) -> Iterator[Any]:
+        """Pass a batch through the stages from ``start`` on."""
+        for stage in self.stages[start:]:
+            metrics = self.metrics[stage.name]
+            metrics.rows_in += len(batch)
+            metrics.batches += 1
+            with self._measure(metrics):
+                batch = stage.process(batch)
+            if batch is None:
+                return
+            metrics.rows_out += len(batch)
+        yield batch
+
+    @contextmanager
+    def _measure(self, metrics: StageMetrics) -> Iterator[None]:
+        """Add the wall time and peak memory of a stage step."""
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            metrics.seconds += time.perf_counter() - start
+            if tracing:
+                peak = tracemalloc.get_traced_memory()[1]
+            else:
+                peak = _resident_bytes()
+            metrics.peak_memory_bytes = max(metrics.peak_memory_bytes, peak)
+
+    def summary(self) -> Dict[str, Any]:
+        """Get the JSON-ready metrics of all stages."""
+        stages = [metrics.summary() for metrics in self.metrics.values()]
+        return {
+            "name": self.name,
+            "seconds": round(sum(s["seconds"] for s in stages), 6),
+            "memory": "traced" if tracemalloc.is_tracing() else "rss",
+            "stages": stages,
+        }
+
+    def log_summary(self) -> None:
+        """Log the metrics of all stages."""
+        stages = ", ".join(
+            f"{m.name} {m.seconds:.3f}s {m.rows_in}->{m.rows_out} rows "
+            f"{m.peak_memory_bytes / 2**20:.1f} MiB"
+            for m in self.metrics.values()
+        )
+        logger.info(f"Pipeline {self.name}: {stages}")
+
+
+# EOF
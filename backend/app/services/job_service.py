@@ -0,0 +1,94 @@
+# File: backend/app/services/job_service.py
+# Path: backend/app/services/job_service.py
+
+"""
+Background ingestion jobs with progress tracking.
+"""
+
+import logging
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from ..models import IngestionJob, JobPhaseEnum
+
+logger = logging.getLogger(__name__)
+
+# A job's work function parses in the worker thread and returns a
+# callable that applies the result to the shared state.
+JobWork = Callable[[IngestionJob], Callable[[], Optional[Dict[str, Any]]]]
+
+
+class JobService:
+    """Runs ingestion jobs in a bounded worker pool.
+
+    Parsing and validation run in a worker thread and report progress on
+    the job. The final step that changes the logistics state runs in the
+    same thread and holds the logistics service lock while it commits;
+    the routes reading orders take the same lock. The most recent
+    ``max_finished`` finished jobs stay available for polling; older
+    ones are dropped when a new job is submitted. Queued and running
+    jobs are never dropped.
+    """
+
+    def __init__(self, max_workers: int = 2, max_finished: int = 256):
+        """Initialize the job service with the worker count."""
+        self.max_workers = max_workers
+        self.max_finished = max_finished
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.jobs: "OrderedDict[str, IngestionJob]" = OrderedDict()
+
+    def submit(self, kind: str, work: JobWork) -> IngestionJob:
+        """Start a job in the worker pool."""
+        self._evict_finished()
+        job = IngestionJob(job_id=uuid.uuid4().hex, kind=kind)
+        self.jobs[job.job_id] = job
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="ingest"
+            )
+        self._executor.submit(self._run, job, work)
+        logger.info(f"Queued {kind} job {job.job_id}")
+        return job
+
+    def get(self, job_id: str) -> Optional[IngestionJob]:
+        """Get a job by ID."""
+        return self.jobs.get(job_id)
+
+    def _evict_finished(self) -> None:
+        """Drop the oldest finished jobs beyond ``max_finished``."""
+        finished = [job_id for job_id, job in self.jobs.items() if job.is_finished]
+        for job_id in finished[: max(len(finished) - self.max_finished, 0)]:
+            del self.jobs[job_id]
+
+    def _run(self, job: IngestionJob, work: JobWork) -> None:
+        """Run a job in a worker thread and record its outcome."""
+        job.started_at = datetime.now()
+        job.phase = JobPhaseEnum.PARSING
+        try:
+            apply = work(job)
+            job.phase = JobPhaseEnum.CREATING_ORDERS
+            job.result = apply()
+            job.phase = JobPhaseEnum.COMPLETED
+            logger.info(f"Completed {job.kind} job {job.job_id}")
+        except Exception as e:
+            job.error = str(e)
+            job.phase = JobPhaseEnum.FAILED
+            logger.error(f"❌ {job.kind} job {job.job_id} failed: {e}")
+        finally:
+            job.finished_at = datetime.now()
+
+    def shutdown(self) -> None:
+        """Stop the workers and drop queued jobs.
+
+        Running jobs are not awaited, so shutdown does not block on a
+        large ingest. A later ``submit`` starts a new pool.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# EOF
@@ -0,0 +1,130 @@
+# File: backend/app/services/json_stream.py
+# Path: backend/app/services/json_stream.py
+
+"""
+Incremental reading of the items of a JSON array from a byte stream.
+"""
+
+import codecs
+import json
+from typing import Any, BinaryIO, Iterator
+
+# Bytes read from the stream at a time.
+DEFAULT_READ_SIZE = 1 << 16
+
+_decoder = json.JSONDecoder()
+
+
+class _JsonBuffer:
+    """Decoded text of a stream, read on demand and consumed from the left.
+
+    ``raw_decode`` needs a complete value in the buffer; if a value does
+    not decode, more text is read and the decode retried, so a value
+    that is cut off by the read size is not mistaken for an invalid one.
+    """
+
+    def __init__(self, stream: BinaryIO, read_size: int):
+        """Initialize the buffer for a binary stream."""
+        self.stream = stream
+        self.read_size = read_size
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+        self._decode = codecs.getincrementaldecoder("utf-8-sig")().decode
+
+    def _fill(self) -> bool:
+        """Read more text; False once the stream is exhausted."""
+        if self.eof:
+            return False
+        data = self.stream.read(self.read_size)
+        self.eof = not data
+        self.text = self.text[self.pos :] + self._decode(data or b"", final=self.eof)
+        self.pos = 0
+        return bool(data)
+
+    def _grow(self) -> bool:
+        """Read until the unread text has doubled, or the stream ends."""
+        target = 2 * (len(self.text) - self.pos)
+        if not self._fill():
+            return False
+        while len(self.text) - self.pos < target and self._fill():
+            pass
+        return True
+
+    def next_char(self) -> str:
+        """Skip whitespace; get the next character without consuming it.
+
+        Returns "" at the end of the stream.
+        """
+        while True:
+            text = self.text
+            while self.pos < len(text) and text[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(text):
+                return text[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        """Consume an expected character."""
+        found = self.next_char()
+        if found != char:
+            raise ValueError(
+                f"Expected {char!r} in JSON stream, found {found or 'end'!r}"
+            )
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decode and consume the next complete JSON value."""
+        self.next_char()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if self._grow():
+                    continue
+                raise
+            # A number may continue in the next read
+            if end == len(self.text) and self._fill():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_array(
+    stream: BinaryIO, key: str, read_size: int = DEFAULT_READ_SIZE
+) -> Iterator[Any]:
+    """Yield the items of the array under a top-level key one at a time.
+
+    The stream must hold a JSON object; only the current item and the
+    unread rest of a read are held in memory. Other top-level values are
+    decoded and skipped. Yields nothing if the key is missing.
+    """
+    buffer = _JsonBuffer(stream, read_size)
+    buffer.expect("{")
+    if buffer.next_char() == "}":
+        return
+
+    while True:
+        name = buffer.value()
+        buffer.expect(":")
+        if name == key and buffer.next_char() == "[":
+            buffer.expect("[")
+            if buffer.next_char() == "]":
+                buffer.pos += 1
+            else:
+                while True:
+                    yield buffer.value()
+                    if buffer.next_char() == "]":
+                        buffer.pos += 1
+                        break
+                    buffer.expect(",")
+        else:
+            buffer.value()
+
+        if buffer.next_char() == "}":
+            return
+        buffer.expect(",")
+
+
+# EOF
@@ -6,7 +6,18 @@ Core logistics management service.
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+import threading
+from functools import wraps
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 from collections import defaultdict
 
 from ..models import (
@@ -17,24 +28,249 @@ from ..models import (
     MaterialCart,
     StatusEnum,
 )
+from .article_delta import (
+    ArticleDelta,
+    LineKey,
+    export_values,
+    line_key,
+)
+from .indexed_collection import IndexedCollection
+from .memory_report import article_memory_report
+from .overview_counters import OverviewCounters
 
 logger = logging.getLogger(__name__)
 
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def synchronized(method: F) -> F:
+    """Run a service method while holding the service lock."""
+
+    @wraps(method)
+    def wrapper(self: "LogisticsService", *args: Any, **kwargs: Any) -> Any:
+        with self.lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
 
 class LogisticsService:
     """Core logistics management service."""
 
-    def __init__(self):
-        """Initialize the logistics service."""
-        self.orders: List[PickingOrder] = []
-        self.pickers: List[Picker] = []
-        self.carts: List[MaterialCart] = []
+    def __init__(self, debug: bool = False):
+        """Initialize the logistics service.
+
+        With ``debug`` enabled, every system overview cross-checks the
+        incrementally maintained counters against a full recompute.
+        """
+        self.debug = debug
+        # Guards state changes and the scans that may run in worker
+        # threads; reentrant because locked methods call each other.
+        self.lock = threading.RLock()
+        self.counters = OverviewCounters()
+        self._carts_by_picker: Dict[
+            str, Dict[str, MaterialCart]
+        ] = defaultdict(dict)
+        self._orders_by_status: Dict[
+            StatusEnum, Dict[str, PickingOrder]
+        ] = {status: {} for status in StatusEnum}
+        self._orders_by_picker: Dict[
+            str, Dict[str, PickingOrder]
+        ] = defaultdict(dict)
+        self._orders_by_project: Dict[str, PickingOrder] = {}
+        self._lines_by_key: Dict[
+            LineKey, Tuple[PickingOrder, Article]
+        ] = {}
+        # Content hashes of the last applied export, see apply_delta
+        self.line_hashes: Dict[LineKey, int] = {}
+        # Line keys each export source contributed, see apply_source_delta
+        self.source_keys: Dict[str, FrozenSet[LineKey]] = {}
+
+        self.orders: IndexedCollection[PickingOrder] = IndexedCollection(
+            "order_id",
+            on_add=self._on_order_added,
+            on_remove=self._on_order_removed,
+        )
+        self.pickers: IndexedCollection[Picker] = IndexedCollection(
+            "picker_id",
+            on_add=self._on_picker_added,
+            on_remove=self._on_picker_removed,
+        )
+        self.carts: IndexedCollection[MaterialCart] = IndexedCollection(
+            "cart_id",
+            on_add=self._on_cart_added,
+            on_remove=self._on_cart_removed,
+        )
 
-    def add_order(self, order: PickingOrder) -> None:
-        """Add a new picking order."""
-        self.orders.append(order)
-        logger.info(f"Added order {order.order_id}")
+    @synchronized
+    def add_order(self, order: PickingOrder) -> bool:
+        """Add a picking order, or merge it into the order with its ID.
+
+        Adding an order that is already loaded, e.g. when the same data
+        is loaded again, updates the export-owned fields of its changed
+        lines in place, keeping their picking progress, and adds the
+        lines the loaded order lacks. Lines are never removed here; that
+        is left to ``apply_delta``, which knows the whole export. The
+        cost grows with the number of lines of the order, not of all
+        loaded orders. Returns True if the order was new.
+        """
+        current = self.orders.get(order.order_id)
+        if current is None:
+            self.orders.append(order)
+            logger.info(f"Added order {order.order_id}")
+            return True
+
+        changed = self._merge_order(current, order)
+        logger.info(f"Merged order {order.order_id}: {changed} lines changed")
+        return False
+
+    @synchronized
+    def remove_order(self, order_id: str) -> Optional[PickingOrder]:
+        """Remove a picking order."""
+        order = self.orders.remove_by_id(order_id)
+        if order:
+            logger.info(f"Removed order {order_id}")
+        return order
+
+    # MARK: ━━━ Index and Counter Maintenance ━━━
+
+    def _on_order_added(self, order: PickingOrder) -> None:
+        """Index a new order and add it to the global counters."""
+        self._index_order(order)
+        self._index_lines(order)
+        project = order.project
+        self.counters.total_articles += project.total_articles
+        self.counters.picked_articles += project.completed_count
+        self.counters.total_weight += project.total_weight
+
+    def _on_order_removed(self, order: PickingOrder) -> None:
+        """Unindex a removed order and subtract it from the counters."""
+        self._unindex_order(order)
+        self._unindex_lines(order)
+        project = order.project
+        self.counters.total_articles -= project.total_articles
+        self.counters.picked_articles -= project.completed_count
+        self.counters.total_weight -= project.total_weight
+
+    def _on_picker_added(self, picker: Picker) -> None:
+        """Count a new picker if it is working on an order."""
+        if picker.current_order:
+            self.counters.active_pickers += 1
+
+    def _on_picker_removed(self, picker: Picker) -> None:
+        """Uncount a removed picker if it was working on an order."""
+        if picker.current_order:
+            self.counters.active_pickers -= 1
+
+    def _on_cart_added(self, cart: MaterialCart) -> None:
+        """Index a new cart by picker and count it if available."""
+        if cart.assigned_picker:
+            self._carts_by_picker[cart.assigned_picker][cart.cart_id] = cart
+        if cart.is_available:
+            self.counters.available_carts += 1
+
+    def _on_cart_removed(self, cart: MaterialCart) -> None:
+        """Unindex a removed cart and uncount it if available."""
+        if cart.assigned_picker:
+            picker_carts = self._carts_by_picker.get(cart.assigned_picker)
+            if picker_carts is not None:
+                picker_carts.pop(cart.cart_id, None)
+                if not picker_carts:
+                    del self._carts_by_picker[cart.assigned_picker]
+        if cart.is_available:
+            self.counters.available_carts -= 1
+
+    def _index_lines(self, order: PickingOrder) -> None:
+        """Add an order's lines to the export key index."""
+        self._orders_by_project[order.project.projekt_nr] = order
+        for article in order.project.articles:
+            self._lines_by_key[line_key(article)] = (order, article)
+
+    def _unindex_lines(self, order: PickingOrder) -> None:
+        """Remove an order's lines from the export key index."""
+        projekt_nr = order.project.projekt_nr
+        if self._orders_by_project.get(projekt_nr) is order:
+            del self._orders_by_project[projekt_nr]
+        for article in order.project.articles:
+            key = line_key(article)
+            entry = self._lines_by_key.get(key)
+            if entry is not None and entry[0] is order:
+                del self._lines_by_key[key]
+                self.line_hashes.pop(key, None)
+
+    def _count_line(self, article: Article, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) a line from the counters."""
+        self.counters.total_articles += sign
+        if article.status == StatusEnum.ABGESCHLOSSEN:
+            self.counters.picked_articles += sign
+        self.counters.total_weight += sign * article.total_weight
+
+    def _index_order(self, order: PickingOrder) -> None:
+        """Add an order to the status and picker indexes."""
+        self._orders_by_status[order.status][order.order_id] = order
+        if order.assigned_picker:
+            self._orders_by_picker[order.assigned_picker][
+                order.order_id
+            ] = order
 
+    def _unindex_order(self, order: PickingOrder) -> None:
+        """Remove an order from the status and picker indexes."""
+        self._orders_by_status[order.status].pop(order.order_id, None)
+        if order.assigned_picker:
+            picker_orders = self._orders_by_picker.get(order.assigned_picker)
+            if picker_orders is not None:
+                picker_orders.pop(order.order_id, None)
+                if not picker_orders:
+                    del self._orders_by_picker[order.assigned_picker]
+
+    def _set_order_status(
+        self, order: PickingOrder, status: StatusEnum
+    ) -> None:
+        """Change the status of an order and keep the indexes in sync."""
+        self._unindex_order(order)
+        order.status = status
+        self._index_order(order)
+
+    def _set_order_picker(
+        self, order: PickingOrder, picker_id: Optional[str]
+    ) -> None:
+        """Change the assigned picker and keep the indexes in sync."""
+        self._unindex_order(order)
+        order.assigned_picker = picker_id
+        self._index_order(order)
+
+    def _set_picker_order(
+        self, picker: Picker, order_id: Optional[str]
+    ) -> None:
+        """Change the current order of a picker and update the counters."""
+        if bool(picker.current_order) != bool(order_id):
+            self.counters.active_pickers += 1 if order_id else -1
+        picker.current_order = order_id
+
+    def _set_cart_picker(
+        self, cart: MaterialCart, picker_id: Optional[str]
+    ) -> None:
+        """Assign or release a cart and keep the indexes in sync."""
+        self._on_cart_removed(cart)
+        cart.assigned_picker = picker_id
+        cart.is_available = picker_id is None
+        self._on_cart_added(cart)
+
+    # MARK: ━━━ Operations ━━━
+
+    @synchronized
+    def add_picker(self, picker: Picker) -> None:
+        """Add a picker."""
+        self.pickers.append(picker)
+        logger.info(f"Added picker {picker.picker_id}")
+
+    @synchronized
+    def add_cart(self, cart: MaterialCart) -> None:
+        """Add a material cart."""
+        self.carts.append(cart)
+        logger.info(f"Added cart {cart.cart_id}")
+
+    @synchronized
     def assign_order_to_picker(self, order_id: str, picker_id: str) -> bool:
         """Assign an order to a picker."""
         order = self.get_order_by_id(order_id)
@@ -52,13 +288,14 @@ class LogisticsService:
             logger.warning(f"Picker {picker_id} already has an active order")
             return False
 
-        order.assigned_picker = picker_id
-        order.status = StatusEnum.IN_BEARBEITUNG
-        picker.current_order = order_id
+        self._set_order_picker(order, picker_id)
+        self._set_order_status(order, StatusEnum.IN_BEARBEITUNG)
+        self._set_picker_order(picker, order_id)
 
         logger.info(f"Assigned order {order_id} to picker {picker_id}")
         return True
 
+    @synchronized
     def assign_cart_to_picker(self, picker_id: str, cart_id: str) -> bool:
         """Assign a material cart to a picker."""
         picker = self.get_picker_by_id(picker_id)
@@ -72,12 +309,48 @@ class LogisticsService:
             logger.warning(f"Cart {cart_id} is not available")
             return False
 
-        cart.assigned_picker = picker_id
-        cart.is_available = False
+        self._set_cart_picker(cart, picker_id)
 
         logger.info(f"Assigned cart {cart_id} to picker {picker_id}")
         return True
 
+    @synchronized
+    def release_cart(self, cart_id: str) -> bool:
+        """Release a material cart so it becomes available again."""
+        cart = self.get_cart_by_id(cart_id)
+        if not cart:
+            logger.warning(f"Cart {cart_id} not found")
+            return False
+
+        self._set_cart_picker(cart, None)
+
+        logger.info(f"Released cart {cart_id}")
+        return True
+
+    def _record_pick(
+        self,
+        project: Project,
+        article: Article,
+        quantity: int,
+        picker_id: str,
+    ) -> None:
+        """Update an article and the statistics for a successful pick."""
+        if quantity == article.menge:
+            project.set_article_status(article, StatusEnum.ABGESCHLOSSEN)
+            self.counters.picked_articles += 1
+        else:
+            project.set_article_status(article, StatusEnum.IN_BEARBEITUNG)
+
+        article.anzahl_auf_wagen = quantity
+        article.kommisionierer = picker_id
+        article.anzahl_aktion += 1
+
+        # Update picker statistics
+        picker = self.get_picker_by_id(picker_id)
+        if picker:
+            picker.total_picks_today += 1
+
+    @synchronized
     def pick_article(
         self, order_id: str, article_id: str, quantity: int, picker_id: str
     ) -> bool:
@@ -106,26 +379,14 @@ class LogisticsService:
             )
             return False
 
-        # Update article status
-        if quantity == article.menge:
-            article.status = StatusEnum.ABGESCHLOSSEN
-        else:
-            article.status = StatusEnum.IN_BEARBEITUNG
-
-        article.anzahl_auf_wagen = quantity
-        article.kommisionierer = picker_id
-        article.anzahl_aktion += 1
-
-        # Update picker statistics
-        picker = self.get_picker_by_id(picker_id)
-        if picker:
-            picker.total_picks_today += 1
+        self._record_pick(order.project, article, quantity, picker_id)
 
         logger.info(
             f"Picked {quantity} of article {article_id} from order {order_id}"
         )
         return True
 
+    @synchronized
     def pick_article_by_position(
         self, order_id: str, position: int, quantity: int, picker_id: str
     ) -> bool:
@@ -154,26 +415,14 @@ class LogisticsService:
             )
             return False
 
-        # Update article status
-        if quantity == article.menge:
-            article.status = StatusEnum.ABGESCHLOSSEN
-        else:
-            article.status = StatusEnum.IN_BEARBEITUNG
-
-        article.anzahl_auf_wagen = quantity
-        article.kommisionierer = picker_id
-        article.anzahl_aktion += 1
-
-        # Update picker statistics
-        picker = self.get_picker_by_id(picker_id)
-        if picker:
-            picker.total_picks_today += 1
+        self._record_pick(order.project, article, quantity, picker_id)
 
         logger.info(
             f"Picked {quantity} of article {article.artikel} (pos {position}) from order {order_id}"
         )
         return True
 
+    @synchronized
     def complete_order(self, order_id: str) -> bool:
         """Mark an order as completed."""
         order = self.get_order_by_id(order_id)
@@ -181,14 +430,8 @@ class LogisticsService:
             return False
 
         # Check if all articles are completed
-        completed_articles = len(
-            [
-                a
-                for a in order.project.articles
-                if a.status == StatusEnum.ABGESCHLOSSEN
-            ]
-        )
-        total_articles = len(order.project.articles)
+        completed_articles = order.project.completed_count
+        total_articles = order.project.total_articles
 
         if completed_articles < total_articles:
             logger.warning(
@@ -197,78 +440,219 @@ class LogisticsService:
             )
             return False
 
-        order.status = StatusEnum.ABGESCHLOSSEN
+        self._set_order_status(order, StatusEnum.ABGESCHLOSSEN)
 
         # Release picker and cart
         if order.assigned_picker:
             picker = self.get_picker_by_id(order.assigned_picker)
-            if picker:
-                picker.current_order = None
+            if picker and picker.current_order == order_id:
+                self._set_picker_order(picker, None)
+                for cart in list(
+                    self._carts_by_picker.get(picker.picker_id, {}).values()
+                ):
+                    self._set_cart_picker(cart, None)
 
         logger.info(f"Completed order {order_id}")
         return True
 
+    @synchronized
+    def apply_delta(self, delta: ArticleDelta) -> List[Project]:
+        """Apply the line changes of a new export in place.
+
+        Updated lines keep their picking progress; only the export-owned
+        fields are overwritten. Inserted lines join the order of their
+        project; lines of projects without an order are returned as new
+        projects for the caller to turn into orders. Lines the previous
+        baseline did not know but that are already loaded are updated
+        instead of duplicated. Cost grows with the size of the delta.
+        """
+        touched: Dict[str, PickingOrder] = {}
+        new_projects: Dict[str, Project] = {}
+
+        for key in delta.removals:
+            entry = self._lines_by_key.pop(key, None)
+            if entry is None:
+                continue
+            order, article = entry
+            self._count_line(article, -1)
+            order.project.remove_article(article)
+            touched[order.order_id] = order
+
+        for article in delta.updates + delta.inserts:
+            key = line_key(article)
+            entry = self._lines_by_key.get(key)
+            if entry is not None:
+                order, current = entry
+                values = export_values(article)
+                self._count_line(current, -1)
+                order.project.update_article(current, values)
+                self._count_line(current, 1)
+                touched[order.order_id] = order
+                continue
+
+            loaded = self._orders_by_project.get(article.projekt_nr)
+            if loaded is None:
+                project = new_projects.setdefault(
+                    article.projekt_nr, Project(projekt_nr=article.projekt_nr)
+                )
+                project.add_article(article)
+                continue
+
+            loaded.project.add_article(article)
+            self._lines_by_key[key] = (loaded, article)
+            self._count_line(article, 1)
+            touched[loaded.order_id] = loaded
+
+        self.line_hashes = delta.hashes
+
+        logger.info(
+            f"Applied export delta to {len(touched)} orders, "
+            f"{len(new_projects)} new projects"
+        )
+        return list(new_projects.values())
+
+    def _merge_order(self, current: PickingOrder, order: PickingOrder) -> int:
+        """Merge the lines of a reloaded order; returns the lines changed."""
+        project = current.project
+        lines = {line_key(article): article for article in project.articles}
+        changed = 0
+        for article in order.project.articles:
+            key = line_key(article)
+            loaded = lines.get(key)
+            if loaded is None:
+                project.add_article(article)
+                lines[key] = article
+                self._lines_by_key[key] = (current, article)
+                self._count_line(article, 1)
+                changed += 1
+                continue
+            values = export_values(article)
+            if any(
+                getattr(loaded, name) != value
+                for name, value in values.items()
+            ):
+                self._count_line(loaded, -1)
+                project.update_article(loaded, values)
+                self._count_line(loaded, 1)
+                changed += 1
+
+        current.priority = order.priority
+        return changed
+
+    @synchronized
+    def snapshot_source_baseline(self, source: str) -> Dict[LineKey, int]:
+        """Get the hashes of a source's loaded lines for a diff.
+
+        The copy can be diffed against in another thread.
+        """
+        line_hashes = self.line_hashes
+        return {
+            key: line_hashes[key]
+            for key in self.source_keys.get(source, ())
+            if key in line_hashes
+        }
+
+    @synchronized
+    def apply_source_delta(
+        self, source: str, delta: ArticleDelta
+    ) -> List[Project]:
+        """Apply the delta of one source's export, e.g. one file.
+
+        The delta was diffed against ``snapshot_source_baseline``, so it
+        only covers this source's lines: the hashes of all other loaded
+        lines are kept, and a line that another source contributed too
+        is not removed. Returns the new projects, as ``apply_delta``.
+        """
+        previous = self.source_keys.get(source, frozenset())
+        others = [
+            keys for name, keys in self.source_keys.items() if name != source
+        ]
+        shared = {
+            key
+            for key in previous.difference(delta.hashes)
+            if any(key in keys for keys in others)
+        }
+        delta.removals = [key for key in delta.removals if key not in shared]
+        hashes = {
+            key: value
+            for key, value in self.line_hashes.items()
+            if key not in previous or key in shared
+        }
+        hashes.update(delta.hashes)
+        self.source_keys[source] = frozenset(delta.hashes)
+        delta.hashes = hashes
+        return self.apply_delta(delta)
+
+    @synchronized
     def get_order_by_id(self, order_id: str) -> Optional[PickingOrder]:
         """Get order by ID."""
-        for order in self.orders:
-            if order.order_id == order_id:
-                return order
-        return None
+        return self.orders.get(order_id)
 
+    @synchronized
     def get_picker_by_id(self, picker_id: str) -> Optional[Picker]:
         """Get picker by ID."""
-        for picker in self.pickers:
-            if picker.picker_id == picker_id:
-                return picker
-        return None
+        return self.pickers.get(picker_id)
 
+    @synchronized
     def get_cart_by_id(self, cart_id: str) -> Optional[MaterialCart]:
         """Get cart by ID."""
-        for cart in self.carts:
-            if cart.cart_id == cart_id:
-                return cart
-        return None
+        return self.carts.get(cart_id)
 
     def get_article_by_id(
         self, project: Project, article_id: str
     ) -> Optional[Article]:
-        """Get article by ID from a project."""
-        for article in project.articles:
-            if article.artikel == article_id:
+        """Get article by ID from a project, preferring open lines."""
+        lines = project.find_articles(article_id)
+        for article in lines:
+            if article.status == StatusEnum.OFFEN:
                 return article
-        return None
+        return lines[0] if lines else None
 
     def get_article_by_position(
         self, project: Project, position: int
     ) -> Optional[Article]:
         """Get article by position from a project."""
-        for article in project.articles:
-            if article.position == position:
-                return article
-        return None
+        return project.find_article_by_position(position)
+
+    @synchronized
+    def get_orders_by_status(self, status: StatusEnum) -> List[PickingOrder]:
+        """Get all orders with the given status."""
+        return list(self._orders_by_status[status].values())
 
+    @synchronized
+    def count_orders_by_status(self) -> Dict[StatusEnum, int]:
+        """Get the number of orders per status."""
+        return {
+            status: len(orders)
+            for status, orders in self._orders_by_status.items()
+        }
+
+    @synchronized
     def get_open_orders(self) -> List[PickingOrder]:
         """Get all open orders."""
-        return [
-            order for order in self.orders if order.status == StatusEnum.OFFEN
-        ]
+        return self.get_orders_by_status(StatusEnum.OFFEN)
 
+    @synchronized
     def get_orders_by_picker(self, picker_id: str) -> List[PickingOrder]:
         """Get orders assigned to a specific picker."""
-        return [
-            order
-            for order in self.orders
-            if order.assigned_picker == picker_id
-        ]
+        return list(self._orders_by_picker.get(picker_id, {}).values())
+
+    @synchronized
+    def get_carts_by_picker(self, picker_id: str) -> List[MaterialCart]:
+        """Get carts assigned to a specific picker."""
+        return list(self._carts_by_picker.get(picker_id, {}).values())
 
+    @synchronized
     def get_available_carts(self) -> List[MaterialCart]:
         """Get all available carts."""
         return [cart for cart in self.carts if cart.is_available]
 
+    @synchronized
     def get_orders_by_priority(self) -> List[PickingOrder]:
         """Get orders sorted by priority."""
         return sorted(self.orders, key=lambda x: x.priority, reverse=True)
 
+    @synchronized
     def calculate_route_optimization(self, order: PickingOrder) -> List[str]:
         """Calculate optimal picking route for an order."""
         locations = [article.lagerplatz for article in order.project.articles]
@@ -290,62 +674,84 @@ class LogisticsService:
 
         return optimized_route
 
-    def get_system_overview(self) -> Dict[str, Any]:
-        """Get system overview statistics."""
-        total_articles = sum(
-            len(order.project.articles) for order in self.orders
-        )
-        picked_articles = sum(
-            len(
-                [
-                    a
-                    for a in order.project.articles
-                    if a.status == StatusEnum.ABGESCHLOSSEN
-                ]
+    @synchronized
+    def recompute_counters(self) -> OverviewCounters:
+        """Recompute the global counters with a full scan."""
+        counters = OverviewCounters()
+        for order in self.orders:
+            articles = order.project.articles
+            counters.total_articles += len(articles)
+            counters.picked_articles += sum(
+                1 for a in articles if a.status == StatusEnum.ABGESCHLOSSEN
             )
-            for order in self.orders
+            counters.total_weight += sum(a.total_weight for a in articles)
+        counters.active_pickers = sum(
+            1 for p in self.pickers if p.current_order
         )
+        counters.available_carts = len(self.get_available_carts())
+        return counters
+
+    @synchronized
+    def verify_counters(self) -> List[str]:
+        """Cross-check the counters against a full recompute.
+
+        Mismatching counters are logged and replaced by the recomputed
+        values. Returns the names of the counters that were off.
+        """
+        expected = self.recompute_counters()
+        mismatches = self.counters.diff(expected)
+        if mismatches:
+            logger.error(
+                "Overview counters out of sync: %s (counters=%s, "
+                "recomputed=%s)",
+                ", ".join(mismatches),
+                self.counters,
+                expected,
+            )
+            self.counters = expected
+        return mismatches
+
+    @synchronized
+    def get_system_overview(self) -> Dict[str, Any]:
+        """Get system overview statistics."""
+        if self.debug:
+            self.verify_counters()
+
+        counters = self.counters
+        status_counts = self.count_orders_by_status()
+        completed_orders = status_counts[StatusEnum.ABGESCHLOSSEN]
+        total_orders = len(self.orders)
 
         return {
-            "total_orders": len(self.orders),
-            "open_orders": len(self.get_open_orders()),
-            "completed_orders": len(
-                [
-                    o
-                    for o in self.orders
-                    if o.status == StatusEnum.ABGESCHLOSSEN
-                ]
-            ),
-            "total_articles": total_articles,
-            "picked_articles": picked_articles,
-            "total_weight": sum(
-                order.project.total_weight for order in self.orders
-            ),
-            "active_pickers": len(
-                [p for p in self.pickers if p.current_order]
-            ),
-            "available_carts": len(self.get_available_carts()),
+            "total_orders": total_orders,
+            "open_orders": status_counts[StatusEnum.OFFEN],
+            "completed_orders": completed_orders,
+            "total_articles": counters.total_articles,
+            "picked_articles": counters.picked_articles,
+            "total_weight": counters.total_weight,
+            "active_pickers": counters.active_pickers,
+            "available_carts": counters.available_carts,
             "completion_rate": (
-                (
-                    len(
-                        [
-                            o
-                            for o in self.orders
-                            if o.status == StatusEnum.ABGESCHLOSSEN
-                        ]
-                    )
-                    / len(self.orders)
-                    * 100
-                )
-                if self.orders
+                (completed_orders / total_orders * 100)
+                if total_orders
                 else 0
             ),
             "efficiency_score": (
-                (picked_articles / total_articles * 100)
-                if total_articles > 0
+                (counters.picked_articles / counters.total_articles * 100)
+                if counters.total_articles > 0
                 else 0
             ),
         }
 
+    @synchronized
+    def get_memory_report(self) -> Dict[str, Any]:
+        """Get the memory held per loaded article line."""
+        articles = (
+            article
+            for order in self.orders
+            for article in order.project.articles
+        )
+        return {"objects": article_memory_report(articles)}
+
 
 # EOF
@@ -0,0 +1,37 @@
+# File: backend/app/services/overview_counters.py
+# Path: backend/app/services/overview_counters.py
+
+"""
+Incrementally maintained counters behind the system overview.
+"""
+
+import math
+from dataclasses import dataclass, fields
+from typing import List
+
+
+@dataclass
+class OverviewCounters:
+    """Global counters updated on every logistics state transition."""
+
+    total_articles: int = 0
+    picked_articles: int = 0
+    total_weight: float = 0.0
+    active_pickers: int = 0
+    available_carts: int = 0
+
+    def diff(self, other: "OverviewCounters") -> List[str]:
+        """Get the names of counters that differ from another instance."""
+        mismatches = []
+        for counter in fields(self):
+            mine = getattr(self, counter.name)
+            theirs = getattr(other, counter.name)
+            if isinstance(mine, float):
+                if not math.isclose(mine, theirs, abs_tol=1e-6):
+                    mismatches.append(counter.name)
+            elif mine != theirs:
+                mismatches.append(counter.name)
+        return mismatches
+
+
+# EOF
@@ -0,0 +1,137 @@
+# File: backend/app/services/parse_cache.py
+# Path: backend/app/services/parse_cache.py
+
+"""
+On-disk cache for parsed source data keyed by file fingerprint.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+_HASH_BLOCK_SIZE = 1 << 20
+
+
+def file_sha256(path: Path) -> str:
+    """Get the SHA-256 hex digest of a file's content."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(_HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ParseCache:
+    """Cache of parsed payloads stored next to their source files.
+
+    Each entry is a JSON payload plus a JSON manifest holding the
+    source file's size, mtime and SHA-256. An entry is used when size
+    and mtime match; if only the mtime differs, the content hash
+    decides, so touching a file does not force a re-parse. Payloads are
+    plain data, so reading a planted cache file cannot run code.
+    """
+
+    def __init__(self, cache_dir: Path):
+        """Initialize the cache in the given directory."""
+        self.cache_dir = Path(cache_dir)
+
+    def _entry_paths(self, source: Path, kind: str) -> Dict[str, Path]:
+        """Get the manifest and payload paths of a cache entry."""
+        key = hashlib.sha1(f"{kind}:{source.resolve()}".encode("utf-8")).hexdigest()[
+            :16
+        ]
+        return {
+            "manifest": self.cache_dir / f"{kind}-{key}.json",
+            "payload": self.cache_dir / f"{kind}-{key}.payload",
+        }
+
+    def load(self, source: Path, kind: str, version: str) -> Optional[Any]:
+        """Get the cached payload for a source file, or None on a miss."""
+        paths = self._entry_paths(source, kind)
+        try:
+            manifest = json.loads(paths["manifest"].read_text("utf-8"))
+        except (OSError, ValueError):
+            return None
+
+        stat = source.stat()
+        if manifest.get("version") != version or manifest.get("size") != stat.st_size:
+            return None
+        if manifest.get("mtime_ns") != stat.st_mtime_ns:
+            if manifest.get("sha256") != file_sha256(source):
+                return None
+            manifest["mtime_ns"] = stat.st_mtime_ns
+            self._write_manifest(paths["manifest"], manifest)
+
+        try:
+            with open(paths["payload"], encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Discarding unreadable cache entry for {source}: {e}")
+            return None
+
+        logger.info(f"Loaded {kind} for {source.name} from cache")
+        return payload
+
+    def store(self, source: Path, kind: str, version: str, payload: Any) -> None:
+        """Store the parsed payload for a source file.
+
+        The payload must be JSON-serializable.
+        """
+        paths = self._entry_paths(source, kind)
+        stat = source.stat()
+        manifest = {
+            "source": str(source.resolve()),
+            "kind": kind,
+            "version": version,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": file_sha256(source),
+        }
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            temp_path = paths["payload"].with_suffix(".tmp")
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(payload, f, separators=(",", ":"))
+            os.replace(temp_path, paths["payload"])
+            self._write_manifest(paths["manifest"], manifest)
+        except OSError as e:
+            logger.warning(f"Could not write cache entry for {source}: {e}")
+
+    def invalidate(self, source: Optional[Path] = None) -> int:
+        """Remove the entries of one source file, or all entries.
+
+        Returns the number of removed entries.
+        """
+        if not self.cache_dir.is_dir():
+            return 0
+
+        removed = 0
+        for manifest_path in self.cache_dir.glob("*.json"):
+            if source is not None:
+                try:
+                    manifest = json.loads(manifest_path.read_text("utf-8"))
+                except (OSError, ValueError):
+                    continue
+                if manifest.get("source") != str(source.resolve()):
+                    continue
+            manifest_path.unlink(missing_ok=True)
+            manifest_path.with_suffix(".payload").unlink(missing_ok=True)
+            removed += 1
+
+        logger.info(f"Invalidated {removed} parse cache entries")
+        return removed
+
+    @staticmethod
+    def _write_manifest(path: Path, manifest: Dict[str, Any]) -> None:
+        """Write a manifest atomically."""
+        temp_path = path.with_suffix(".json.tmp")
+        temp_path.write_text(json.dumps(manifest), "utf-8")
+        os.replace(temp_path, path)
+
+
+# EOF
@@ -0,0 +1,113 @@
+# File: backend/app/services/quarantine.py
+# Path: backend/app/services/quarantine.py
+
+"""
+Quarantine of rows rejected while parsing source data.
+"""
+
+import json
+import math
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from pydantic import ValidationError
+
+# (field, message) of a single validation error; field is "" when the
+# error does not belong to one field.
+FieldError = Tuple[str, str]
+
+
+def field_errors(error: Exception) -> List[FieldError]:
+    """Get the field errors of a validation exception."""
+    if isinstance(error, ValidationError):
+        return [
+            (".".join(str(part) for part in item["loc"]), item["msg"])
+            for item in error.errors()
+        ]
+    return [("", str(error))]
+
+
+@dataclass
+class QuarantinedRow:
+    """A rejected row with its errors and raw values.
+
+    ``row`` is the 1-based data row of a CSV file (not counting the
+    header) or the article's position in its JSON project; it is None
+    for a JSON project that failed as a whole. ``source`` names the
+    file the row came from.
+    """
+
+    row: Optional[int]
+    errors: List[Dict[str, str]]
+    values: Dict[str, Any] = field(default_factory=dict)
+    source: Optional[str] = None
+
+
+class Quarantine:
+    """Collects the rejected rows of one parse.
+
+    Rows are kept instead of being logged one by one; the caller writes
+    them as a JSON Lines report and logs a single summary line.
+    """
+
+    def __init__(self, source: str):
+        """Initialize an empty quarantine for a source name."""
+        self.source = source
+        self.rows: List[QuarantinedRow] = []
+        self.report_id: Optional[str] = None
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def add(
+        self,
+        row: Optional[int],
+        errors: Union[Exception, List[FieldError]],
+        values: Dict[str, Any],
+    ) -> None:
+        """Quarantine a row with its error or field errors."""
+        if isinstance(errors, Exception):
+            errors = field_errors(errors)
+        self.rows.append(
+            QuarantinedRow(
+                row=row,
+                errors=[{"field": name, "error": message} for name, message in errors],
+                values={name: _json_value(value) for name, value in values.items()},
+                source=self.source,
+            )
+        )
+
+    def field_counts(self) -> Dict[str, int]:
+        """Count the errors per field."""
+        counts = Counter(error["field"] for row in self.rows for error in row.errors)
+        return dict(counts.most_common())
+
+    def summary(self) -> Dict[str, Any]:
+        """Get the rejected-row counts and the report ID, if written."""
+        return {
+            "rows_rejected": len(self.rows),
+            "errors_by_field": self.field_counts(),
+            "report_id": self.report_id,
+        }
+
+    def write(self, path: Path) -> None:
+        """Write the quarantined rows as JSON Lines."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            for row in self.rows:
+                f.write(json.dumps(asdict(row), ensure_ascii=False))
+                f.write("\n")
+
+
+def _json_value(value: Any) -> Any:
+    """Convert a raw value to a JSON-safe one; NaN becomes None."""
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+# EOF
@@ -0,0 +1,118 @@
+# File: backend/app/services/source_files.py
+# Path: backend/app/services/source_files.py
+
+"""
+Expansion of file lists, globs and archives into single data sources.
+"""
+
+import glob
+import gzip
+import zipfile
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Iterable, Iterator, List, Optional, Union
+
+DATA_SUFFIXES = (".csv", ".json")
+
+SourceSpec = Union[str, Path]
+
+
+@dataclass(frozen=True)
+class SourceFile:
+    """One CSV or JSON source: a file, a gzip file or a zip member.
+
+    Only the location is stored, so sources can be sent to worker
+    processes, which open and decompress them as streams.
+    """
+
+    path: str
+    member: Optional[str] = None
+
+    @property
+    def name(self) -> str:
+        """Get the file name, the member name for zip members."""
+        return self.member or Path(self.path).name
+
+    @property
+    def kind(self) -> str:
+        """Get the data format, "csv" or "json"."""
+        name = self.name.lower()
+        if name.endswith(".gz"):
+            name = name[:-3]
+        return "json" if name.endswith(".json") else "csv"
+
+    @contextmanager
+    def open(self) -> Iterator[Union[IO[bytes], gzip.GzipFile]]:
+        """Open the source as a binary stream, decompressing on the fly."""
+        if self.member is not None:
+            with zipfile.ZipFile(self.path) as archive:
+                with archive.open(self.member) as stream:
+                    yield stream
+        elif self.path.lower().endswith(".gz"):
+            with gzip.open(self.path, "rb") as stream:
+                yield stream
+        else:
+            with open(self.path, "rb") as stream:
+                yield stream
+
+
+def expand_sources(
+    specs: Union[SourceSpec, Iterable[SourceSpec]], base_dir: Path
+) -> List[SourceFile]:
+    """Expand files, glob patterns and archives into data sources.
+
+    Relative paths and patterns are resolved against ``base_dir``. Glob
+    matches and zip members are sorted by name, so the result does not
+    depend on directory listing order; the given specs keep their order.
+    Zip archives contribute their CSV and JSON members.
+    """
+    if isinstance(specs, (str, Path)):
+        specs = [specs]
+
+    sources = []
+    for spec in specs:
+        path = base_dir / spec
+        if glob.has_magic(str(spec)):
+            paths = sorted(glob.glob(str(path)))
+            if not paths:
+                raise FileNotFoundError(f"No data files match {spec}")
+        else:
+            if not path.exists():
+                raise FileNotFoundError(f"Data file not found: {path}")
+            paths = [str(path)]
+        for match in paths:
+            sources.extend(_file_sources(match))
+    return sources
+
+
+def _file_sources(path: str) -> List[SourceFile]:
+    """Get the data sources of one file."""
+    name = path.lower()
+    if name.endswith(".zip"):
+        with zipfile.ZipFile(path) as archive:
+            members = sorted(
+                info.filename
+                for info in archive.infolist()
+                if not info.is_dir() and _is_data_member(info.filename)
+            )
+        return [SourceFile(path, member) for member in members]
+    if name.endswith(".gz"):
+        name = name[:-3]
+    if not name.endswith(DATA_SUFFIXES):
+        raise ValueError(f"Unsupported data file type: {path}")
+    return [SourceFile(path)]
+
+
+def _is_data_member(filename: str) -> bool:
+    """Check whether a zip member is a data file worth reading."""
+    parts = filename.split("/")
+    if any(part.startswith((".", "__MACOSX")) for part in parts):
+        return False
+    name = filename.lower()
+    if name.endswith(".gz"):
+        return False
+    return name.endswith(DATA_SUFFIXES)
+
+
+# EOF
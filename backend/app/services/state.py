@@ -0,0 +1,128 @@
+# File: backend/app/services/state.py
+# Path: backend/app/services/state.py
+
+"""
+Application-scoped service state for the logistics management system.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Iterable, Optional, TypeVar
+
+from .data_service import DEFAULT_CSV_CHUNK_SIZE, DEFAULT_DATA_DIR, DataService
+from .data_watcher import DataWatcher
+from .job_service import JobService
+from .logistics_service import LogisticsService
+from .upload_ledger import UploadLedger
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class AppState:
+    """Container for services that live as long as the application."""
+
+    def __init__(
+        self,
+        data_dir: Optional[str] = None,
+        debug: bool = False,
+        csv_chunk_size: int = DEFAULT_CSV_CHUNK_SIZE,
+        parse_cache_dir: Optional[str] = None,
+        ingestion_workers: int = 2,
+        blocking_workers: int = 4,
+        validation_workers: int = 0,
+        trusted_sources: Iterable[str] = (),
+        trust_sample_rate: float = 0.01,
+        quarantine_dir: Optional[str] = None,
+        csv_engine: str = "pandas",
+        file_workers: int = 0,
+        trace_pipeline_memory: bool = False,
+        watch_interval: float = 2.0,
+        watch_debounce: float = 2.0,
+    ):
+        """Initialize the shared service instances."""
+        self.data_dir = data_dir
+        self.debug = debug
+        self.csv_chunk_size = csv_chunk_size
+        self.parse_cache_dir = parse_cache_dir
+        self.validation_workers = validation_workers
+        self.trusted_sources = list(trusted_sources)
+        self.trust_sample_rate = trust_sample_rate
+        self.quarantine_dir = quarantine_dir
+        self.csv_engine = csv_engine
+        self.file_workers = file_workers
+        self.trace_pipeline_memory = trace_pipeline_memory
+        self.logistics_service = LogisticsService(debug=debug)
+        self.uploads = UploadLedger()
+        self.job_service = JobService(max_workers=ingestion_workers)
+        self.blocking_workers = blocking_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._data_service: Optional[DataService] = None
+        self.watch_interval = watch_interval
+        self.watch_debounce = watch_debounce
+        self.watcher: Optional[DataWatcher] = None
+
+    @property
+    def data_service(self) -> DataService:
+        """Get the shared data service, creating it on first use."""
+        if self._data_service is None:
+            self._data_service = DataService(
+                self.data_dir or DEFAULT_DATA_DIR,
+                chunk_size=self.csv_chunk_size,
+                cache_dir=self.parse_cache_dir,
+                validation_workers=self.validation_workers,
+                trusted_sources=self.trusted_sources,
+                trust_sample_rate=self.trust_sample_rate,
+                quarantine_dir=self.quarantine_dir,
+                csv_engine=self.csv_engine,
+                file_workers=self.file_workers,
+                trace_memory=self.trace_pipeline_memory,
+            )
+        return self._data_service
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Get the pool for CPU-heavy request work, starting it if needed."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.blocking_workers,
+                thread_name_prefix="blocking",
+            )
+        return self._executor
+
+    async def run_blocking(
+        self, func: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        """Run a CPU-heavy call in the bounded pool, off the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(func, *args, **kwargs))
+
+    def start_watcher(self) -> DataWatcher:
+        """Start ingesting new exports from the data directory."""
+        if self.watcher is None:
+            self.watcher = DataWatcher(self, self.watch_interval, self.watch_debounce)
+        self.watcher.start()
+        return self.watcher
+
+    def shutdown(self) -> None:
+        """Stop the watcher and worker pools; pools restart on next use."""
+        if self.watcher is not None:
+            self.watcher.stop()
+        self.job_service.shutdown()
+        if self._data_service is not None:
+            self._data_service.shutdown()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def reset(self) -> None:
+        """Drop all in-memory logistics state."""
+        self.logistics_service = LogisticsService(debug=self.debug)
+        self.uploads.clear()
+        logger.info("Application state reset")
+
+
+# EOF
@@ -0,0 +1,130 @@
+# File: backend/app/services/stream_reader.py
+# Path: backend/app/services/stream_reader.py
+
+"""
+File-like readers for streaming CSV sources into the parser.
+"""
+
+import hashlib
+import io
+import queue
+from typing import Any, Callable, Optional
+
+# Chunks buffered between the producer and the parser.
+DEFAULT_MAX_CHUNKS = 16
+
+_POLL_SECONDS = 0.1
+
+
+class ChunkQueueReader(io.RawIOBase):
+    """Raw binary stream backed by a bounded queue of byte chunks.
+
+    A producer (e.g. an async request handler) calls ``feed`` for each
+    received chunk and ``finish`` at the end, while a parser in another
+    thread reads from the stream as from a file. The bounded queue keeps
+    memory flat: the producer waits while the parser is behind. Once
+    the reader is closed from either side, ``feed`` returns False and a
+    waiting read fails, so neither thread is left blocked.
+    """
+
+    def __init__(self, max_chunks: int = DEFAULT_MAX_CHUNKS):
+        """Initialize the reader with the queue bound in chunks."""
+        super().__init__()
+        self._queue: "queue.Queue[Optional[bytes]]" = queue.Queue(max_chunks)
+        self._buffer = memoryview(b"")
+        self._eof = False
+
+    def readable(self) -> bool:
+        return True
+
+    # MARK: ━━━ Producer Side ━━━
+
+    def feed(self, chunk: bytes) -> bool:
+        """Queue a chunk, waiting for space; False once the reader closed."""
+        return self._put(chunk)
+
+    def finish(self) -> None:
+        """Signal the end of the stream."""
+        self._put(None)
+
+    def _put(self, item: Optional[bytes]) -> bool:
+        """Put an item on the queue unless the reader has been closed."""
+        while not self.closed:
+            try:
+                self._queue.put(item, timeout=_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    # MARK: ━━━ Consumer Side ━━━
+
+    def readinto(self, buffer: Any) -> int:
+        """Read up to ``len(buffer)`` bytes, blocking for the producer."""
+        while not self._buffer and not self._eof:
+            try:
+                chunk = self._queue.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                if self.closed:
+                    raise OSError("Stream closed before end of data")
+                continue
+            if chunk is None:
+                self._eof = True
+            else:
+                self._buffer = memoryview(chunk)
+
+        size = min(len(buffer), len(self._buffer))
+        buffer[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+
+class ProgressReader(io.RawIOBase):
+    """Raw binary stream that reports the bytes read from another file."""
+
+    def __init__(self, raw: Any, on_read: Callable[[int], None]):
+        """Wrap a binary file; ``on_read`` gets the total bytes read."""
+        super().__init__()
+        self._raw = raw
+        self._on_read = on_read
+        self.bytes_read = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        """Read from the wrapped file and report the running total."""
+        data = self._raw.read(len(buffer))
+        size = len(data)
+        buffer[:size] = data
+        self.bytes_read += size
+        self._on_read(self.bytes_read)
+        return size
+
+
+class HashingReader(io.RawIOBase):
+    """Raw binary stream that hashes the bytes read from another file."""
+
+    def __init__(self, raw: Any):
+        """Wrap a binary file."""
+        super().__init__()
+        self._raw = raw
+        self._digest = hashlib.sha256()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        """Read from the wrapped file and add the bytes to the hash."""
+        data = self._raw.read(len(buffer))
+        size = len(data)
+        buffer[:size] = data
+        self._digest.update(data)
+        return size
+
+    def hexdigest(self) -> str:
+        """Get the SHA-256 of the bytes read so far."""
+        return self._digest.hexdigest()
+
+
+# EOF
@@ -0,0 +1,81 @@
+# File: backend/app/services/upload_ledger.py
+# Path: backend/app/services/upload_ledger.py
+
+"""
+Content-hash ledger of ingested uploads for skipping repeated files.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, BinaryIO, Dict, Optional
+
+# Bytes hashed and copied per read of an uploaded file.
+_HASH_BLOCK_SIZE = 1 << 20
+
+
+def upload_key(digest: str, kind: str, *options: Any) -> str:
+    """Get the ledger key of an upload.
+
+    The parse options are part of the key, since the same bytes read
+    with another delimiter give a different result.
+    """
+    return ":".join([kind, digest, *(str(option) for option in options)])
+
+
+def copy_with_digest(source: BinaryIO, target: BinaryIO) -> str:
+    """Copy a binary file to another; returns the SHA-256 of the bytes.
+
+    Spooling an upload this way hashes it in the same pass.
+    """
+    digest = hashlib.sha256()
+    for block in iter(lambda: source.read(_HASH_BLOCK_SIZE), b""):
+        digest.update(block)
+        target.write(block)
+    return digest.hexdigest()
+
+
+class UploadLedger:
+    """Results of the uploads ingested into the logistics state.
+
+    Re-uploading an export that was already ingested returns the stored
+    result instead of parsing the file again and adding its orders a
+    second time. The most recent ``max_entries`` uploads are kept; the
+    ledger describes the logistics state and is cleared along with it.
+    Background jobs record their results from worker threads, so the
+    entries are guarded by a lock.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        """Initialize an empty ledger."""
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._results: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get the result of an ingested upload, if any."""
+        with self._lock:
+            result = self._results.get(key)
+            if result is not None:
+                self._results.move_to_end(key)
+            return result
+
+    def record(self, key: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Store the result of an ingested upload and return it."""
+        with self._lock:
+            self._results[key] = result
+            self._results.move_to_end(key)
+            while len(self._results) > self.max_entries:
+                self._results.popitem(last=False)
+            return result
+
+    def clear(self) -> None:
+        """Forget all ingested uploads."""
+        with self._lock:
+            self._results.clear()
+
+
+# EOF
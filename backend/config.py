@@ -6,7 +6,7 @@ Configuration management for the logistics management system.
 """
 
 import os
-from typing import List
+from typing import List, Literal
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
@@ -17,44 +17,128 @@ class Settings(BaseSettings):
     # MARK: ━━━ Application Settings ━━━
 
     app_name: str = Field(
-        "Logistics Management System", description="Application name"
+        default="Logistics Management System", description="Application name"
     )
-    app_version: str = Field("1.0.0", description="Application version")
-    debug: bool = Field(False, description="Debug mode")
+    app_version: str = Field(
+        default="1.0.0", description="Application version"
+    )
+    debug: bool = Field(default=False, description="Debug mode")
 
     # MARK: ━━━ Server Settings ━━━
 
-    host: str = Field("0.0.0.0", description="Server host")
-    port: int = Field(8000, description="Server port")
+    host: str = Field(default="0.0.0.0", description="Server host")
+    port: int = Field(default=8000, description="Server port")
 
     # MARK: ━━━ Data Settings ━━━
 
-    data_dir: str = Field("../docs/data", description="Data directory path")
-    csv_file: str = Field("orig.csv", description="CSV data file")
-    json_file: str = Field("project.json", description="JSON data file")
+    data_dir: str = Field(
+        default="../docs/data", description="Data directory path"
+    )
+    csv_file: str = Field(default="orig.csv", description="CSV data file")
+    json_file: str = Field(
+        default="project.json", description="JSON data file"
+    )
+    csv_chunk_size: int = Field(
+        default=50_000,
+        ge=1,
+        description="Rows per chunk when streaming CSV files",
+    )
+    csv_engine: Literal["pandas", "pyarrow", "auto"] = Field(
+        default="pandas",
+        description=(
+            "CSV reader engine; pyarrow falls back to pandas if it is not "
+            "installed, auto uses pyarrow when available"
+        ),
+    )
+    trusted_sources: List[str] = Field(
+        default_factory=list,
+        description="Data files parsed without full row validation",
+    )
+    trust_sample_rate: float = Field(
+        default=0.01,
+        ge=0,
+        le=1,
+        description="Share of rows validated when parsing trusted sources",
+    )
+    validation_workers: int = Field(
+        default=0,
+        ge=0,
+        description="Processes validating CSV rows; 0 validates in-process",
+    )
+    file_workers: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Processes parsing the files of a multi-file or archive "
+            "ingest; 0 parses them in-process"
+        ),
+    )
+    trace_pipeline_memory: bool = Field(
+        default=False,
+        description=(
+            "Trace Python allocations for the per-stage peak memory of "
+            "ingestion pipelines; otherwise the resident set size is used"
+        ),
+    )
+    blocking_workers: int = Field(
+        default=4,
+        ge=1,
+        description="Worker threads for CPU-heavy work of request handlers",
+    )
+    ingestion_workers: int = Field(
+        default=2,
+        ge=1,
+        description="Worker threads for background ingestion jobs",
+    )
+    parse_cache_dir: str = Field(
+        default="",
+        description=(
+            "Parsed-data cache directory relative to the data directory, "
+            "e.g. .cache; empty disables the cache"
+        ),
+    )
+    watch_data_dir: bool = Field(
+        default=False,
+        description="Ingest new or changed exports in the data directory",
+    )
+    watch_interval_seconds: float = Field(
+        default=2.0, gt=0, description="Seconds between data directory scans"
+    )
+    watch_debounce_seconds: float = Field(
+        default=2.0,
+        ge=0,
+        description="Seconds a file must stay unchanged before ingestion",
+    )
+    quarantine_dir: str = Field(
+        default=".quarantine",
+        description=(
+            "Rejected-row report directory relative to the data directory; "
+            "empty disables the reports"
+        ),
+    )
 
     # MARK: ━━━ CORS Settings ━━━
 
     cors_origins: List[str] = Field(
-        ["http://localhost:3000", "http://127.0.0.1:3000"],
+        default=["http://localhost:3000", "http://127.0.0.1:3000"],
         description="Allowed CORS origins",
     )
     cors_allow_credentials: bool = Field(
-        True, description="Allow CORS credentials"
+        default=True, description="Allow CORS credentials"
     )
     cors_allow_methods: List[str] = Field(
-        ["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+        default=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
         description="Allowed CORS methods",
     )
     cors_allow_headers: List[str] = Field(
-        ["*"], description="Allowed CORS headers"
+        default=["*"], description="Allowed CORS headers"
     )
 
     # MARK: ━━━ Logging Settings ━━━
 
-    log_level: str = Field("INFO", description="Logging level")
+    log_level: str = Field(default="INFO", description="Logging level")
     log_format: str = Field(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        default="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         description="Log format",
     )
 
@@ -12,6 +12,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from app.api.v1 import api_router
+from app.api.v1.dependencies import init_app_state
 from app.models import BaseResponse, ErrorResponse
 from config import settings, get_logging_config
 
@@ -102,6 +103,9 @@ app.include_router(api_router)
 async def startup_event():
     """Initialize system on startup."""
     logger.info("🚀 Starting %s v%s", settings.app_name, settings.app_version)
+    state = init_app_state(app)
+    if settings.watch_data_dir:
+        state.start_watcher()
     logger.info(
         "📡 Server will be available at http://%s:%s",
         settings.host,
@@ -116,6 +120,7 @@ async def startup_event():
 async def shutdown_event():
     """Cleanup on shutdown."""
     logger.info("🛑 Shutting down %s", settings.app_name)
+    init_app_state(app).shutdown()
 
 
 # EOF
@@ -11,6 +11,8 @@ from fastapi.testclient import TestClient
 from httpx import AsyncClient
 
 from main import app
+from app.api.v1.dependencies import init_app_state
+from config import settings
 from app.services.logistics_service import LogisticsService
 from app.services.data_service import DataService
 
@@ -31,8 +33,24 @@ def event_loop():
 
 
 @pytest.fixture
-def client():
-    """Create a test client for the FastAPI application."""
+def app_state(tmp_path, monkeypatch):
+    """Create fresh application state writing its files to tmp_path.
+
+    The parse cache and quarantine reports would otherwise be written
+    into the shared data directory.
+    """
+    monkeypatch.setattr(settings, "parse_cache_dir", str(tmp_path / "cache"))
+    monkeypatch.setattr(settings, "quarantine_dir", str(tmp_path / "quarantine"))
+    previous = getattr(app.state, "services", None)
+    if previous is not None:
+        previous.shutdown()
+        app.state.services = None
+    return init_app_state(app)
+
+
+@pytest.fixture
+def client(app_state):
+    """Create a test client with fresh application state."""
     return TestClient(app)
 
 
@@ -128,7 +146,7 @@ def sample_project_data():
 def sample_order_data():
     """Sample order data for testing."""
     return {
-        "order_id": "ORDER-054536-001",
+        "order_id": "ORDER-054536",
         "project_number": "054536",
         "priority": 5,
         "status": "Offen",
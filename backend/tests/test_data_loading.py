@@ -12,10 +12,32 @@ Created: 2025-01-28
 """
 
 # MARK: ━━━ Imports ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+import asyncio
+import gzip
+import io
+import json
 import logging
+import os
+import shutil
+import zipfile
 
+import pandas as pd
+import pytest
+
+from app.services import csv_engines
+from app.services.csv_engines import get_csv_engine
 from app.services.data_service import DataService
-from app.models import Article, Project
+from app.services.data_watcher import DataWatcher
+from app.services.ingestion_pipeline import (
+    IngestionPipeline,
+    SourceStage,
+    Stage,
+)
+from app.services.logistics_service import LogisticsService
+from app.services.memory_report import article_memory_report
+from app.services.quarantine import Quarantine
+from app.services.state import AppState
+from app.models import Article, Project, StatusEnum
 
 # MARK: ━━━ Logger ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 logger = logging.getLogger(__name__)
@@ -89,7 +111,7 @@ def test_csv_article_parsing():
     # Check first article
     first_article = articles[0]
     assert isinstance(first_article, Article)
-    assert first_article.projekt_nr == "54536"
+    assert first_article.projekt_nr == "054536"
     assert first_article.artikel == "388303408"
     assert first_article.menge == 3
     assert first_article.lagerplatz == "23IZ022A"
@@ -131,11 +153,600 @@ def test_picking_order_creation():
 
     # Check first order
     first_order = orders[0]
-    assert first_order.order_id.startswith("ORDER-")
     assert first_order.project.projekt_nr == "054516"
+    assert first_order.order_id == "ORDER-054516"
+
+    # Order IDs do not depend on the load order
+    reversed_orders = data_service.create_picking_orders(projects[::-1])
+    assert [o.order_id for o in reversed_orders] == [o.order_id for o in orders[::-1]]
     assert first_order.status.value == "Offen"
 
 
+def test_chunked_csv_streaming():
+    """Test that chunked streaming yields the same articles as a full parse."""
+    logger.info("Testing chunked CSV streaming")
+
+    data_service = DataService()
+    stats = {}
+
+    batches = list(
+        data_service.iter_csv_batches("orig.csv", chunk_size=10, stats=stats)
+    )
+    streamed = [article for batch in batches for article in batch]
+    parsed = data_service.parse_csv_articles("orig.csv")
+
+    assert all(len(batch) <= 10 for batch in batches)
+    assert len(batches) > 1
+    assert [a.position for a in streamed] == [a.position for a in parsed]
+    assert stats["rows_read"] == len(data_service.load_csv_data("orig.csv"))
+    assert stats["articles_parsed"] == len(parsed)
+
+
+def test_csv_frame_cleaning():
+    """Test column-wise cleaning of raw CSV values."""
+    logger.info("Testing CSV frame cleaning")
+
+    data_service = DataService()
+    raw_frame = pd.DataFrame(
+        {
+            "gewicht": ["      ,771", "abc", "1,5"],
+            "menge": ["         3", "3.0", None],
+            "anzahl_fehlt": ["0", "", "x"],
+            "projekt_nr": ["054536          ", " 1", None],
+        }
+    )
+
+    cleaned = data_service._clean_frame(raw_frame)
+
+    assert cleaned["gewicht"].tolist() == [0.771, 0.0, 1.5]
+    assert cleaned["menge"].tolist() == [3, 0, 0]
+    assert cleaned["anzahl_fehlt"].tolist() == [0, None, None]
+    assert cleaned["anzahl_auf_wagen"].tolist() == [None, None, None]
+    assert cleaned["projekt_nr"].tolist() == ["054536", "1", "None"]
+    assert cleaned["artikel"].tolist() == ["", "", ""]
+
+
+def test_csv_parsing_keeps_numbers_beyond_int64(tmp_path, sample_article_data):
+    """Test that numbers too long for int64 parse like int() does."""
+    logger.info("Testing oversized CSV numbers")
+
+    rows = [
+        {
+            **sample_article_data,
+            "position": 1,
+            "bestand": "99999999999999999999",
+        },
+        {**sample_article_data, "position": 2},
+    ]
+    (tmp_path / "big.csv").write_text(pd.DataFrame(rows).to_csv(sep="|", index=False))
+
+    for trusted in (False, True):
+        articles = DataService(str(tmp_path)).parse_csv_articles(
+            "big.csv", trusted=trusted
+        )
+
+        assert [a.bestand for a in articles] == [
+            99999999999999999999,
+            sample_article_data["bestand"],
+        ]
+
+
+def test_csv_parsing_reads_underscore_and_non_ascii_digits(
+    tmp_path, sample_article_data
+):
+    """Test that ints int() accepts parse when no cell is a plain int."""
+    logger.info("Testing non-plain CSV integers")
+
+    rows = [
+        {
+            **sample_article_data,
+            "position": 1,
+            "bestand": "1_000",
+            "anzahl_fehlt": "1_000",
+        },
+        {
+            **sample_article_data,
+            "position": 2,
+            "bestand": "\u0663",
+            "anzahl_fehlt": "x",
+        },
+    ]
+    (tmp_path / "digits.csv").write_text(
+        pd.DataFrame(rows).to_csv(sep="|", index=False), encoding="utf-8"
+    )
+
+    for trusted in (False, True):
+        articles = DataService(str(tmp_path)).parse_csv_articles(
+            "digits.csv", trusted=trusted
+        )
+
+        assert [a.bestand for a in articles] == [1000, 3]
+        assert [a.anzahl_fehlt for a in articles] == [1000, None]
+
+
+def test_csv_engines_handle_duplicate_headers():
+    """Test that CSV engines name duplicated columns deterministically."""
+    logger.info("Testing CSV reader engines")
+
+    content = b"a  |b|a|a \n 1|2|3|4\n5| |7|8\n"
+    frame = get_csv_engine("pandas").read_frame(io.BytesIO(content))
+    assert list(frame.columns) == ["b", "a"]
+    assert frame["a"].tolist() == [4, 8]
+    assert pd.isna(frame["b"][1])
+
+    with pytest.raises(ValueError):
+        get_csv_engine("polars")
+
+    # Without pyarrow, the Arrow engine falls back to pandas
+    engine = get_csv_engine("pyarrow")
+    assert engine.name == ("pandas" if csv_engines.pa is None else "pyarrow")
+
+    if csv_engines.pa is not None:
+        frame = engine.read_frame(io.BytesIO(content))
+        assert list(frame.columns) == ["b", "a"]
+        assert frame["a"].tolist() == ["4", "8"]
+        assert pd.isna(frame["b"][1])
+
+        chunks = list(
+            engine.read_chunks(DataService().data_dir / "orig.csv", chunk_size=10)
+        )
+        expected = DataService().parse_csv_articles("orig.csv")
+        articles = DataService(csv_engine="pyarrow").parse_csv_articles("orig.csv")
+        assert [chunk.index[0] for chunk in chunks[:3]] == [0, 10, 20]
+        assert [a.model_dump() for a in articles] == [a.model_dump() for a in expected]
+
+
+def test_arrow_engine_matches_pandas(tmp_path, sample_article_data):
+    """Test that the Arrow engine parses like pandas, keeping text columns."""
+    pytest.importorskip("pyarrow")
+
+    rows = [
+        {**sample_article_data, "projekt_nr": "007", "position": 1},
+        {**sample_article_data, "projekt_nr": "054536  ", "position": 2},
+    ]
+    (tmp_path / "text.csv").write_text(pd.DataFrame(rows).to_csv(sep="|", index=False))
+
+    frames = {
+        name: get_csv_engine(name).read_frame(tmp_path / "text.csv")
+        for name in ("pandas", "pyarrow")
+    }
+    for frame in frames.values():
+        assert frame["projekt_nr"].str.strip().tolist() == ["007", "054536"]
+
+    default_dir = str(DataService().data_dir)
+    for filename, data_dir in (("text.csv", str(tmp_path)), ("orig.csv", default_dir)):
+        expected = DataService(data_dir).parse_csv_articles(filename)
+        articles = DataService(data_dir, csv_engine="pyarrow").parse_csv_articles(
+            filename
+        )
+        assert [a.model_dump() for a in articles] == [a.model_dump() for a in expected]
+
+
+def test_parallel_row_validation():
+    """Test that process-pool validation keeps order and skips bad rows."""
+    logger.info("Testing parallel row validation")
+
+    serial = DataService()
+    parallel = DataService(validation_workers=2)
+    parallel.validator.min_rows_per_task = 10
+
+    raw_frame = serial._read_csv_frame(serial.data_dir / "orig.csv")
+    raw_frame.loc[[3, 25], "menge"] = "-1"
+
+    try:
+        expected = serial._parse_csv_articles_from_frame(raw_frame.copy())
+        articles = parallel._parse_csv_articles_from_frame(raw_frame.copy())
+    finally:
+        parallel.shutdown()
+
+    assert len(articles) == len(raw_frame) - 2
+    assert [a.model_dump() for a in articles] == [a.model_dump() for a in expected]
+    assert all(isinstance(a.status, StatusEnum) for a in articles)
+
+
+def test_trusted_source_parsing():
+    """Test the trusted construct path and its fallback on drift."""
+    logger.info("Testing trusted source parsing")
+
+    data_service = DataService(
+        trusted_sources=["orig.csv", "project.json"], trust_sample_rate=0.1
+    )
+    assert data_service.is_trusted("orig.csv")
+
+    expected = data_service.parse_csv_articles("orig.csv", trusted=False)
+    articles = data_service.parse_csv_articles("orig.csv")
+    assert [a.model_dump() for a in articles] == [a.model_dump() for a in expected]
+    assert all(isinstance(a.status, StatusEnum) for a in articles)
+
+    projects = data_service.parse_json_projects("project.json")
+    expected_projects = data_service.parse_json_projects("project.json", trusted=False)
+    assert [p.model_dump() for p in projects] == [
+        p.model_dump() for p in expected_projects
+    ]
+
+    # A sampled row that fails validation sends the batch to full
+    # validation, which drops only the invalid row
+    raw_frame = data_service._read_csv_frame(data_service.data_dir / "orig.csv")
+    raw_frame.loc[0, "menge"] = "-1"
+    builder = data_service._trusted_builder()
+    articles = data_service._parse_csv_articles_from_frame(raw_frame, builder)
+    assert len(articles) == len(raw_frame) - 1
+    assert builder.report.drift_batches == 1
+
+
+def test_trusted_parsing_rejects_sampled_negative_weight(tmp_path, sample_article_data):
+    """Test that the legacy gewicht validator still applies when trusted."""
+    rows = [
+        {**sample_article_data, "position": 1, "gewicht": "-0,5"},
+        {**sample_article_data, "position": 2},
+    ]
+    (tmp_path / "weights.csv").write_text(
+        pd.DataFrame(rows).to_csv(sep="|", index=False)
+    )
+    data_service = DataService(str(tmp_path), trust_sample_rate=1.0)
+    quarantine = Quarantine("weights.csv")
+
+    articles = data_service.parse_csv_articles(
+        "weights.csv", trusted=True, quarantine=quarantine
+    )
+
+    assert [a.position for a in articles] == [2]
+    assert quarantine.field_counts() == {"gewicht": 1}
+
+
+def test_repeated_attributes_are_interned():
+    """Test that low-cardinality strings are shared across sources."""
+    logger.info("Testing string interning of repeated attributes")
+
+    data_service = DataService()
+    streamed = list(data_service.iter_csv_articles("orig.csv", chunk_size=10))
+    projects = data_service.parse_json_projects("project.json")
+    loaded = [article for project in projects for article in project.articles]
+
+    articles = streamed + loaded
+    for name in ("abteilungsgruppe", "einheit", "lager_1_stueckliste"):
+        values = {getattr(article, name) for article in articles}
+        assert len({id(getattr(a, name)) for a in articles}) == len(values)
+
+    cleaned = data_service._clean_frame(
+        data_service._read_csv_frame(data_service.data_dir / "orig.csv")
+    )
+    assert isinstance(cleaned["kostenstelle"].dtype, pd.CategoricalDtype)
+
+    report = article_memory_report(loaded)
+    assert report["articles"] == len(loaded)
+    assert report["bytes_per_article"] < report["bytes_per_article_unshared"]
+
+
+def test_parse_cache_reuse_and_invalidation(tmp_path):
+    """Test that parsed data is cached by fingerprint and invalidated."""
+    logger.info("Testing parsed-data cache")
+
+    source_dir = DataService().data_dir
+    for filename in ("orig.csv", "project.json"):
+        shutil.copy(source_dir / filename, tmp_path / filename)
+
+    data_service = DataService(str(tmp_path), cache_dir=".cache")
+    articles = data_service.parse_csv_articles("orig.csv")
+    projects = data_service.parse_json_projects("project.json")
+    assert len(list((tmp_path / ".cache").glob("*.json"))) == 2
+
+    # A touched but unchanged file is still served from the cache
+    os.utime(tmp_path / "orig.csv")
+    cached_articles = data_service.parse_csv_articles("orig.csv")
+    cached_projects = data_service.parse_json_projects("project.json")
+    assert [a.model_dump() for a in cached_articles] == [
+        a.model_dump() for a in articles
+    ]
+    assert [p.model_dump() for p in cached_projects] == [
+        p.model_dump() for p in projects
+    ]
+
+    # A changed file misses the cache and is parsed again
+    with open(tmp_path / "orig.csv") as f:
+        header, first_row = f.readline(), f.readline()
+    with open(tmp_path / "orig.csv", "w") as f:
+        f.write(header + first_row)
+    assert len(data_service.parse_csv_articles("orig.csv")) == 1
+
+    assert data_service.invalidate_cache("orig.csv") == 1
+    assert data_service.invalidate_cache() == 1
+    assert data_service.invalidate_cache() == 0
+
+
+def test_parse_cache_is_keyed_by_parse_settings(tmp_path, monkeypatch):
+    """Test that trusted mode and the CSV engine do not share entries."""
+    shutil.copy(DataService().data_dir / "orig.csv", tmp_path / "orig.csv")
+    data_service = DataService(str(tmp_path), cache_dir=".cache")
+    parses = []
+    iter_csv_articles = data_service.iter_csv_articles
+
+    def counting_iter(*args, **kwargs):
+        parses.append(kwargs.get("trusted"))
+        return iter_csv_articles(*args, **kwargs)
+
+    monkeypatch.setattr(data_service, "iter_csv_articles", counting_iter)
+
+    data_service.parse_csv_articles("orig.csv", trusted=False)
+    data_service.parse_csv_articles("orig.csv", trusted=False)
+    assert parses == [False]
+
+    data_service.parse_csv_articles("orig.csv", trusted=True)
+    data_service.parse_csv_articles("orig.csv", trusted=True)
+    assert parses == [False, True]
+
+    # Another engine name misses the entry stored by the current one
+    engine = data_service.csv_engine
+    monkeypatch.setattr(engine, "name", f"{engine.name}-other")
+    data_service.parse_csv_articles("orig.csv", trusted=True)
+    assert parses == [False, True, True]
+
+
+def test_incremental_reingest_applies_delta(tmp_path, sample_article_data):
+    """Test that a re-export applies only changed lines, keeping progress."""
+    logger.info("Testing incremental CSV re-ingest")
+
+    def write_export(rows):
+        frame = pd.DataFrame(rows)
+        frame.to_csv(tmp_path / "orig.csv", sep="|", index=False)
+
+    rows = [
+        {**sample_article_data, "position": position, "vorgang_id": 1}
+        for position in (1, 2, 3)
+    ]
+    write_export(rows)
+
+    data_service = DataService(str(tmp_path))
+    logistics_service = LogisticsService(debug=True)
+
+    delta = data_service.diff_csv_export("orig.csv", logistics_service.line_hashes)
+    assert delta.summary()["inserted"] == 3
+    projects = logistics_service.apply_delta(delta)
+    for order in data_service.create_picking_orders(projects):
+        logistics_service.add_order(order)
+    order = logistics_service.orders[0]
+    assert logistics_service.pick_article_by_position(order.order_id, 1, 3, "P001")
+
+    # Line 1 changes, line 2 is dropped and line 4 is new
+    rows[0] = {**rows[0], "menge": 5, "status": "Offen"}
+    write_export([rows[0], rows[2], {**rows[2], "position": 4}])
+    delta = data_service.diff_csv_export("orig.csv", logistics_service.line_hashes)
+    summary = delta.summary()
+    assert summary["inserted"] == 1
+    assert summary["updated"] == 1
+    assert summary["removed"] == 1
+    assert logistics_service.apply_delta(delta) == []
+
+    updated = order.project.find_article_by_position(1)
+    assert updated.menge == 5
+    assert updated.status == StatusEnum.ABGESCHLOSSEN
+    assert updated.kommisionierer == "P001"
+    assert [a.position for a in order.project.articles] == [1, 3, 4]
+    assert logistics_service.verify_counters() == []
+    assert logistics_service.counters.total_articles == 3
+
+    unchanged = data_service.diff_csv_export("orig.csv", logistics_service.line_hashes)
+    assert unchanged.is_empty
+
+
+def test_data_watcher_ingests_settled_exports(tmp_path, sample_article_data):
+    """Test that the watcher ingests new and changed files once settled."""
+    logger.info("Testing data directory watcher")
+
+    rows = [
+        {**sample_article_data, "position": position, "vorgang_id": 1}
+        for position in (1, 2)
+    ]
+    csv_path = tmp_path / "export.csv"
+    pd.DataFrame(rows).to_csv(tmp_path / "present.csv", sep="|", index=False)
+
+    state = AppState(data_dir=str(tmp_path), watch_debounce=0)
+    watcher = DataWatcher(state, debounce=0)
+
+    async def scenario():
+        watcher._seen = watcher.scan()
+
+        # A file still being written is not ingested
+        with open(csv_path, "w") as f:
+            f.write(pd.DataFrame(rows).to_csv(sep="|", index=False)[:80])
+        assert await watcher.poll() == 0
+        pd.DataFrame(rows).to_csv(csv_path, sep="|", index=False)
+        assert await watcher.poll() == 0
+        assert await watcher.poll() == 1
+        assert await watcher.poll() == 0
+        assert state.logistics_service.counters.total_articles == 2
+
+        # A rewrite updates the file's lines; other files are untouched
+        rows[0] = {**rows[0], "menge": 7}
+        pd.DataFrame(rows[:1]).to_csv(csv_path, sep="|", index=False)
+        os.utime(csv_path, ns=(0, 1))
+        with open(tmp_path / "project.json", "w") as f:
+            json.dump(
+                {
+                    "projects": [
+                        {
+                            "projekt_nr": "99",
+                            "articles": [
+                                {**rows[1], "projekt_nr": "99"},
+                            ],
+                        }
+                    ]
+                },
+                f,
+            )
+        await watcher.poll()
+        assert await watcher.poll() == 2
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        state.shutdown()
+
+    logistics_service = state.logistics_service
+    order = logistics_service.get_order_by_id(logistics_service.orders[0].order_id)
+    assert [a.menge for a in order.project.articles] == [7]
+    assert len(logistics_service.orders) == 2
+    assert logistics_service.verify_counters() == []
+
+    summary = watcher.summary()
+    assert summary["files_ingested"] == 3
+    assert summary["files_failed"] == 0
+    assert summary["latency_seconds"]["max"] >= 0
+    assert [item["filename"] for item in summary["recent"]] == [
+        "project.json",
+        "export.csv",
+        "export.csv",
+    ]
+    assert summary["recent"][1]["removed"] == 1
+
+
+def test_data_watcher_retries_failed_files(tmp_path, sample_article_data, monkeypatch):
+    """Test that a file whose ingestion failed is ingested on a later scan."""
+    csv_path = tmp_path / "export.csv"
+    state = AppState(data_dir=str(tmp_path), watch_debounce=0)
+    watcher = DataWatcher(state, debounce=0)
+    diff_file = watcher._diff_file
+    failures = [OSError("export.csv is locked")]
+
+    def flaky_diff(path, baseline):
+        if failures:
+            raise failures.pop()
+        return diff_file(path, baseline)
+
+    monkeypatch.setattr(watcher, "_diff_file", flaky_diff)
+
+    async def scenario():
+        watcher._seen = watcher.scan()
+        pd.DataFrame([sample_article_data]).to_csv(csv_path, sep="|", index=False)
+        assert await watcher.poll() == 0
+        assert await watcher.poll() == 0
+        assert csv_path not in watcher._seen
+        assert await watcher.poll() == 0
+        assert await watcher.poll() == 1
+        assert await watcher.poll() == 0
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        state.shutdown()
+
+    assert len(state.logistics_service.orders) == 1
+    summary = watcher.summary()
+    assert summary["files_failed"] == 1
+    assert summary["files_ingested"] == 1
+
+
+def test_parse_sources_merges_files(tmp_path, sample_article_data):
+    """Test parsing a glob, a gzip file and a zip archive, merged.
+
+    Within a file, the first line of a repeated line key wins.
+    """
+    logger.info("Testing multi-file ingestion")
+
+    def export(projekt_nr, positions, **values):
+        rows = [
+            {
+                **sample_article_data,
+                "projekt_nr": projekt_nr,
+                "position": position,
+                **values,
+            }
+            for position in positions
+        ]
+        return pd.DataFrame(rows).to_csv(sep="|", index=False)
+
+    (tmp_path / "b.csv").write_text(export("2", [1, 2, 1]))
+    (tmp_path / "a.csv").write_text(export("1", [1]))
+    with gzip.open(tmp_path / "c.csv.gz", "wt") as f:
+        f.write(export("1", [2]))
+    with zipfile.ZipFile(tmp_path / "d.zip", "w") as archive:
+        archive.writestr("part/z.csv", export("3", [1]))
+        archive.writestr("part/y.csv", export("2", [3]))
+        archive.writestr("part/x.csv", export("2", [4], menge=-1))
+        archive.writestr("__MACOSX/part/._y.csv", "junk")
+
+    sources = ["*.csv", "c.csv.gz", "d.zip"]
+    serial = DataService(str(tmp_path))
+    parallel = DataService(str(tmp_path), file_workers=2)
+    stats = {}
+    try:
+        projects = serial.parse_sources(sources, stats=stats)
+        parallel_projects = parallel.parse_sources(sources)
+    finally:
+        parallel.shutdown()
+
+    # Projects keep their first appearance; articles follow the files
+    assert [p.projekt_nr for p in projects] == ["1", "2", "3"]
+    assert [a.position for a in projects[0].articles] == [1, 2]
+    assert [a.position for a in projects[1].articles] == [1, 2, 3]
+    assert stats == {
+        "files": 6,
+        "rows_read": 8,
+        "articles_parsed": 6,
+        "rows_rejected": 1,
+        "duplicate_rows": 1,
+    }
+    assert [a.model_dump() for p in parallel_projects for a in p.articles] == [
+        a.model_dump() for p in projects for a in p.articles
+    ]
+
+    with pytest.raises(FileNotFoundError):
+        serial.parse_sources("missing-*.csv")
+    (tmp_path / "notes.txt").write_text("not data")
+    with pytest.raises(ValueError):
+        serial.parse_sources(["notes.txt"])
+
+
+def test_ingestion_pipeline_stage_metrics():
+    """Test the CSV pipeline stages, their row counts and timings."""
+    logger.info("Testing ingestion pipeline metrics")
+
+    data_service = DataService()
+    stats = {}
+    pipeline = data_service.csv_pipeline(chunk_size=10, stats=stats)
+    orders = pipeline.run(data_service.data_dir / "orig.csv")
+    logistics_service = LogisticsService()
+
+    def commit(batch):
+        return [o for o in batch if logistics_service.add_order(o)]
+
+    created = pipeline.run_stage(Stage("commit", commit), orders)
+
+    summary = pipeline.summary()
+    stages = {stage["name"]: stage for stage in summary["stages"]}
+    assert list(stages) == [
+        "read",
+        "clean",
+        "validate",
+        "group",
+        "prioritize",
+        "commit",
+    ]
+    rows = stats["rows_read"]
+    assert stages["read"]["rows_out"] == rows
+    assert stages["read"]["batches"] == -(-rows // 10)
+    assert stages["validate"]["rows_in"] == rows
+    assert stages["validate"]["rows_out"] == stats["articles_parsed"]
+    assert stages["group"]["rows_in"] == stats["articles_parsed"]
+    assert stages["group"]["rows_out"] == len(orders)
+    assert stages["commit"]["rows_out"] == len(created) == len(orders)
+    assert all(stage["seconds"] >= 0 for stage in stages.values())
+    assert all(stage["peak_memory_bytes"] > 0 for stage in stages.values())
+    assert summary["seconds"] >= stages["validate"]["seconds"]
+
+    # A pipeline starts with a source and streams through later stages
+    with pytest.raises(ValueError):
+        IngestionPipeline("empty", [Stage("double", lambda b: b * 2)])
+    pipeline = IngestionPipeline(
+        "numbers",
+        [
+            SourceStage("read", lambda n: ([i] for i in range(n))),
+            Stage("double", lambda batch: [2 * i for i in batch]),
+        ],
+    )
+    assert pipeline.run(3) == [0, 2, 4]
+
+
 def test_data_validation():
     """Test data validation and consistency checks."""
     logger.info("Testing data validation")
@@ -10,17 +10,20 @@ Author: Matthias Morath
 Created: 2025-01-28
 """
 
+import asyncio
+import hashlib
 import pytest
 import tempfile
+import threading
+import io
+import json
 import os
+import time
+import zipfile
 from fastapi.testclient import TestClient
 from main import app
-
-
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI application."""
-    return TestClient(app)
+from app.api.v1.dependencies import init_app_state
+from app.services.job_service import JobService
 
 
 @pytest.fixture
@@ -63,6 +66,17 @@ def test_upload_csv_data(client, sample_csv_content):
         assert response_data["projects_created"] == 1
         assert response_data["orders_created"] == 1
         assert len(response_data["sample_articles"]) == 2
+        stages = response_data["pipeline"]["stages"]
+        assert [stage["name"] for stage in stages] == [
+            "read",
+            "clean",
+            "validate",
+            "group",
+            "prioritize",
+            "commit",
+        ]
+        assert stages[0]["rows_out"] == 2
+        assert stages[-1]["rows_out"] == 1
 
     finally:
         # Clean up temporary file
@@ -108,6 +122,352 @@ def test_load_default_data(client):
     assert "Default data loaded successfully" in data["message"]
 
 
+def test_uploaded_orders_persist_across_requests(client, sample_csv_content):
+    """Test that uploaded orders are visible to subsequent requests."""
+    response = client.post(
+        "/api/v1/data/upload/csv",
+        files={"file": ("test.csv", sample_csv_content, "text/csv")},
+    )
+    assert response.status_code == 200
+
+    response = client.get("/api/v1/data/status")
+    assert response.status_code == 200
+    assert response.json()["data"]["orders_count"] == 1
+
+    response = client.get("/api/v1/orders")
+    assert response.status_code == 200
+    orders = response.json()["data"]["orders"]
+    assert len(orders) == 1
+    assert orders[0]["project_number"] == "054536"
+
+
+def test_upload_csv_stream(client, sample_csv_content):
+    """Test uploading CSV data as a chunked raw request body."""
+    content = sample_csv_content.encode("utf-8")
+
+    def body():
+        for start in range(0, len(content), 64):
+            yield content[start : start + 64]
+
+    response = client.post(
+        "/api/v1/data/upload/csv/stream?filename=test.csv", content=body()
+    )
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["total_records"] == 2
+    assert data["articles_parsed"] == 2
+    assert data["orders_created"] == 1
+
+    response = client.post(
+        "/api/v1/data/upload/csv/stream", content=b'a|b\n1|"open'
+    )
+    assert response.status_code == 500
+
+
+def test_upload_json_stream(client):
+    """Test uploading project JSON streamed one project at a time."""
+    data_dir = init_app_state(app).data_service.data_dir
+    with open(data_dir / "project.json", encoding="utf-8") as f:
+        projects = json.load(f)["projects"]
+    projects[0]["articles"][0]["menge"] = -1
+    content = json.dumps({"version": 1, "projects": projects}).encode()
+
+    def body():
+        for start in range(0, len(content), 1000):
+            yield content[start : start + 1000]
+
+    response = client.post(
+        "/api/v1/data/upload/json?filename=projects.json", content=body()
+    )
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["projects_created"] == len(projects)
+    assert data["articles_parsed"] == (
+        sum(len(p.get("articles", [])) for p in projects) - 1
+    )
+    assert data["quarantine"]["rows_rejected"] == 1
+    report_id = data["quarantine"]["report_id"]
+    if report_id:
+        init_app_state(app).data_service.quarantine_path(report_id).unlink()
+
+    response = client.get("/api/v1/data/status")
+    assert response.json()["data"]["orders_count"] == len(projects)
+
+    response = client.post(
+        "/api/v1/data/upload/json", content=b'{"projects": [{"projekt_nr"'
+    )
+    assert response.status_code == 500
+
+
+def test_upload_csv_archive(client, sample_csv_content):
+    """Test uploading a zip archive of CSV exports, merged by project."""
+    header, first, second = sample_csv_content.splitlines()
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("export/a.csv", "\n".join([header, first]))
+        zf.writestr("export/b.csv", "\n".join([header, second]))
+
+    response = client.post(
+        "/api/v1/data/upload/csv",
+        files={"file": ("exports.zip", archive.getvalue(), "application/zip")},
+    )
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["total_records"] == 2
+    assert data["projects_created"] == 1
+    assert data["orders_created"] == 1
+    assert [a["lagerplatz"] for a in data["sample_articles"]] == [
+        "23IZ022A",
+        "23IZ123A",
+    ]
+
+    response = client.post(
+        "/api/v1/data/upload/csv?incremental=true",
+        files={"file": ("exports.zip", archive.getvalue(), "application/zip")},
+    )
+    assert response.status_code == 400
+
+
+def test_incremental_uploads_are_diffed_per_file(client, sample_csv_content):
+    """Test that an incremental upload only removes its own file's lines."""
+    header, first, second = sample_csv_content.splitlines()
+
+    def upload(filename, *lines):
+        response = client.post(
+            "/api/v1/data/upload/csv?incremental=true",
+            files={
+                "file": (filename, "\n".join([header, *lines]), "text/csv")
+            },
+        )
+        assert response.status_code == 200
+        return response.json()["data"]
+
+    assert upload("a.csv", first)["orders_created"] == 1
+    assert upload("b.csv", second)["inserted"] == 1
+
+    # a.csv changes its line; the line of b.csv is not a removal
+    data = upload("a.csv", first.replace("|3|stk|", "|5|stk|"))
+    assert (data["inserted"], data["updated"], data["removed"]) == (0, 1, 0)
+
+    data = upload("a.csv")
+    assert (data["inserted"], data["updated"], data["removed"]) == (0, 0, 1)
+
+    orders = client.get("/api/v1/orders/").json()["data"]["orders"]
+    assert len(orders) == 1
+    assert orders[0]["total_articles"] == 1
+
+
+def test_repeated_upload_is_skipped(client, sample_csv_content):
+    """Test that re-uploading the same content adds no orders."""
+    for _ in range(2):
+        response = client.post(
+            "/api/v1/data/upload/csv",
+            files={"file": ("test.csv", sample_csv_content, "text/csv")},
+        )
+        assert response.status_code == 200
+        assert response.json()["data"]["orders_created"] == 1
+    assert response.json()["data"]["repeated"] is True
+
+    response = client.post(
+        "/api/v1/data/upload/csv/stream?filename=again.csv",
+        content=sample_csv_content.encode("utf-8"),
+    )
+    assert response.json()["data"]["repeated"] is True
+    response = client.get("/api/v1/data/status")
+    assert response.json()["data"]["orders_count"] == 1
+
+    # Other content, or the same content read differently, is ingested
+    response = client.post(
+        "/api/v1/data/upload/csv?skip_initial_space=false",
+        files={"file": ("test.csv", sample_csv_content, "text/csv")},
+    )
+    assert response.json()["data"]["repeated"] is False
+
+    header, first, _ = sample_csv_content.splitlines()
+    content = "\n".join([header, first, first])
+    response = client.post(
+        "/api/v1/data/upload/csv",
+        files={"file": ("dup.csv", content, "text/csv")},
+    )
+    data = response.json()["data"]
+    assert data["repeated"] is False
+    assert data["total_records"] == 2
+    assert data["articles_parsed"] == 1
+    assert data["duplicate_rows"] == 1
+
+
+def test_declared_digest_skips_parsing(
+    client, app_state, sample_csv_content, monkeypatch
+):
+    """Test that a streamed re-upload with its digest is not parsed."""
+    content = sample_csv_content.encode("utf-8")
+    digest = hashlib.sha256(content).hexdigest()
+    response = client.post(
+        "/api/v1/data/upload/csv/stream",
+        content=content,
+        headers={"X-Content-SHA256": digest},
+    )
+    assert response.json()["data"]["repeated"] is False
+
+    def no_parse(*args, **kwargs):
+        raise AssertionError("a repeated upload was parsed")
+
+    monkeypatch.setattr(app_state.data_service, "csv_pipeline", no_parse)
+    response = client.post(
+        "/api/v1/data/upload/csv/stream",
+        content=content,
+        headers={"X-Content-SHA256": digest.upper()},
+    )
+    assert response.status_code == 200
+    assert response.json()["data"]["repeated"] is True
+    monkeypatch.undo()
+
+    # A body that does not match its digest is refused
+    header, first, _ = sample_csv_content.splitlines()
+    response = client.post(
+        "/api/v1/data/upload/csv/stream?filename=other.csv",
+        content="\n".join([header, first]).encode("utf-8"),
+        headers={"X-Content-SHA256": "0" * 64},
+    )
+    assert response.status_code == 400
+    response = client.get("/api/v1/data/status")
+    assert response.json()["data"]["orders_count"] == 1
+
+
+def test_upload_csv_quarantines_rejected_rows(client, sample_csv_content):
+    """Test that rejected rows are reported and can be downloaded."""
+    header, first, second = sample_csv_content.splitlines()
+    bad_row = first.replace("|3|stk|", "|-3|stk|")
+    content = "\n".join([header, first, bad_row, second])
+
+    response = client.post(
+        "/api/v1/data/upload/csv",
+        files={"file": ("dirty.csv", content, "text/csv")},
+    )
+    assert response.status_code == 200
+    quarantine = response.json()["data"]["quarantine"]
+    assert quarantine["rows_rejected"] == 1
+    assert quarantine["errors_by_field"] == {"menge": 1}
+
+    response = client.get(quarantine["download_url"])
+    assert response.status_code == 200
+    try:
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert len(rows) == 1
+        assert rows[0]["row"] == 2
+        assert rows[0]["errors"][0]["field"] == "menge"
+        assert rows[0]["values"]["menge"] == -3
+    finally:
+        data_service = init_app_state(app).data_service
+        data_service.quarantine_path(quarantine["report_id"]).unlink()
+
+    response = client.get("/api/v1/data/quarantine/../orig")
+    assert response.status_code == 404
+
+
+def _wait_for_job(client, job_id):
+    """Poll a background job until it has finished."""
+    for _ in range(100):
+        job = client.get(f"/api/v1/data/jobs/{job_id}").json()["data"]
+        if job["phase"] in ("completed", "failed"):
+            return job
+        time.sleep(0.05)
+    raise AssertionError(f"Job {job_id} did not finish")
+
+
+def test_upload_csv_background_job(app_state, sample_csv_content):
+    """Test that a background upload returns a job that can be polled."""
+    with TestClient(app) as client:
+        response = client.post(
+            "/api/v1/data/upload/csv?background=true",
+            files={"file": ("test.csv", sample_csv_content, "text/csv")},
+        )
+        assert response.status_code == 202
+        job_id = response.json()["data"]["job_id"]
+
+        job = _wait_for_job(client, job_id)
+        assert job["phase"] == "completed"
+        assert job["rows_processed"] == 2
+        assert job["rows_rejected"] == 0
+        assert job["bytes_processed"] == job["total_bytes"]
+        assert job["eta_seconds"] == 0.0
+        assert job["result"]["orders_created"] == 1
+
+        response = client.get("/api/v1/data/status")
+        assert response.json()["data"]["orders_count"] == 1
+
+        response = client.get("/api/v1/data/jobs/unknown")
+        assert response.status_code == 404
+
+
+def test_job_service_drops_oldest_finished_jobs():
+    """Test that only the most recent finished jobs are kept."""
+    service = JobService(max_workers=1, max_finished=2)
+
+    def returning(result):
+        """Get job work whose apply step returns ``result``."""
+        return lambda job: lambda: result
+
+    async def run_jobs():
+        jobs = []
+        for index in range(4):
+            job = service.submit("test", returning({"index": index}))
+            while not job.is_finished:
+                await asyncio.sleep(0.01)
+            jobs.append(job)
+        return jobs
+
+    try:
+        jobs = asyncio.run(run_jobs())
+    finally:
+        service.shutdown()
+
+    assert [job.result for job in jobs] == [{"index": i} for i in range(4)]
+    # The fourth submit dropped the first job; the fourth is not yet
+    # counted against the limit.
+    assert list(service.jobs) == [job.job_id for job in jobs[1:]]
+    assert service.get(jobs[0].job_id) is None
+
+
+def test_heavy_endpoints_run_off_event_loop(
+    client, app_state, sample_csv_content, monkeypatch
+):
+    """Test the upload, route and overview endpoints on the worker pool."""
+    logistics_service = app_state.logistics_service
+    add_order = logistics_service.add_order
+    threads = []
+
+    def record_thread(order):
+        threads.append(threading.current_thread().name)
+        return add_order(order)
+
+    monkeypatch.setattr(logistics_service, "add_order", record_thread)
+    response = client.post(
+        "/api/v1/data/upload/csv",
+        files={"file": ("test.csv", sample_csv_content, "text/csv")},
+    )
+    assert response.status_code == 200
+    # The orders are committed in the blocking pool
+    assert threads and all(name.startswith("blocking") for name in threads)
+
+    orders = client.get("/api/v1/orders/").json()["data"]["orders"]
+    order_id = orders[0]["order_id"]
+    response = client.get(f"/api/v1/orders/{order_id}/route")
+    assert response.status_code == 200
+    assert response.json()["data"]["route"] == ["23IZ022A", "23IZ123A"]
+
+    response = client.get("/api/v1/orders/unknown/route")
+    assert response.status_code == 404
+
+    response = client.get("/api/v1/statistics/overview")
+    assert response.status_code == 200
+
+    response = client.get("/api/v1/statistics/memory")
+    assert response.status_code == 200
+    report = response.json()["data"]
+    assert report["objects"]["articles"] == 2
+
+
 def test_get_data_status(client):
     """Test getting data status via REST API."""
     response = client.get("/api/v1/data/status")
@@ -128,4 +488,80 @@ def test_get_data_status(client):
     assert "completed_orders" in response_data
 
 
+def test_order_reads_wait_for_a_running_commit(client, app_state):
+    """Test that reads never see a commit half-applied."""
+    logistics_service = app_state.logistics_service
+    data_service = app_state.data_service
+    orders = data_service.create_picking_orders(
+        data_service.parse_json_projects("project.json")[:2]
+    )
+    committing = threading.Event()
+    release = threading.Event()
+
+    def commit():
+        with logistics_service.lock:
+            logistics_service.add_order(orders[0])
+            committing.set()
+            release.wait(5)
+            logistics_service.add_order(orders[1])
+
+    responses = {}
+
+    def read():
+        for path in ("/api/v1/data/status", "/api/v1/orders/"):
+            responses[path] = client.get(path).json()["data"]
+
+    committer = threading.Thread(target=commit)
+    reader = threading.Thread(target=read)
+    committer.start()
+    assert committing.wait(5)
+    reader.start()
+    reader.join(0.2)
+    assert reader.is_alive()
+
+    release.set()
+    committer.join(5)
+    reader.join(5)
+    assert responses["/api/v1/data/status"]["orders_count"] == 2
+    assert responses["/api/v1/orders/"]["pagination"]["total"] == 2
+
+
+def test_background_commit_holds_the_service_lock(app_state, monkeypatch):
+    """Test that a background load commits its orders under the lock."""
+    logistics_service = app_state.logistics_service
+    add_order = logistics_service.add_order
+    committing = threading.Event()
+    release = threading.Event()
+
+    def pausing_add(order):
+        created = add_order(order)
+        committing.set()
+        release.wait(5)
+        return created
+
+    monkeypatch.setattr(logistics_service, "add_order", pausing_add)
+    with TestClient(app) as client:
+        response = client.post("/api/v1/data/load/default?background=true")
+        assert response.status_code == 202
+        job_id = response.json()["data"]["job_id"]
+        assert committing.wait(10)
+
+        # A status read waits until the whole load is committed
+        status = {}
+        reader = threading.Thread(
+            target=lambda: status.update(
+                client.get("/api/v1/data/status").json()["data"]
+            )
+        )
+        reader.start()
+        reader.join(0.2)
+        assert reader.is_alive()
+
+        release.set()
+        reader.join(5)
+        job = _wait_for_job(client, job_id)
+        assert job["phase"] == "completed"
+        assert status["orders_count"] == job["result"]["projects_loaded"]
+
+
 # EOF 
\ No newline at end of file
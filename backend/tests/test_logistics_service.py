@@ -0,0 +1,307 @@
+# File: backend/tests/test_logistics_service.py
+# Path: backend/tests/test_logistics_service.py
+
+"""
+Test: Logistics Service Index Tests
+Description:
+    Verifies that the id-keyed lookups of the logistics service stay
+    consistent with inserts and removals.
+
+Author: Matthias Morath
+Created: 2026-10-17
+"""
+
+# MARK: ━━━ Imports ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+import logging
+
+import pytest
+from app.models import Article, MaterialCart, Picker, PickingOrder, Project, StatusEnum
+from app.services.logistics_service import LogisticsService
+
+# MARK: ━━━ Logger ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+logger = logging.getLogger(__name__)
+
+
+# MARK: ━━━ Helpers ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+def _make_order(order_id: str) -> PickingOrder:
+    """Create an empty picking order."""
+    return PickingOrder(order_id=order_id, project=Project(projekt_nr="1"))
+
+
+# MARK: ━━━ Test Cases ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+def test_order_lookup_by_id(logistics_service: LogisticsService):
+    """Test that orders are found by id and iterate in insertion order."""
+    for i in range(5):
+        logistics_service.add_order(_make_order(f"ORDER-{i}"))
+
+    assert len(logistics_service.orders) == 5
+    assert logistics_service.get_order_by_id("ORDER-3").order_id == "ORDER-3"
+    assert logistics_service.get_order_by_id("ORDER-X") is None
+    assert [o.order_id for o in logistics_service.orders[1:3]] == [
+        "ORDER-1",
+        "ORDER-2",
+    ]
+    assert logistics_service.orders[-1].order_id == "ORDER-4"
+
+
+def test_order_removal_keeps_index_consistent(
+    logistics_service: LogisticsService,
+):
+    """Test that removed orders can no longer be looked up."""
+    order = _make_order("ORDER-1")
+    logistics_service.add_order(order)
+    logistics_service.add_order(_make_order("ORDER-2"))
+
+    assert logistics_service.remove_order("ORDER-1") is order
+    assert logistics_service.get_order_by_id("ORDER-1") is None
+    assert order not in logistics_service.orders
+    assert [o.order_id for o in logistics_service.orders] == ["ORDER-2"]
+
+    with pytest.raises(ValueError):
+        logistics_service.orders.remove(order)
+
+
+def test_picker_and_cart_lookup(logistics_service: LogisticsService):
+    """Test that pickers and carts appended list-style are indexed."""
+    picker = Picker(picker_id="P001", name="Test", employee_number="E1")
+    cart = MaterialCart(cart_id="C001", capacity=100.0)
+
+    logistics_service.pickers.append(picker)
+    logistics_service.add_cart(cart)
+
+    assert logistics_service.get_picker_by_id("P001") is picker
+    assert logistics_service.get_cart_by_id("C001") is cart
+    assert logistics_service.assign_cart_to_picker("P001", "C001") is True
+
+
+def test_project_article_indexes(sample_article_data):
+    """Test article lookups by number and position, and invalidation."""
+    first = Article(**sample_article_data)
+    second = Article(**{**sample_article_data, "wohin": "SVR-SHV--V01", "position": 2})
+    project = Project(projekt_nr="054536", articles=[first])
+
+    assert project.find_articles("388303408") == [first]
+    assert project.find_article_by_position(2) is None
+
+    project.add_article(second)
+
+    assert project.find_articles("388303408") == [first, second]
+    assert project.find_article_by_position(2) is second
+    assert project.find_articles("unknown") == []
+
+    third = Article(**{**sample_article_data, "position": 3})
+    project.articles[1] = third
+
+    assert project.find_article_by_position(2) is None
+    assert project.find_article_by_position(3) is third
+    assert project.total_weight == first.total_weight + third.total_weight
+
+    project.remove_article(second)
+    assert project.articles == [first, third]
+
+
+def test_pick_repeated_article_number(
+    logistics_service: LogisticsService, sample_article_data
+):
+    """Test picking an article number that occurs on several lines."""
+    lines = [
+        Article(**{**sample_article_data, "position": position}) for position in (1, 2)
+    ]
+    order = PickingOrder(
+        order_id="ORDER-1",
+        project=Project(projekt_nr="054536", articles=lines),
+    )
+    logistics_service.add_order(order)
+
+    for _ in lines:
+        assert logistics_service.pick_article(
+            "ORDER-1", "388303408", lines[0].menge, "P001"
+        )
+
+    assert all(a.status == StatusEnum.ABGESCHLOSSEN for a in lines)
+    assert not logistics_service.pick_article(
+        "ORDER-1", "388303408", lines[0].menge, "P001"
+    )
+
+
+def test_add_order_merges_reloaded_order(
+    logistics_service: LogisticsService, sample_article_data
+):
+    """Test that re-adding an order updates it and keeps its progress."""
+
+    def make_order(**menge):
+        lines = [
+            Article(
+                **{
+                    **sample_article_data,
+                    "position": position,
+                    "menge": menge.get(f"p{position}", 3),
+                }
+            )
+            for position in (1, 2)
+        ]
+        return PickingOrder(
+            order_id="ORDER-054536",
+            project=Project(projekt_nr="054536", articles=lines),
+        )
+
+    order = make_order()
+    assert logistics_service.add_order(order)
+    assert logistics_service.pick_article_by_position("ORDER-054536", 1, 3, "P001")
+
+    # Replaying the same load changes nothing
+    assert not logistics_service.add_order(make_order())
+    assert len(logistics_service.orders) == 1
+    assert len(order.project.articles) == 2
+    assert order.project.articles[0].status == StatusEnum.ABGESCHLOSSEN
+
+    # A changed line is updated in place, a new line is added
+    reloaded = make_order(p2=5)
+    reloaded.project.add_article(Article(**{**sample_article_data, "position": 3}))
+    assert not logistics_service.add_order(reloaded)
+    assert logistics_service.get_order_by_id("ORDER-054536") is order
+    assert [a.menge for a in order.project.articles] == [3, 5, 3]
+    assert order.project.articles[0].status == StatusEnum.ABGESCHLOSSEN
+    assert order.project.find_article_by_position(3) is (reloaded.project.articles[2])
+    assert logistics_service.verify_counters() == []
+
+
+def test_status_and_picker_indexes(logistics_service: LogisticsService):
+    """Test that status and picker indexes follow order transitions."""
+    for i in range(3):
+        logistics_service.add_order(_make_order(f"ORDER-{i}"))
+    logistics_service.add_picker(
+        Picker(picker_id="P001", name="Test", employee_number="E1")
+    )
+
+    assert len(logistics_service.get_open_orders()) == 3
+    assert logistics_service.assign_order_to_picker("ORDER-1", "P001")
+
+    counts = logistics_service.count_orders_by_status()
+    assert counts[StatusEnum.OFFEN] == 2
+    assert counts[StatusEnum.IN_BEARBEITUNG] == 1
+    assert [o.order_id for o in logistics_service.get_orders_by_picker("P001")] == [
+        "ORDER-1"
+    ]
+
+    assert logistics_service.complete_order("ORDER-1")
+    assert [
+        o.order_id
+        for o in logistics_service.get_orders_by_status(StatusEnum.ABGESCHLOSSEN)
+    ] == ["ORDER-1"]
+
+    logistics_service.remove_order("ORDER-1")
+    assert logistics_service.get_orders_by_picker("P001") == []
+    assert logistics_service.count_orders_by_status()[StatusEnum.ABGESCHLOSSEN] == 0
+
+
+def test_project_aggregates_follow_picks(
+    logistics_service: LogisticsService, sample_article_data
+):
+    """Test that cached project aggregates are updated on pick."""
+    lines = [
+        Article(**{**sample_article_data, "position": position}) for position in (1, 2)
+    ]
+    project = Project(projekt_nr="054536", articles=lines)
+    order = PickingOrder(order_id="ORDER-1", project=project)
+    logistics_service.add_order(order)
+
+    assert project.open_count == 2
+    assert project.total_weight == pytest.approx(2 * lines[0].total_weight)
+
+    assert logistics_service.pick_article_by_position(
+        "ORDER-1", 1, lines[0].menge, "P001"
+    )
+    assert project.completed_count == 1
+    assert project.open_count == 1
+    assert order.completion_percentage == 50.0
+    assert not order.is_complete
+
+    assert logistics_service.pick_article_by_position("ORDER-1", 2, 1, "P001")
+    assert project.open_count == 0
+    assert project.completed_count == 1
+
+    project.add_article(Article(**{**sample_article_data, "position": 3}))
+    assert project.open_count == 1
+    assert project.total_weight == pytest.approx(3 * lines[0].total_weight)
+
+
+def test_overview_counters_match_recompute(sample_project_data):
+    """Test that incremental counters agree with a full recompute."""
+    service = LogisticsService(debug=True)
+    project = Project(**sample_project_data)
+    service.add_order(PickingOrder(order_id="ORDER-1", project=project))
+    service.add_picker(Picker(picker_id="P001", name="Test", employee_number="E1"))
+    service.add_cart(MaterialCart(cart_id="C001", capacity=100.0))
+
+    assert service.assign_order_to_picker("ORDER-1", "P001")
+    assert service.assign_cart_to_picker("P001", "C001")
+    assert service.get_system_overview()["active_pickers"] == 1
+    assert service.get_system_overview()["available_carts"] == 0
+
+    article = project.articles[0]
+    assert service.pick_article_by_position(
+        "ORDER-1", article.position, article.menge, "P001"
+    )
+    assert service.complete_order("ORDER-1")
+
+    overview = service.get_system_overview()
+    assert service.verify_counters() == []
+    assert overview["picked_articles"] == 1
+    assert overview["completed_orders"] == 1
+    assert overview["active_pickers"] == 0
+    assert overview["available_carts"] == 1
+    assert overview["total_weight"] == pytest.approx(article.total_weight)
+
+
+def test_verify_counters_repairs_drift(logistics_service: LogisticsService):
+    """Test that the debug cross-check detects and fixes drift."""
+    logistics_service.add_cart(MaterialCart(cart_id="C001", capacity=1.0))
+    logistics_service.counters.available_carts = 5
+
+    assert logistics_service.verify_counters() == ["available_carts"]
+    assert logistics_service.counters.available_carts == 1
+
+
+def test_counters_follow_picks_reloads_and_removals(sample_article_data):
+    """Test that the counters match a full scan after every change."""
+    service = LogisticsService()
+    lines = [
+        Article(**{**sample_article_data, "position": position}) for position in (1, 2)
+    ]
+    service.add_order(
+        PickingOrder(
+            order_id="ORDER-1", project=Project(projekt_nr="1", articles=lines)
+        )
+    )
+    service.add_order(_make_order("ORDER-2"))
+
+    assert service.pick_article_by_position("ORDER-1", 2, lines[1].menge, "P001")
+    assert service.counters.picked_articles == 1
+    assert service.verify_counters() == []
+
+    reloaded = [
+        Article(**{**sample_article_data, "position": position, "menge": 6})
+        for position in (1, 2, 3)
+    ]
+    service.add_order(
+        PickingOrder(
+            order_id="ORDER-1", project=Project(projekt_nr="1", articles=reloaded)
+        )
+    )
+    order = service.get_order_by_id("ORDER-1")
+    assert order.project.total_weight == pytest.approx(
+        3 * 6 * sample_article_data["gewicht"]
+    )
+    assert service.verify_counters() == []
+
+    service.remove_order("ORDER-1")
+    assert service.verify_counters() == []
+    assert service.counters.picked_articles == 0
+
+
+# EOF
@@ -7,10 +7,30 @@ import json
 import sys
 from pathlib import Path
 
-from app.data_loader import DataLoader
-from app.core import LogisticsManager
-from app.models import Picker, MaterialCart, StatusEnum
-from config import settings
+# Add backend to path
+backend_path = Path(__file__).parent / "backend"
+sys.path.insert(0, str(backend_path))
+
+from app.models import Picker, MaterialCart, StatusEnum  # noqa: E402
+from app.services.data_service import DataService  # noqa: E402
+from app.services.ingestion_pipeline import IngestionPipeline, SourceStage  # noqa: E402
+from app.services.logistics_service import LogisticsService  # noqa: E402
+from config import settings  # noqa: E402
+
+
+def _load_manager(data_dir):
+    """Load the default project JSON file into a logistics service."""
+    loader = DataService(data_dir)
+    try:
+        with open(loader.data_dir / 'project.json', 'rb') as f:
+            orders = loader.json_pipeline().run(f)
+    finally:
+        loader.shutdown()
+
+    manager = LogisticsService()
+    for order in orders:
+        manager.add_order(order)
+    return manager
 
 
 @click.group()
@@ -27,15 +47,22 @@ def validate(data_dir):
     click.echo("Validating data files...")
 
     try:
-        loader = DataLoader(data_dir)
-
-        # Load and validate CSV data
-        csv_articles = loader.parse_csv_articles()
-        click.echo(f"✓ Loaded {len(csv_articles)} articles from CSV")
-
-        # Load and validate JSON data
-        json_projects = loader.parse_json_projects()
-        click.echo(f"✓ Loaded {len(json_projects)} projects from JSON")
+        loader = DataService(data_dir)
+        try:
+            # Load and validate CSV data
+            csv_stats = {}
+            csv_articles = loader.csv_pipeline(
+                stats=csv_stats, orders=False
+            ).run(loader.data_dir / 'orig.csv')
+            click.echo(f"✓ Loaded {len(csv_articles)} articles from CSV "
+                       f"({csv_stats['rows_rejected']} rejected)")
+
+            # Load and validate JSON data
+            with open(loader.data_dir / 'project.json', 'rb') as f:
+                json_orders = loader.json_pipeline().run(f)
+            click.echo(f"✓ Loaded {len(json_orders)} projects from JSON")
+        finally:
+            loader.shutdown()
 
         # Validate data consistency
         validation_report = loader.validate_data_consistency(csv_articles)
@@ -55,21 +82,65 @@ def validate(data_dir):
 
 
 @cli.command()
+@click.argument('sources', nargs=-1)
 @click.option('--data-dir', default='docs/data', help='Data directory path')
 @click.option('--output', default='processed_orders.json', help='Output file name')
-def process(data_dir, output):
-    """Process data and create picking orders."""
+@click.option('--workers', default=0, help='Processes parsing the files in parallel')
+def process(sources, data_dir, output, workers):
+    """Process data and create picking orders.
+
+    SOURCES are data files, glob patterns or zip/gzip archives relative
+    to the data directory; their projects are merged by project number.
+    Without SOURCES, the default project JSON file is processed.
+    """
     click.echo("Processing data...")
 
     try:
-        loader = DataLoader(data_dir)
-        projects = loader.parse_json_projects()
-        orders = loader.create_picking_orders(projects)
+        loader = DataService(data_dir, file_workers=workers)
+        try:
+            if sources:
+                parse_stats = {}
+
+                def parse(specs):
+                    yield loader.parse_sources(specs, stats=parse_stats)
+
+                pipeline = IngestionPipeline(
+                    'sources',
+                    [SourceStage('parse', parse), *loader.order_stages()],
+                )
+                orders = pipeline.run(sources)
+                click.echo(f"✓ Parsed {parse_stats['files']} files, "
+                           f"{parse_stats['articles_parsed']} articles "
+                           f"({parse_stats['rows_rejected']} rejected)")
+            else:
+                pipeline = loader.json_pipeline()
+                with open(loader.data_dir / 'project.json', 'rb') as f:
+                    orders = pipeline.run(f)
+
+            click.echo("\nPipeline stages:")
+            for stage in pipeline.summary()['stages']:
+                click.echo(f"  {stage['name']:<12} {stage['seconds']:>8.3f}s "
+                           f"{stage['rows_in']:>8} -> {stage['rows_out']:<8} rows "
+                           f"{stage['peak_memory_bytes'] / 2**20:>8.1f} MiB")
+        finally:
+            loader.shutdown()
+
+        manager = LogisticsService()
+
+        # Orders of the same project are merged
+        for order in orders:
+            manager.add_order(order)
 
         # Export processed data
-        loader.export_processed_data(orders, output)
-
-        click.echo(f"✓ Processed {len(orders)} orders")
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(
+                [order.model_dump(mode='json') for order in manager.orders],
+                f,
+                ensure_ascii=False,
+                indent=2,
+            )
+
+        click.echo(f"✓ Processed {len(manager.orders)} orders")
         click.echo(f"✓ Exported to {output}")
 
     except Exception as e:
@@ -84,16 +155,8 @@ def stats(data_dir):
     click.echo("Loading system data...")
 
     try:
-        # Initialize system
-        loader = DataLoader(data_dir)
-        manager = LogisticsManager()
-
         # Load data
-        projects = loader.parse_json_projects()
-        orders = loader.create_picking_orders(projects)
-
-        for order in orders:
-            manager.add_order(order)
+        manager = _load_manager(data_dir)
 
         # Add sample pickers and carts
         sample_pickers = [
@@ -108,8 +171,10 @@ def stats(data_dir):
             MaterialCart(cart_id="C003", capacity=1000.0)
         ]
 
-        manager.pickers.extend(sample_pickers)
-        manager.carts.extend(sample_carts)
+        for picker in sample_pickers:
+            manager.add_picker(picker)
+        for cart in sample_carts:
+            manager.add_cart(cart)
 
         # Get statistics
         stats = manager.get_system_overview()
@@ -139,16 +204,8 @@ def order_info(order_id, data_dir):
     click.echo(f"Loading order {order_id}...")
 
     try:
-        # Initialize system
-        loader = DataLoader(data_dir)
-        manager = LogisticsManager()
-
         # Load data
-        projects = loader.parse_json_projects()
-        orders = loader.create_picking_orders(projects)
-
-        for order in orders:
-            manager.add_order(order)
+        manager = _load_manager(data_dir)
 
         # Get order
         order = manager.get_order_by_id(order_id)
@@ -156,26 +213,27 @@ def order_info(order_id, data_dir):
             click.echo(f"✗ Order {order_id} not found", err=True)
             sys.exit(1)
 
-        # Generate report
-        report = manager.generate_picking_report(order_id)
-
-        click.echo(f"\nOrder Information:")
-        click.echo(f"  Order ID: {report['order_id']}")
-        click.echo(f"  Project: {report['project_number']}")
-        click.echo(f"  Status: {report['status']}")
-        click.echo(f"  Completion: {report['completion_percentage']:.1f}%")
-        click.echo(f"  Total Articles: {report['total_articles']}")
-        click.echo(f"  Completed Articles: {report['completed_articles']}")
-        click.echo(f"  Total Weight: {report['total_weight']:.2f} kg")
-        click.echo(f"  Assigned Picker: {report['assigned_picker'] or 'None'}")
-
-        click.echo(f"\nArticles:")
-        for article in report['articles']:
-            status_icon = "✓" if article['status'] == "Abgeschlossen" else "○"
-            click.echo(f"  {status_icon} {article['artikel']} - {article['bezeichnung']}")
-            click.echo(f"    Required: {article['required_quantity']}, "
-                      f"Picked: {article['picked_quantity']}, "
-                      f"Location: {article['location']}")
+        project = order.project
+        click.echo("\nOrder Information:")
+        click.echo(f"  Order ID: {order.order_id}")
+        click.echo(f"  Project: {project.projekt_nr}")
+        click.echo(f"  Status: {order.status.value}")
+        click.echo(f"  Completion: {order.completion_percentage:.1f}%")
+        click.echo(f"  Total Articles: {project.total_articles}")
+        click.echo(f"  Completed Articles: {project.completed_count}")
+        click.echo(f"  Total Weight: {project.total_weight:.2f} kg")
+        click.echo(f"  Assigned Picker: {order.assigned_picker or 'None'}")
+
+        click.echo("\nArticles:")
+        for article in project.articles:
+            status_icon = (
+                "✓" if article.status == StatusEnum.ABGESCHLOSSEN else "○"
+            )
+            click.echo(f"  {status_icon} {article.artikel} - "
+                       f"{article.artikel_bezeichnung}")
+            click.echo(f"    Required: {article.menge}, "
+                       f"Picked: {article.anzahl_auf_wagen or 0}, "
+                       f"Location: {article.lagerplatz}")
 
     except Exception as e:
         click.echo(f"✗ Failed to load order information: {e}", err=True)
@@ -190,16 +248,8 @@ def route(order_id, data_dir):
     click.echo(f"Calculating route for order {order_id}...")
 
     try:
-        # Initialize system
-        loader = DataLoader(data_dir)
-        manager = LogisticsManager()
-
         # Load data
-        projects = loader.parse_json_projects()
-        orders = loader.create_picking_orders(projects)
-
-        for order in orders:
-            manager.add_order(order)
+        manager = _load_manager(data_dir)
 
         # Get order
         order = manager.get_order_by_id(order_id)
@@ -226,29 +276,21 @@ def list_orders(data_dir):
     click.echo("Loading orders...")
 
     try:
-        # Initialize system
-        loader = DataLoader(data_dir)
-        manager = LogisticsManager()
-
         # Load data
-        projects = loader.parse_json_projects()
-        orders = loader.create_picking_orders(projects)
-
-        for order in orders:
-            manager.add_order(order)
+        manager = _load_manager(data_dir)
 
-        click.echo(f"\nOrders ({len(orders)} total):")
+        click.echo(f"\nOrders ({len(manager.orders)} total):")
         click.echo(f"{'Order ID':<20} {'Project':<10} {'Status':<15} "
-                  f"{'Articles':<8} {'Weight':<8} {'Priority':<8}")
+                   f"{'Articles':<8} {'Weight':<8} {'Priority':<8}")
         click.echo("-" * 80)
 
         for order in sorted(manager.orders, key=lambda x: x.order_id):
             status_icon = "✓" if order.status == StatusEnum.ABGESCHLOSSEN else "○"
             click.echo(f"{order.order_id:<20} {order.project.projekt_nr:<10} "
-                      f"{status_icon} {order.status.value:<13} "
-                      f"{len(order.project.articles):<8} "
-                      f"{order.project.total_weight:<7.1f} "
-                      f"{order.priority:<8}")
+                       f"{status_icon} {order.status.value:<13} "
+                       f"{len(order.project.articles):<8} "
+                       f"{order.project.total_weight:<7.1f} "
+                       f"{order.priority:<8}")
 
     except Exception as e:
         click.echo(f"✗ Failed to load orders: {e}", err=True)
@@ -263,10 +305,10 @@ def config():
     click.echo(f"  Version: {settings.app_version}")
     click.echo(f"  Host: {settings.host}")
     click.echo(f"  Port: {settings.port}")
-    click.echo(f"  Data Directory: {settings.data_directory}")
+    click.echo(f"  Data Directory: {settings.data_dir}")
     click.echo(f"  Log Level: {settings.log_level}")
     click.echo(f"  Debug Mode: {settings.debug}")
 
 
 if __name__ == '__main__':
-    cli()
\ No newline at end of file
+    cli()
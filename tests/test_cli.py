@@ -0,0 +1,75 @@
+"""
+Smoke tests for the command line interface.
+"""
+
+import json
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from cli import cli
+
+DATA_DIR = Path(__file__).parent.parent / "docs" / "data"
+
+
+class TestProcess:
+    """Test the process command."""
+
+    def test_process_default_json(self, tmp_path):
+        """Test processing the default project JSON file."""
+        output = tmp_path / "orders.json"
+        result = CliRunner().invoke(
+            cli, ["process", "--data-dir", str(DATA_DIR), "--output", str(output)]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "Pipeline stages:" in result.output
+        orders = json.loads(output.read_text(encoding="utf-8"))
+        assert len(orders) > 0
+        assert all(order["order_id"].startswith("ORDER-") for order in orders)
+
+    def test_process_sources(self, tmp_path):
+        """Test processing CSV and JSON sources merged by project number."""
+        output = tmp_path / "orders.json"
+        result = CliRunner().invoke(
+            cli,
+            [
+                "process", "orig.csv", "project.json",
+                "--data-dir", str(DATA_DIR),
+                "--output", str(output),
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "✓ Parsed 2 files" in result.output
+        orders = json.loads(output.read_text(encoding="utf-8"))
+        project_numbers = [order["project"]["projekt_nr"] for order in orders]
+        assert len(project_numbers) == len(set(project_numbers))
+
+
+class TestOrderCommands:
+    """Test the commands that load the default orders."""
+
+    def test_order_commands(self):
+        """Test validating, listing orders and showing one order."""
+        runner = CliRunner()
+        outputs = {}
+        for args in (
+            ["validate"],
+            ["stats"],
+            ["list-orders"],
+            ["order-info", "ORDER-054536"],
+            ["route", "ORDER-054536"],
+        ):
+            result = runner.invoke(cli, [*args, "--data-dir", str(DATA_DIR)])
+            assert result.exit_code == 0, result.output
+            outputs[args[0]] = result.output
+
+        assert "ORDER-054536" in outputs["list-orders"]
+        assert "Project: 054536" in outputs["order-info"]
+        assert "Optimized Picking Route" in outputs["route"]
+
+        result = runner.invoke(
+            cli, ["order-info", "ORDER-unknown", "--data-dir", str(DATA_DIR)]
+        )
+        assert result.exit_code == 1